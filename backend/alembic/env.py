@@ -15,7 +15,10 @@ from core.Base import Base
 from core.enums import SafeEnum
 from user.User import User
 from auth.RefreshToken import RefreshToken
+from video.Description import Description
 from video.VideoEntry import VideoEntry
+from video.VideoStats import VideoStats
+from video.VideoTombstone import VideoTombstone
 
 
 config = context.config
@@ -0,0 +1,26 @@
+"""add video_entries keyset indexes
+
+Revision ID: 3f9a1c7e2b40
+Revises: dd47e9ad5651
+Create Date: 2026-01-05 10:15:12.384211
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '3f9a1c7e2b40'
+down_revision: Union[str, None] = 'dd47e9ad5651'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_video_entries_user_created_id', 'video_entries', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_video_entries_user_platform_number_id', 'video_entries', ['user_id', 'platform', 'video_number', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_video_entries_user_platform_number_id', table_name='video_entries')
+    op.drop_index('ix_video_entries_user_created_id', table_name='video_entries')
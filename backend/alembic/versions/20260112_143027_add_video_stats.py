@@ -0,0 +1,49 @@
+"""add video_stats
+
+Revision ID: 8c2d5e0b7a14
+Revises: 3f9a1c7e2b40
+Create Date: 2026-01-12 14:30:27.905118
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '8c2d5e0b7a14'
+down_revision: Union[str, None] = '3f9a1c7e2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('video_stats',
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('platform', postgresql.ENUM('tiktok', 'instagram', 'youtube', name='platform', create_type=False), nullable=False),
+    sa.Column('entry_count', sa.Integer(), nullable=False),
+    sa.Column('max_video_number', sa.Integer(), nullable=False),
+    sa.Column('next_scheduled_time', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name=op.f('fk_video_stats_user_id_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'platform', name=op.f('pk_video_stats'))
+    )
+    op.create_index('ix_video_entries_user_platform_scheduled', 'video_entries', ['user_id', 'platform', 'scheduled_time'], unique=False)
+    op.execute(
+        """
+        INSERT INTO video_stats (
+            user_id, platform, entry_count, max_video_number,
+            next_scheduled_time, updated_at
+        )
+        SELECT user_id, platform, count(*), max(video_number),
+               min(scheduled_time) FILTER (WHERE scheduled_time >= now()),
+               now()
+        FROM video_entries
+        GROUP BY user_id, platform
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_video_entries_user_platform_scheduled', table_name='video_entries')
+    op.drop_table('video_stats')
@@ -0,0 +1,68 @@
+"""video number allocation counter
+
+Revision ID: b61e04f3d9a2
+Revises: 8c2d5e0b7a14
+Create Date: 2026-01-19 09:18:44.127630
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b61e04f3d9a2'
+down_revision: Union[str, None] = '8c2d5e0b7a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Older rows may share a number, keep the first and move the rest
+    # past the current maximum so the unique constraint can be built
+    op.execute(
+        """
+        WITH ranked AS (
+            SELECT id, user_id, platform,
+                   row_number() OVER (
+                       PARTITION BY user_id, platform, video_number
+                       ORDER BY created_at, id
+                   ) AS rn
+            FROM video_entries
+        ), renumbered AS (
+            SELECT r.id,
+                   s.max_video_number + row_number() OVER (
+                       PARTITION BY r.user_id, r.platform ORDER BY r.id
+                   ) AS video_number
+            FROM ranked r
+            JOIN video_stats s USING (user_id, platform)
+            WHERE r.rn > 1
+        )
+        UPDATE video_entries e
+        SET video_number = renumbered.video_number
+        FROM renumbered
+        WHERE e.id = renumbered.id
+        """
+    )
+    op.add_column('video_stats', sa.Column('last_video_number', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE video_stats s
+        SET max_video_number = agg.max_number,
+            last_video_number = agg.max_number
+        FROM (
+            SELECT user_id, platform, max(video_number) AS max_number
+            FROM video_entries
+            GROUP BY user_id, platform
+        ) agg
+        WHERE s.user_id = agg.user_id AND s.platform = agg.platform
+        """
+    )
+    op.alter_column('video_stats', 'last_video_number', server_default=None)
+    op.drop_index('ix_video_entries_user_platform_number_id', table_name='video_entries')
+    op.create_unique_constraint('uq_video_entries_user_platform_number', 'video_entries', ['user_id', 'platform', 'video_number'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_video_entries_user_platform_number', 'video_entries', type_='unique')
+    op.create_index('ix_video_entries_user_platform_number_id', 'video_entries', ['user_id', 'platform', 'video_number', 'id'], unique=False)
+    op.drop_column('video_stats', 'last_video_number')
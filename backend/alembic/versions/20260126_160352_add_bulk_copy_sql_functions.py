@@ -0,0 +1,69 @@
+"""add bulk copy sql functions
+
+Revision ID: 5d7f2a9c8e31
+Revises: b61e04f3d9a2
+Create Date: 2026-01-26 16:03:52.448019
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '5d7f2a9c8e31'
+down_revision: Union[str, None] = 'b61e04f3d9a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Time ordered UUID v7 so rows written by INSERT ... SELECT get the
+    # same kind of key as uuid6.uuid7() gives ORM inserts
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7()
+        RETURNS uuid
+        AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$
+        LANGUAGE SQL
+        VOLATILE
+        """
+    )
+    # Mirrors VideoEntryService._shorten_description
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION shorten_description(body text, max_length integer)
+        RETURNS text
+        AS $$
+            SELECT CASE
+                WHEN char_length(body) <= max_length THEN body
+                ELSE regexp_replace(left(body, max_length - 3), ' [^ ]*$', '') || '...'
+            END
+        $$
+        LANGUAGE SQL
+        IMMUTABLE
+        PARALLEL SAFE
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS shorten_description(text, integer)")
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
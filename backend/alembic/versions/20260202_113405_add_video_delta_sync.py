@@ -0,0 +1,44 @@
+"""add video delta sync
+
+Revision ID: 9e4b7c1d2a68
+Revises: 5d7f2a9c8e31
+Create Date: 2026-02-02 11:34:05.218734
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '9e4b7c1d2a68'
+down_revision: Union[str, None] = '5d7f2a9c8e31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('video_tombstones',
+    sa.Column('entry_id', sa.Uuid(), nullable=False),
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('platform', postgresql.ENUM('tiktok', 'instagram', 'youtube', name='platform', create_type=False), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name=op.f('fk_video_tombstones_user_id_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('entry_id', name=op.f('pk_video_tombstones'))
+    )
+    op.create_index('ix_video_tombstones_user_deleted', 'video_tombstones', ['user_id', 'deleted_at'], unique=False)
+    op.execute(
+        "UPDATE video_entries SET updated_at = created_at WHERE updated_at IS NULL"
+    )
+    op.alter_column('video_entries', 'updated_at',
+               existing_type=sa.DateTime(timezone=True),
+               nullable=False)
+    op.create_index('ix_video_entries_user_updated_id', 'video_entries', ['user_id', 'updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_video_entries_user_updated_id', table_name='video_entries')
+    op.alter_column('video_entries', 'updated_at',
+               existing_type=sa.DateTime(timezone=True),
+               nullable=True)
+    op.drop_table('video_tombstones')
@@ -0,0 +1,25 @@
+"""add video_stats version
+
+Revision ID: 2a8f6d3e9c15
+Revises: 9e4b7c1d2a68
+Create Date: 2026-02-09 15:47:22.604391
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '2a8f6d3e9c15'
+down_revision: Union[str, None] = '9e4b7c1d2a68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('video_stats', sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+    op.alter_column('video_stats', 'version', server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column('video_stats', 'version')
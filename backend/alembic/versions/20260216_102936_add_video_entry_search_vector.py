@@ -0,0 +1,27 @@
+"""add video entry search vector
+
+Revision ID: 7c3e1a5b9d24
+Revises: 2a8f6d3e9c15
+Create Date: 2026-02-16 10:29:36.771052
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '7c3e1a5b9d24'
+down_revision: Union[str, None] = '2a8f6d3e9c15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('video_entries', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("to_tsvector('english', coalesce(description, '') || ' ' || coalesce(youtube_description, ''))", persisted=True), nullable=True))
+    op.create_index('ix_video_entries_search_vector', 'video_entries', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_video_entries_search_vector', table_name='video_entries', postgresql_using='gin')
+    op.drop_column('video_entries', 'search_vector')
@@ -0,0 +1,26 @@
+"""add video description trigram index
+
+Revision ID: 4b9d2f7a1e63
+Revises: 7c3e1a5b9d24
+Create Date: 2026-02-23 14:05:18.340927
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '4b9d2f7a1e63'
+down_revision: Union[str, None] = '7c3e1a5b9d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.create_index('ix_video_entries_user_description_trgm', 'video_entries', ['user_id', 'description'], unique=False, postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_video_entries_user_description_trgm', table_name='video_entries', postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
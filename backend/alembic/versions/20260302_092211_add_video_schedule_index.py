@@ -0,0 +1,26 @@
+"""add video schedule index
+
+Revision ID: e5a7c2f8b041
+Revises: 4b9d2f7a1e63
+Create Date: 2026-03-02 09:22:11.518306
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e5a7c2f8b041'
+down_revision: Union[str, None] = '4b9d2f7a1e63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_video_entries_user_scheduled', 'video_entries', ['user_id', 'scheduled_time'], unique=False, postgresql_where=sa.text('scheduled_time IS NOT NULL'))
+    op.drop_index(op.f('ix_video_entries_scheduled_time'), table_name='video_entries')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_video_entries_scheduled_time'), 'video_entries', ['scheduled_time'], unique=False)
+    op.drop_index('ix_video_entries_user_scheduled', table_name='video_entries', postgresql_where=sa.text('scheduled_time IS NOT NULL'))
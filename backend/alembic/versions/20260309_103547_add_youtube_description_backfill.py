@@ -0,0 +1,70 @@
+"""add youtube description backfill
+
+Revision ID: c3f8a1d6b2e7
+Revises: e5a7c2f8b041
+Create Date: 2026-03-09 10:35:47.204118
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c3f8a1d6b2e7'
+down_revision: Union[str, None] = 'e5a7c2f8b041'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_video_entries_youtube_missing', 'video_entries', ['id'], unique=False, postgresql_where=sa.text("platform = 'youtube' AND youtube_description IS NULL"))
+    # Mirrors VideoEntryService._shorten_description
+    op.execute(
+        r"""
+        CREATE OR REPLACE FUNCTION shorten_description(body text, max_length integer)
+        RETURNS text
+        AS $$
+        DECLARE
+            cut_at integer := max_length - 3;
+            head text;
+        BEGIN
+            IF char_length(body) <= max_length THEN
+                RETURN body;
+            END IF;
+            WHILE cut_at > 0 AND (
+                substr(body, cut_at + 1, 1) ~ '[\u200d\ufe0e\ufe0f\u20e3\u0300-\u036f\U0001f3fb-\U0001f3ff\U000e0020-\U000e007f]'
+                OR substr(body, cut_at, 1) = chr(8205)
+            ) LOOP
+                cut_at := cut_at - 1;
+            END LOOP;
+            head := left(body, cut_at);
+            IF substr(body, cut_at + 1, 1) !~ '\s' THEN
+                head := regexp_replace(head, '\s+\S*$', '');
+            END IF;
+            RETURN regexp_replace(head, '[\s#@,;:.-]+$', '') || '...';
+        END
+        $$
+        LANGUAGE plpgsql
+        IMMUTABLE
+        PARALLEL SAFE
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION shorten_description(body text, max_length integer)
+        RETURNS text
+        AS $$
+            SELECT CASE
+                WHEN char_length(body) <= max_length THEN body
+                ELSE regexp_replace(left(body, max_length - 3), ' [^ ]*$', '') || '...'
+            END
+        $$
+        LANGUAGE SQL
+        IMMUTABLE
+        PARALLEL SAFE
+        """
+    )
+    op.drop_index('ix_video_entries_youtube_missing', table_name='video_entries', postgresql_where=sa.text("platform = 'youtube' AND youtube_description IS NULL"))
@@ -0,0 +1,83 @@
+"""add content addressed descriptions
+
+Revision ID: 7b2e9d4f1a63
+Revises: c3f8a1d6b2e7
+Create Date: 2026-03-16 09:41:22.583017
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '7b2e9d4f1a63'
+down_revision: Union[str, None] = 'c3f8a1d6b2e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('descriptions',
+    sa.Column('hash', sa.LargeBinary(length=32), nullable=False),
+    sa.Column('body', sa.Text(), nullable=False),
+    sa.Column('ref_count', sa.Integer(), nullable=False),
+    sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("to_tsvector('english', body)", persisted=True), nullable=True),
+    sa.PrimaryKeyConstraint('hash', name=op.f('pk_descriptions'))
+    )
+    op.create_index('ix_descriptions_body_trgm', 'descriptions', ['body'], unique=False, postgresql_using='gin', postgresql_ops={'body': 'gin_trgm_ops'})
+    op.create_index('ix_descriptions_search_vector', 'descriptions', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_descriptions_unreferenced', 'descriptions', ['hash'], unique=False, postgresql_where=sa.text('ref_count <= 0'))
+    op.execute(
+        """
+        INSERT INTO descriptions (hash, body, ref_count)
+        SELECT sha256(convert_to(description, 'UTF8')), description, count(*)
+        FROM video_entries
+        WHERE description <> ''
+        GROUP BY description
+        """
+    )
+
+    op.add_column('video_entries', sa.Column('description_hash', sa.LargeBinary(length=32), nullable=True))
+    op.execute(
+        """
+        UPDATE video_entries
+        SET description_hash = sha256(convert_to(description, 'UTF8'))
+        WHERE description <> ''
+        """
+    )
+    op.create_index(op.f('ix_video_entries_description_hash'), 'video_entries', ['description_hash'], unique=False)
+    op.create_foreign_key(op.f('fk_video_entries_description_hash_descriptions'), 'video_entries', 'descriptions', ['description_hash'], ['hash'])
+
+    op.drop_index('ix_video_entries_user_description_trgm', table_name='video_entries', postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+    op.drop_index('ix_video_entries_search_vector', table_name='video_entries', postgresql_using='gin')
+    op.drop_column('video_entries', 'search_vector')
+    op.drop_column('video_entries', 'description')
+    op.add_column('video_entries', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("to_tsvector('english', coalesce(youtube_description, ''))", persisted=True), nullable=True))
+    op.create_index('ix_video_entries_search_vector', 'video_entries', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_video_entries_search_vector', table_name='video_entries', postgresql_using='gin')
+    op.drop_column('video_entries', 'search_vector')
+    op.add_column('video_entries', sa.Column('description', sa.Text(), server_default='', nullable=False))
+    op.execute(
+        """
+        UPDATE video_entries AS e
+        SET description = d.body
+        FROM descriptions AS d
+        WHERE d.hash = e.description_hash
+        """
+    )
+    op.alter_column('video_entries', 'description', server_default=None)
+    op.add_column('video_entries', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("to_tsvector('english', coalesce(description, '') || ' ' || coalesce(youtube_description, ''))", persisted=True), nullable=True))
+    op.create_index('ix_video_entries_search_vector', 'video_entries', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_video_entries_user_description_trgm', 'video_entries', ['user_id', 'description'], unique=False, postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+
+    op.drop_constraint(op.f('fk_video_entries_description_hash_descriptions'), 'video_entries', type_='foreignkey')
+    op.drop_index(op.f('ix_video_entries_description_hash'), table_name='video_entries')
+    op.drop_column('video_entries', 'description_hash')
+    op.drop_index('ix_descriptions_unreferenced', table_name='descriptions', postgresql_where=sa.text('ref_count <= 0'))
+    op.drop_index('ix_descriptions_search_vector', table_name='descriptions', postgresql_using='gin')
+    op.drop_index('ix_descriptions_body_trgm', table_name='descriptions', postgresql_using='gin', postgresql_ops={'body': 'gin_trgm_ops'})
+    op.drop_table('descriptions')
@@ -0,0 +1,75 @@
+"""scope descriptions per user
+
+Revision ID: 4d9a7c2e8b15
+Revises: 7b2e9d4f1a63
+Create Date: 2026-03-23 10:18:46.204918
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '4d9a7c2e8b15'
+down_revision: Union[str, None] = '7b2e9d4f1a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint(op.f('fk_video_entries_description_hash_descriptions'), 'video_entries', type_='foreignkey')
+    op.drop_index(op.f('ix_video_entries_description_hash'), table_name='video_entries')
+    op.drop_index('ix_descriptions_unreferenced', table_name='descriptions', postgresql_where=sa.text('ref_count <= 0'))
+    op.drop_index('ix_descriptions_search_vector', table_name='descriptions', postgresql_using='gin')
+    op.drop_index('ix_descriptions_body_trgm', table_name='descriptions', postgresql_using='gin', postgresql_ops={'body': 'gin_trgm_ops'})
+    op.drop_constraint(op.f('pk_descriptions'), 'descriptions', type_='primary')
+
+    op.add_column('descriptions', sa.Column('user_id', sa.Uuid(), nullable=True))
+    op.execute(
+        """
+        INSERT INTO descriptions (user_id, hash, body, ref_count)
+        SELECT e.user_id, d.hash, d.body, count(*)
+        FROM video_entries AS e
+        JOIN descriptions AS d ON d.hash = e.description_hash
+        GROUP BY e.user_id, d.hash, d.body
+        """
+    )
+    op.execute("DELETE FROM descriptions WHERE user_id IS NULL")
+    op.alter_column('descriptions', 'user_id', nullable=False)
+    op.create_primary_key(op.f('pk_descriptions'), 'descriptions', ['user_id', 'hash'])
+    op.create_foreign_key(op.f('fk_descriptions_user_id_users'), 'descriptions', 'users', ['user_id'], ['id'], ondelete='CASCADE')
+    op.create_index('ix_descriptions_user_body_trgm', 'descriptions', ['user_id', 'body'], unique=False, postgresql_using='gin', postgresql_ops={'body': 'gin_trgm_ops'})
+    op.create_index('ix_descriptions_user_search_vector', 'descriptions', ['user_id', 'search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_descriptions_unreferenced', 'descriptions', ['user_id', 'hash'], unique=False, postgresql_where=sa.text('ref_count <= 0'))
+
+    op.create_index('ix_video_entries_user_description_hash', 'video_entries', ['user_id', 'description_hash'], unique=False)
+    op.create_foreign_key(op.f('fk_video_entries_user_id_descriptions'), 'video_entries', 'descriptions', ['user_id', 'description_hash'], ['user_id', 'hash'])
+
+
+def downgrade() -> None:
+    op.drop_constraint(op.f('fk_video_entries_user_id_descriptions'), 'video_entries', type_='foreignkey')
+    op.drop_index('ix_video_entries_user_description_hash', table_name='video_entries')
+    op.drop_index('ix_descriptions_unreferenced', table_name='descriptions', postgresql_where=sa.text('ref_count <= 0'))
+    op.drop_index('ix_descriptions_user_search_vector', table_name='descriptions', postgresql_using='gin')
+    op.drop_index('ix_descriptions_user_body_trgm', table_name='descriptions', postgresql_using='gin', postgresql_ops={'body': 'gin_trgm_ops'})
+    op.drop_constraint(op.f('fk_descriptions_user_id_users'), 'descriptions', type_='foreignkey')
+    op.drop_constraint(op.f('pk_descriptions'), 'descriptions', type_='primary')
+
+    op.alter_column('descriptions', 'user_id', nullable=True)
+    op.execute(
+        """
+        INSERT INTO descriptions (hash, body, ref_count)
+        SELECT hash, min(body), sum(ref_count)
+        FROM descriptions
+        GROUP BY hash
+        """
+    )
+    op.execute("DELETE FROM descriptions WHERE user_id IS NOT NULL")
+    op.drop_column('descriptions', 'user_id')
+    op.create_primary_key(op.f('pk_descriptions'), 'descriptions', ['hash'])
+    op.create_index('ix_descriptions_body_trgm', 'descriptions', ['body'], unique=False, postgresql_using='gin', postgresql_ops={'body': 'gin_trgm_ops'})
+    op.create_index('ix_descriptions_search_vector', 'descriptions', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_descriptions_unreferenced', 'descriptions', ['hash'], unique=False, postgresql_where=sa.text('ref_count <= 0'))
+
+    op.create_index(op.f('ix_video_entries_description_hash'), 'video_entries', ['description_hash'], unique=False)
+    op.create_foreign_key(op.f('fk_video_entries_description_hash_descriptions'), 'video_entries', 'descriptions', ['description_hash'], ['hash'])
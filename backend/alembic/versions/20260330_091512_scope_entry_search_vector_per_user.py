@@ -0,0 +1,25 @@
+"""scope entry search vector per user
+
+Revision ID: 9c1e5b7a3f28
+Revises: 4d9a7c2e8b15
+Create Date: 2026-03-30 09:15:12.730461
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '9c1e5b7a3f28'
+down_revision: Union[str, None] = '4d9a7c2e8b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_video_entries_search_vector', table_name='video_entries', postgresql_using='gin')
+    op.create_index('ix_video_entries_user_search_vector', 'video_entries', ['user_id', 'search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_video_entries_user_search_vector', table_name='video_entries', postgresql_using='gin')
+    op.create_index('ix_video_entries_search_vector', 'video_entries', ['search_vector'], unique=False, postgresql_using='gin')
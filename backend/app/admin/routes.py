@@ -14,15 +14,23 @@ from fastapi import (
 )
 
 from config import (
+    VIDEO_BACKFILL_MAX_ROWS,
     settings,
     UserRole,
 )
+from core.auth_cache import AuthUser, auth_user_cache
+from core.common_schemas import (
+    AuthCacheStatsResponse,
+    HashPoolStatsResponse,
+)
 from core.dependencies import RequireRole
+from core.hash_pool import hash_pool
 from core.responses import (
     AUTH_401,
     CONFLICT_409,
     FORBIDDEN_403,
     NOT_FOUND_404,
+    UNAVAILABLE_503,
 )
 from user.schemas import (
     AdminUserCreate,
@@ -30,13 +38,19 @@ from user.schemas import (
     UserResponse,
     UserUpdateAdmin,
 )
-from user.User import User
 from user.dependencies import UserServiceDep
+from video.schemas import (
+    DescriptionCollectResponse,
+    VideoBackfillResponse,
+    VideoStatsRebuildResponse,
+    VideoTombstonePruneResponse,
+)
+from video.dependencies import VideoServiceDep
 
 
 router = APIRouter(prefix = "/admin", tags = ["admin"])
 
-AdminOnly = Annotated[User, Depends(RequireRole(UserRole.ADMIN))]
+AdminOnly = Annotated[AuthUser, Depends(RequireRole(UserRole.ADMIN))]
 
 
 @router.get(
@@ -71,7 +85,8 @@ async def list_users(
     responses = {
         **AUTH_401,
         **FORBIDDEN_403,
-        **CONFLICT_409
+        **CONFLICT_409,
+        **UNAVAILABLE_503
     },
 )
 async def create_user(
@@ -145,3 +160,145 @@ async def delete_user(
     Delete user (admin only, hard delete)
     """
     await user_service.admin_delete_user(user_id)
+
+
+@router.post(
+    "/video-stats/rebuild",
+    response_model = VideoStatsRebuildResponse,
+    responses = {
+        **AUTH_401,
+        **FORBIDDEN_403
+    },
+)
+async def rebuild_video_stats(
+    video_service: VideoServiceDep,
+    _: AdminOnly,
+    user_id: UUID | None = Query(default = None),
+) -> VideoStatsRebuildResponse:
+    """
+    Recompute video stats from entries to repair drift (admin only)
+    """
+    rebuilt = await video_service.rebuild_stats(user_id)
+    return VideoStatsRebuildResponse(rebuilt = rebuilt)
+
+
+@router.post(
+    "/video-tombstones/prune",
+    response_model = VideoTombstonePruneResponse,
+    responses = {
+        **AUTH_401,
+        **FORBIDDEN_403
+    },
+)
+async def prune_video_tombstones(
+    video_service: VideoServiceDep,
+    _: AdminOnly,
+) -> VideoTombstonePruneResponse:
+    """
+    Delete sync tombstones past the retention window (admin only)
+    """
+    pruned = await video_service.prune_tombstones()
+    return VideoTombstonePruneResponse(pruned = pruned)
+
+
+@router.post(
+    "/descriptions/collect",
+    response_model = DescriptionCollectResponse,
+    responses = {
+        **AUTH_401,
+        **FORBIDDEN_403
+    },
+)
+async def collect_descriptions(
+    video_service: VideoServiceDep,
+    _: AdminOnly,
+    recount: bool = Query(default = False),
+) -> DescriptionCollectResponse:
+    """
+    Delete stored descriptions no entry references (admin only)
+
+    Pass recount=true to repair reference counts first
+    """
+    return await video_service.collect_descriptions(recount = recount)
+
+
+@router.post(
+    "/video-entries/youtube-descriptions/backfill",
+    response_model = VideoBackfillResponse,
+    responses = {
+        **AUTH_401,
+        **FORBIDDEN_403
+    },
+)
+async def backfill_youtube_descriptions(
+    video_service: VideoServiceDep,
+    _: AdminOnly,
+    user_id: UUID | None = Query(default = None),
+    cursor: str | None = Query(default = None),
+    limit: int = Query(
+        default = VIDEO_BACKFILL_MAX_ROWS,
+        ge = 1,
+        le = VIDEO_BACKFILL_MAX_ROWS,
+    ),
+) -> VideoBackfillResponse:
+    """
+    Shorten descriptions into youtube_description for YouTube entries
+    missing one (admin only)
+
+    Handles up to limit entries per call, keep passing next_cursor back
+    as cursor until it comes back empty
+    """
+    return await video_service.backfill_youtube_descriptions(
+        user_id = user_id,
+        cursor = cursor,
+        limit = limit,
+    )
+
+
+@router.get(
+    "/auth-cache",
+    response_model = AuthCacheStatsResponse,
+    responses = {
+        **AUTH_401,
+        **FORBIDDEN_403
+    },
+)
+async def get_auth_cache_stats(_: AdminOnly) -> AuthCacheStatsResponse:
+    """
+    Hit, miss and eviction counters of the authenticated user cache in
+    the worker serving the request (admin only)
+    """
+    return AuthCacheStatsResponse(
+        size = len(auth_user_cache),
+        hits = auth_user_cache.hits,
+        misses = auth_user_cache.misses,
+        evictions = auth_user_cache.evictions,
+    )
+
+
+@router.get(
+    "/hash-pool",
+    response_model = HashPoolStatsResponse,
+    responses = {
+        **AUTH_401,
+        **FORBIDDEN_403
+    },
+)
+async def get_hash_pool_stats(_: AdminOnly) -> HashPoolStatsResponse:
+    """
+    Queue depth, wait and hash timings of the password hash pool in the
+    worker serving the request (admin only)
+    """
+    completed = max(hash_pool.completed, 1)
+    return HashPoolStatsResponse(
+        workers = hash_pool.workers,
+        queue_size = hash_pool.queue_size,
+        in_flight = hash_pool.in_flight,
+        queue_depth = hash_pool.queue_depth,
+        completed = hash_pool.completed,
+        rejected = hash_pool.rejected,
+        avg_wait_ms = hash_pool.wait_seconds / completed * 1000,
+        max_wait_ms = hash_pool.max_wait_seconds * 1000,
+        avg_hash_ms = hash_pool.hash_seconds / completed * 1000,
+        max_hash_ms = hash_pool.max_hash_seconds * 1000,
+    )
@@ -3,14 +3,24 @@
 repository.py
 """
 
+from typing import Any
 from uuid import UUID
 from datetime import UTC, datetime
 
-from sqlalchemy import select, update
+import uuid6
+from sqlalchemy import (
+    Row,
+    exists,
+    insert,
+    literal,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .RefreshToken import RefreshToken
-from core.base_repository import BaseRepository
+from core.base_repository import BaseRepository, dialect_name
+from user.User import User
 
 
 class RefreshTokenRepository(BaseRepository[RefreshToken]):
@@ -26,12 +36,12 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         token_hash: str,
     ) -> RefreshToken | None:
         """
-        Get refresh token by its hash
+        Get refresh token by its hash, always reloading the row
         """
         result = await session.execute(
             select(RefreshToken).where(
                 RefreshToken.token_hash == token_hash
-            )
+            ).execution_options(populate_existing = True)
         )
         return result.scalars().first()
 
@@ -79,7 +89,6 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         )
         session.add(token)
         await session.flush()
-        await session.refresh(token)
         return token
 
     @classmethod
@@ -93,9 +102,91 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         """
         token.revoke()
         await session.flush()
-        await session.refresh(token)
         return token
 
+    @classmethod
+    async def rotate(
+        cls,
+        session: AsyncSession,
+        token_hash: str,
+        new_hash: str,
+        expires_at: datetime,
+        device_id: str | None = None,
+        device_name: str | None = None,
+        ip_address: str | None = None,
+    ) -> Row[Any] | None:
+        """
+        Revoke a valid token and insert its successor in the same family
+        """
+        now = datetime.now(UTC)
+        tokens = RefreshToken.__table__
+        revoke = update(tokens).where(
+            tokens.c.token_hash == token_hash,
+            tokens.c.is_revoked == False,
+            tokens.c.expires_at > now,
+            exists().where(
+                User.id == tokens.c.user_id,
+                User.is_active == True,
+            ),
+        ).values(
+            is_revoked = True,
+            revoked_at = now,
+            updated_at = now,
+        ).returning(
+            tokens.c.user_id,
+            tokens.c.family_id,
+            select(User.token_version).where(
+                User.id == tokens.c.user_id
+            ).scalar_subquery().label("token_version"),
+        )
+        successor = {
+            "id": uuid6.uuid7(),
+            "token_hash": new_hash,
+            "expires_at": expires_at,
+            "device_id": device_id,
+            "device_name": device_name,
+            "ip_address": ip_address,
+            "is_revoked": False,
+            "created_at": now,
+        }
+
+        if dialect_name(session) == "sqlite":
+            rotated = (await session.execute(revoke)).first()
+            if rotated is not None:
+                await session.execute(
+                    insert(tokens).values(
+                        **successor,
+                        user_id = rotated.user_id,
+                        family_id = rotated.family_id,
+                    )
+                )
+            return rotated
+
+        revoked = revoke.cte("revoked")
+        inserted = insert(tokens).from_select(
+            [*successor, "user_id", "family_id"],
+            select(
+                *(
+                    literal(value, tokens.c[name].type)
+                    for name, value in successor.items()
+                ),
+                revoked.c.user_id,
+                revoked.c.family_id,
+            ),
+        ).returning(tokens.c.family_id).cte("inserted")
+        result = await session.execute(
+            select(
+                revoked.c.user_id,
+                revoked.c.family_id,
+                revoked.c.token_version,
+            ).join_from(
+                revoked,
+                inserted,
+                inserted.c.family_id == revoked.c.family_id,
+            )
+        )
+        return result.first()
+
     @classmethod
     async def revoke_family(
         cls,
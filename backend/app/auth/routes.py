@@ -19,8 +19,8 @@ from fastapi.security import (
 
 from config import settings
 from core.dependencies import (
+    AuthenticatedUser,
     ClientIP,
-    CurrentUser,
 )
 from core.security import (
     clear_refresh_cookie,
@@ -36,7 +36,7 @@ from .schemas import (
 from user.schemas import UserResponse
 from .dependencies import AuthServiceDep
 from user.dependencies import UserServiceDep
-from core.responses import AUTH_401
+from core.responses import AUTH_401, UNAVAILABLE_503
 
 
 router = APIRouter(prefix = "/auth", tags = ["auth"])
@@ -45,7 +45,10 @@ router = APIRouter(prefix = "/auth", tags = ["auth"])
 @router.post(
     "/login",
     response_model = TokenWithUserResponse,
-    responses = {**AUTH_401}
+    responses = {
+        **AUTH_401,
+        **UNAVAILABLE_503
+    }
 )
 @limiter.limit(settings.RATE_LIMIT_AUTH)
 async def login(
@@ -115,40 +118,49 @@ async def logout(
 async def logout_all(
     response: Response,
     auth_service: AuthServiceDep,
-    current_user: CurrentUser,
+    current_user: AuthenticatedUser,
 ) -> dict[str,
           int]:
     """
     Logout from all devices
     """
-    count = await auth_service.logout_all(current_user)
+    count = await auth_service.logout_all(current_user.id)
     clear_refresh_cookie(response)
     return {"revoked_sessions": count}
 
 
 @router.get("/me", response_model = UserResponse, responses = {**AUTH_401})
-async def get_current_user(current_user: CurrentUser) -> UserResponse:
+async def get_current_user(
+    user_service: UserServiceDep,
+    current_user: AuthenticatedUser,
+) -> UserResponse:
     """
     Get current authenticated user
+
+    Authentication never needs the users row, only the profile returned
+    here is read
     """
-    return UserResponse.model_validate(current_user)
+    return await user_service.get_user_by_id(current_user.id)
 
 
 @router.post(
     "/change-password",
     status_code = status.HTTP_204_NO_CONTENT,
-    responses = {**AUTH_401}
+    responses = {
+        **AUTH_401,
+        **UNAVAILABLE_503
+    }
 )
 async def change_password(
     user_service: UserServiceDep,
-    current_user: CurrentUser,
+    current_user: AuthenticatedUser,
     data: PasswordChange,
 ) -> None:
     """
     Change current user password
     """
     await user_service.change_password(
-        current_user,
+        current_user.id,
         data.current_password,
         data.new_password,
     )
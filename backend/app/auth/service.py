@@ -3,6 +3,8 @@
 service.py
 """
 
+from uuid import UUID
+
 import uuid6
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -72,7 +74,7 @@ class AuthService:
         access_token = create_access_token(user.id, user.token_version)
 
         family_id = uuid6.uuid7()
-        raw_refresh, token_hash, expires_at = create_refresh_token(user.id, family_id)
+        raw_refresh, token_hash, expires_at = create_refresh_token()
 
         await RefreshTokenRepository.create_token(
             self.session,
@@ -123,54 +125,47 @@ class AuthService:
         """
         Refresh access token using refresh token
 
-        Implements token rotation with replay attack detection
+        Implements token rotation with replay attack detection. A valid
+        token is rotated in one statement, the stored token is only read
+        back when rotation matched nothing to tell replay from expiry
         """
         token_hash = hash_token(refresh_token)
-        stored_token = await RefreshTokenRepository.get_by_hash(
+        new_raw_token, new_hash, expires_at = create_refresh_token()
+
+        rotated = await RefreshTokenRepository.rotate(
             self.session,
-            token_hash
+            token_hash = token_hash,
+            new_hash = new_hash,
+            expires_at = expires_at,
+            device_id = device_id,
+            device_name = device_name,
+            ip_address = ip_address,
         )
 
-        if stored_token is None:
-            raise TokenError(message = "Invalid refresh token")
-
-        if stored_token.is_revoked:
-            await RefreshTokenRepository.revoke_family(
+        if rotated is None:
+            stored_token = await RefreshTokenRepository.get_by_hash(
                 self.session,
-                stored_token.family_id
+                token_hash
             )
-            raise TokenRevokedError()
 
-        if stored_token.is_expired:
-            raise TokenError(message = "Refresh token expired")
-
-        user = await UserRepository.get_by_id(
-            self.session,
-            stored_token.user_id
-        )
-        if user is None or not user.is_active:
-            raise TokenError(message = "User not found or inactive")
+            if stored_token is None:
+                raise TokenError(message = "Invalid refresh token")
 
-        await RefreshTokenRepository.revoke_token(
-            self.session,
-            stored_token
-        )
+            if stored_token.is_revoked:
+                await RefreshTokenRepository.revoke_family(
+                    self.session,
+                    stored_token.family_id
+                )
+                raise TokenRevokedError()
 
-        access_token = create_access_token(user.id, user.token_version)
+            if stored_token.is_expired:
+                raise TokenError(message = "Refresh token expired")
 
-        new_raw_token, new_hash, expires_at = create_refresh_token(
-            user.id, stored_token.family_id
-        )
+            raise TokenError(message = "User not found or inactive")
 
-        await RefreshTokenRepository.create_token(
-            self.session,
-            user_id = user.id,
-            token_hash = new_hash,
-            family_id = stored_token.family_id,
-            expires_at = expires_at,
-            device_id = device_id,
-            device_name = device_name,
-            ip_address = ip_address,
+        access_token = create_access_token(
+            rotated.user_id,
+            rotated.token_version
         )
 
         return TokenResponse(access_token = access_token), new_raw_token
@@ -198,15 +193,15 @@ class AuthService:
 
     async def logout_all(
         self,
-        user: User,
+        user_id: UUID,
     ) -> int:
         """
         Logout from all devices
 
         Returns count of revoked sessions
         """
-        await UserRepository.increment_token_version(self.session, user)
+        await UserRepository.increment_token_version(self.session, user_id)
         return await RefreshTokenRepository.revoke_all_user_tokens(
             self.session,
-            user.id
+            user_id
         )
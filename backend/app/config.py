@@ -32,12 +32,27 @@ from core.constants import (
     PASSWORD_MAX_LENGTH,
     PASSWORD_MIN_LENGTH,
     TOKEN_HASH_LENGTH,
+    VERIFIED_TOKEN_CACHE_SIZE,
+    VIDEO_BACKFILL_BATCH_SIZE,
+    VIDEO_BACKFILL_MAX_ROWS,
+    VIDEO_BATCH_MAX_ITEMS,
+    VIDEO_DUPLICATE_MAX_MATCHES,
+    VIDEO_DUPLICATE_MIN_SCORE,
+    VIDEO_EXPORT_BATCH_SIZE,
+    VIDEO_IMPORT_BATCH_SIZE,
+    VIDEO_IMPORT_MAX_ERRORS,
+    VIDEO_SCHEDULE_MAX_DAYS,
+    VIDEO_SCHEDULE_MAX_ENTRIES,
+    VIDEO_SIMILAR_MIN_SCORE,
 )
 from core.enums import (
+    BatchItemStatus,
     Environment,
+    ExportFormat,
     HealthStatus,
     Platform,
     SafeEnum,
+    ScheduleInterval,
     TokenType,
     UserRole,
 )
@@ -55,10 +70,25 @@ __all__ = [
     "PASSWORD_MAX_LENGTH",
     "PASSWORD_MIN_LENGTH",
     "TOKEN_HASH_LENGTH",
+    "VERIFIED_TOKEN_CACHE_SIZE",
+    "VIDEO_BACKFILL_BATCH_SIZE",
+    "VIDEO_BACKFILL_MAX_ROWS",
+    "VIDEO_BATCH_MAX_ITEMS",
+    "VIDEO_DUPLICATE_MAX_MATCHES",
+    "VIDEO_DUPLICATE_MIN_SCORE",
+    "VIDEO_EXPORT_BATCH_SIZE",
+    "VIDEO_IMPORT_BATCH_SIZE",
+    "VIDEO_IMPORT_MAX_ERRORS",
+    "VIDEO_SCHEDULE_MAX_DAYS",
+    "VIDEO_SCHEDULE_MAX_ENTRIES",
+    "VIDEO_SIMILAR_MIN_SCORE",
+    "BatchItemStatus",
     "Environment",
+    "ExportFormat",
     "HealthStatus",
     "Platform",
     "SafeEnum",
+    "ScheduleInterval",
     "Settings",
     "TokenType",
     "UserRole",
@@ -108,6 +138,14 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default = 15, ge = 5, le = 60)
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default = 7, ge = 1, le = 30)
 
+    AUTH_USER_CACHE_TTL_SECONDS: float = Field(default = 30, ge = 0)
+    AUTH_USER_CACHE_MAX_SIZE: int = Field(default = 10000, ge = 1)
+    AUTH_STATELESS: bool = False
+    AUTH_STATELESS_SINGLE_WORKER: bool = False
+
+    PASSWORD_HASH_WORKERS: int = Field(default = 4, ge = 1)
+    PASSWORD_HASH_QUEUE_SIZE: int = Field(default = 64, ge = 0)
+
     ADMIN_EMAIL: EmailStr | None = None
 
     REDIS_URL: RedisDsn | None = None
@@ -134,6 +172,9 @@ class Settings(BaseSettings):
     PAGINATION_DEFAULT_SIZE: int = Field(default = 20, ge = 1, le = 100)
     PAGINATION_MAX_SIZE: int = Field(default = 100, ge = 1, le = 500)
 
+    VIDEO_TOMBSTONE_RETENTION_DAYS: int = Field(default = 30, ge = 1)
+    VIDEO_SYNC_OVERLAP_SECONDS: int = Field(default = 300, ge = 0)
+
     LOG_LEVEL: Literal["DEBUG",
                        "INFO",
                        "WARNING",
@@ -155,6 +196,23 @@ class Settings(BaseSettings):
                 )
         return self
 
+    @model_validator(mode = "after")
+    def validate_stateless_auth(self) -> "Settings":
+        """
+        Stateless auth needs a token state map every worker shares
+
+        Without REDIS_URL each worker would keep its own map and accept
+        tokens another worker already revoked, the in process map is only
+        allowed when AUTH_STATELESS_SINGLE_WORKER says there is one worker
+        """
+        if (self.AUTH_STATELESS and self.REDIS_URL is None
+                and not self.AUTH_STATELESS_SINGLE_WORKER):
+            raise ValueError(
+                "AUTH_STATELESS requires REDIS_URL, or "
+                "AUTH_STATELESS_SINGLE_WORKER for a single worker"
+            )
+        return self
+
 
 @lru_cache
 def get_settings() -> Settings:
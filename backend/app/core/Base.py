@@ -34,6 +34,7 @@ class Base(AsyncAttrs, DeclarativeBase):
     Base class for all SQLAlchemy models
     """
     metadata = MetaData(naming_convention = NAMING_CONVENTION)
+    __mapper_args__ = {"eager_defaults": False}
 
 
 class UUIDMixin:
@@ -61,7 +62,6 @@ class TimestampMixin:
         DateTime(timezone = True),
         default = None,
         onupdate = lambda: datetime.now(UTC),
-        server_onupdate = func.now(),
     )
 
 
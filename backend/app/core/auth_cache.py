@@ -0,0 +1,114 @@
+"""
+ⒸAngelaMos | 2025
+auth_cache.py
+"""
+
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings, UserRole
+
+
+class AuthUser(NamedTuple):
+    """
+    The user fields access token checks need, cached instead of the row
+    """
+    id: UUID
+    role: UserRole
+    is_active: bool
+    token_version: int
+
+
+class AuthUserCache:
+    """
+    Per worker TTL and LRU cache of AuthUser keyed by (user_id, token_version)
+
+    Each user holds one slot tagged with its token_version, a token
+    carrying any other version misses and goes to the database. Writes
+    that touch auth fields invalidate the user in this worker, other
+    workers pick the change up once the entry expires. The epoch moves
+    on every invalidation so a lookup that raced one never stores what it
+    read
+    """
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[UUID, tuple[float, AuthUser]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, user_id: UUID, token_version: int) -> AuthUser | None:
+        """
+        Cached user for a token, None when missing, stale or expired
+        """
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            expires_at, user = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+            elif user.token_version == token_version:
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return user
+        self.misses += 1
+        return None
+
+    def put(self, user: AuthUser, epoch: int) -> None:
+        """
+        Store a user read from the database while the epoch was epoch
+        """
+        if self.ttl <= 0 or epoch != self.epoch:
+            return
+        self._entries[user.id] = (time.monotonic() + self.ttl, user)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last = False)
+            self.evictions += 1
+
+    def invalidate(self, user_id: UUID) -> None:
+        """
+        Drop a user from the cache
+        """
+        self.epoch += 1
+        self._entries.pop(user_id, None)
+
+    def invalidate_on_commit(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+    ) -> None:
+        """
+        Drop a user now and again once the session commits, so lookups
+        that read the row before the commit cannot keep the old values
+        """
+        self.invalidate(user_id)
+        event.listen(
+            session.sync_session,
+            "after_commit",
+            lambda _: self.invalidate(user_id),
+            once = True,
+        )
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the counters
+        """
+        self.epoch += 1
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+auth_user_cache = AuthUserCache(
+    max_size = settings.AUTH_USER_CACHE_MAX_SIZE,
+    ttl = settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
@@ -11,7 +11,16 @@ from typing import (
 )
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    ColumnElement,
+    Uuid,
+    any_,
+    func,
+    literal,
+    select,
+    type_coerce,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .Base import Base
@@ -20,6 +29,22 @@ from .Base import Base
 ModelT = TypeVar("ModelT", bound = Base)
 
 
+def dialect_name(session: AsyncSession) -> str:
+    """
+    Name of the SQL dialect the session is bound to
+    """
+    return session.get_bind().dialect.name
+
+
+def server_uuid7(session: AsyncSession) -> ColumnElement[UUID]:
+    """
+    SQL expression generating a primary key in set based statements
+    """
+    if dialect_name(session) == "sqlite":
+        return type_coerce(func.lower(func.hex(func.randomblob(16))), Uuid)
+    return type_coerce(func.uuid_generate_v7(), Uuid)
+
+
 class BaseRepository(Generic[ModelT]):
     """
     Generic repository with common CRUD operations
@@ -62,6 +87,34 @@ class BaseRepository(Generic[ModelT]):
         )
         return result.scalar_one()
 
+    @classmethod
+    def id_in(
+        cls,
+        session: AsyncSession,
+        ids: Sequence[UUID],
+    ) -> ColumnElement[bool]:
+        """
+        Match a list of primary keys
+        """
+        if dialect_name(session) == "sqlite":
+            return cls.model.id.in_(ids)
+        return cls.model.id == any_(
+            literal(list(ids),
+                    postgresql.ARRAY(Uuid))
+        )
+
+    @classmethod
+    def upsert(
+        cls,
+        session: AsyncSession,
+    ) -> postgresql.Insert | sqlite.Insert:
+        """
+        Dialect specific INSERT supporting ON CONFLICT clauses
+        """
+        if dialect_name(session) == "sqlite":
+            return sqlite.insert(cls.model)
+        return postgresql.insert(cls.model)
+
     @classmethod
     async def create(
         cls,
@@ -74,7 +127,6 @@ class BaseRepository(Generic[ModelT]):
         instance = cls.model(**kwargs)
         session.add(instance)
         await session.flush()
-        await session.refresh(instance)
         return instance
 
     @classmethod
@@ -90,7 +142,6 @@ class BaseRepository(Generic[ModelT]):
         for key, value in kwargs.items():
             setattr(instance, key, value)
         await session.flush()
-        await session.refresh(instance)
         return instance
 
     @classmethod
@@ -24,6 +24,32 @@ class HealthDetailedResponse(HealthResponse):
     redis: HealthStatus | None = None
 
 
+class AuthCacheStatsResponse(BaseSchema):
+    """
+    Authenticated user cache counters for this worker
+    """
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class HashPoolStatsResponse(BaseSchema):
+    """
+    Password hash pool load and timings for this worker
+    """
+    workers: int
+    queue_size: int
+    in_flight: int
+    queue_depth: int
+    completed: int
+    rejected: int
+    avg_wait_ms: float
+    max_wait_ms: float
+    avg_hash_ms: float
+    max_hash_ms: float
+
+
 class AppInfoResponse(BaseSchema):
     """
     Root endpoint response with API information
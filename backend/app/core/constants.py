@@ -13,6 +13,19 @@ TOKEN_HASH_LENGTH = 64
 DEVICE_ID_MAX_LENGTH = 255
 DEVICE_NAME_MAX_LENGTH = 100
 IP_ADDRESS_MAX_LENGTH = 45
+VERIFIED_TOKEN_CACHE_SIZE = 4096
+
+VIDEO_BATCH_MAX_ITEMS = 500
+VIDEO_SIMILAR_MIN_SCORE = 0.3
+VIDEO_DUPLICATE_MIN_SCORE = 0.8
+VIDEO_DUPLICATE_MAX_MATCHES = 3
+VIDEO_SCHEDULE_MAX_DAYS = 366
+VIDEO_SCHEDULE_MAX_ENTRIES = 500
+VIDEO_EXPORT_BATCH_SIZE = 1000
+VIDEO_IMPORT_BATCH_SIZE = 2000
+VIDEO_IMPORT_MAX_ERRORS = 1000
+VIDEO_BACKFILL_BATCH_SIZE = 500
+VIDEO_BACKFILL_MAX_ROWS = 10000
 
 API_VERSION = "v1"
 API_PREFIX = f"/{API_VERSION}"
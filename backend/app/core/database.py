@@ -9,7 +9,8 @@ from collections.abc import (
     Iterator,
 )
 
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.ext.asyncio import (
@@ -19,11 +20,47 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import (
+    ORMExecuteState,
+    Session,
+    UOWTransaction,
+    sessionmaker,
+)
 
 from config import settings
 
 
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
+
+class WriteTrackingSession(Session):
+    """
+    Session that notes in info["writes"] whether it sent anything other
+    than a SELECT, so a request that only read can skip its COMMIT
+    """
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _track_statement(state: ORMExecuteState) -> None:
+    if not state.is_select:
+        state.session.info["writes"] = True
+
+
+@event.listens_for(WriteTrackingSession, "after_flush")
+def _track_flush(session: Session, _: UOWTransaction) -> None:
+    session.info["writes"] = True
+
+
+def has_writes(session: AsyncSession) -> bool:
+    """
+    Whether the session wrote anything or still holds unflushed changes
+    """
+    return bool(
+        session.info.get("writes") or session.new or session.dirty
+        or session.deleted
+    )
+
+
 class DatabaseSessionManager:
     """
     Manages database connections and sessions for both sync and async contexts
@@ -33,6 +70,8 @@ class DatabaseSessionManager:
         self._sync_engine: Engine | None = None
         self._async_sessionmaker: async_sessionmaker[AsyncSession
                                                      ] | None = None
+        self._read_only_sessionmaker: async_sessionmaker[AsyncSession
+                                                         ] | None = None
         self._sync_sessionmaker: sessionmaker[Session] | None = None
 
     def init(self, database_url: str) -> None:
@@ -54,6 +93,17 @@ class DatabaseSessionManager:
         self._async_sessionmaker = async_sessionmaker(
             bind = self._async_engine,
             class_ = AsyncSession,
+            sync_session_class = WriteTrackingSession,
+            autocommit = False,
+            autoflush = False,
+            expire_on_commit = False,
+        )
+        self._read_only_sessionmaker = async_sessionmaker(
+            bind = self._async_engine.execution_options(
+                postgresql_readonly = True
+            ),
+            class_ = AsyncSession,
+            sync_session_class = WriteTrackingSession,
             autocommit = False,
             autoflush = False,
             expire_on_commit = False,
@@ -84,6 +134,7 @@ class DatabaseSessionManager:
             await self._async_engine.dispose()
             self._async_engine = None
             self._async_sessionmaker = None
+            self._read_only_sessionmaker = None
 
         if self._sync_engine:
             self._sync_engine.dispose()
@@ -91,19 +142,29 @@ class DatabaseSessionManager:
             self._sync_sessionmaker = None
 
     @contextlib.asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
+    async def session(
+        self,
+        read_only: bool = False,
+    ) -> AsyncIterator[AsyncSession]:
         """
         Async context manager for database sessions
 
-        Handles commit on success, rollback on exception
+        Handles commit on success, rollback on exception, a session that
+        never wrote skips the COMMIT
         """
-        if self._async_sessionmaker is None:
+        if (self._async_sessionmaker is None
+                or self._read_only_sessionmaker is None):
             raise RuntimeError("DatabaseSessionManager is not initialized")
 
-        session = self._async_sessionmaker()
+        factory = (
+            self._read_only_sessionmaker
+            if read_only else self._async_sessionmaker
+        )
+        session = factory()
         try:
             yield session
-            await session.commit()
+            if has_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -152,9 +213,24 @@ class DatabaseSessionManager:
 sessionmanager = DatabaseSessionManager()
 
 
-async def get_db_session() -> AsyncIterator[AsyncSession]:
+async def get_db_session(request: Request) -> AsyncIterator[AsyncSession]:
     """
     FastAPI dependency for database sessions
+
+    GET and HEAD requests get a read only transaction unless the route
+    opted out with allow_db_writes
     """
-    async with sessionmanager.session() as session:
+    read_only = (
+        request.method in READ_ONLY_METHODS
+        and not getattr(request.state, "db_writes", False)
+    )
+    async with sessionmanager.session(read_only = read_only) as session:
         yield session
+
+
+def allow_db_writes(request: Request) -> None:
+    """
+    Route dependency for GET routes that write, keeps their transaction
+    read write
+    """
+    request.state.db_writes = True
@@ -5,19 +5,24 @@ dependencies.py
 
 from __future__ import annotations
 
+from contextlib import suppress
 from typing import Annotated
 from uuid import UUID
 
 import jwt
 from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import (
     API_PREFIX,
+    settings,
     TokenType,
     UserRole,
 )
+from .auth_cache import AuthUser, auth_user_cache
+from .token_state import TokenState, token_state_map
 from .database import get_db_session
 from .exceptions import (
     InactiveUser,
@@ -27,7 +32,7 @@ from .exceptions import (
     UserNotFound,
 )
 from user.User import User
-from .security import decode_access_token
+from .security import request_token_claims
 from user.repository import UserRepository
 
 
@@ -45,6 +50,7 @@ DBSession = Annotated[AsyncSession, Depends(get_db_session)]
 
 
 async def get_current_user(
+    request: Request,
     token: Annotated[str,
                      Depends(oauth2_scheme)],
     db: DBSession,
@@ -53,7 +59,7 @@ async def get_current_user(
     Validate access token and return current user
     """
     try:
-        payload = decode_access_token(token)
+        payload = request_token_claims(request, token)
     except jwt.InvalidTokenError as e:
         raise TokenError(message = str(e)) from e
 
@@ -72,6 +78,84 @@ async def get_current_user(
     return user
 
 
+async def get_auth_user(
+    request: Request,
+    token: Annotated[str,
+                     Depends(oauth2_scheme)],
+    db: DBSession,
+) -> AuthUser:
+    """
+    Validate access token and return the cached auth fields of its user
+
+    Only a cache miss reads the users row, hot endpoints that just need
+    the caller's id and role skip the database entirely. With
+    AUTH_STATELESS the per worker cache is replaced by the shared token
+    state map, which every worker sees revocations in immediately
+    """
+    try:
+        payload = request_token_claims(request, token)
+    except jwt.InvalidTokenError as e:
+        raise TokenError(message = str(e)) from e
+
+    if payload.get("type") != TokenType.ACCESS.value:
+        raise TokenError(message = "Invalid token type")
+
+    user_id = UUID(payload["sub"])
+    token_version = payload.get("token_version")
+    if settings.AUTH_STATELESS:
+        try:
+            state = await token_state_map.get(user_id)
+        except RedisError:
+            state = None
+        if state is not None:
+            if token_version != state.token_version:
+                raise TokenRevokedError()
+            return AuthUser(
+                id = user_id,
+                role = state.role,
+                is_active = state.is_active,
+                token_version = state.token_version,
+            )
+    else:
+        cached = auth_user_cache.get(user_id, token_version)
+        if cached is not None:
+            return cached
+
+    epoch = auth_user_cache.epoch
+    user = await UserRepository.get_by_id(db, user_id)
+
+    if user is None:
+        raise UserNotFound(identifier = str(user_id))
+
+    if token_version != user.token_version:
+        raise TokenRevokedError()
+
+    auth_user = AuthUser(
+        id = user.id,
+        role = user.role,
+        is_active = user.is_active,
+        token_version = user.token_version,
+    )
+    if settings.AUTH_STATELESS:
+        with suppress(RedisError):
+            await token_state_map.set_if_missing(user_id, TokenState.of(user))
+    else:
+        auth_user_cache.put(auth_user, epoch)
+    return auth_user
+
+
+async def get_active_auth_user(
+    user: Annotated[AuthUser,
+                    Depends(get_auth_user)],
+) -> AuthUser:
+    """
+    Ensure the cached user is active
+    """
+    if not user.is_active:
+        raise InactiveUser()
+    return user
+
+
 async def get_current_active_user(
     user: Annotated[User,
                     Depends(get_current_user)],
@@ -85,6 +169,7 @@ async def get_current_active_user(
 
 
 async def get_optional_user(
+    request: Request,
     token: Annotated[str | None,
                      Depends(oauth2_scheme_optional)],
     db: DBSession,
@@ -96,7 +181,7 @@ async def get_optional_user(
         return None
 
     try:
-        payload = decode_access_token(token)
+        payload = request_token_claims(request, token)
         if payload.get("type") != TokenType.ACCESS.value:
             return None
         user_id = UUID(payload["sub"])
@@ -118,9 +203,9 @@ class RequireRole:
 
     async def __call__(
         self,
-        user: Annotated[User,
-                        Depends(get_current_active_user)],
-    ) -> User:
+        user: Annotated[AuthUser,
+                        Depends(get_active_auth_user)],
+    ) -> AuthUser:
         if user.role not in self.allowed_roles:
             raise PermissionDenied(
                 message =
@@ -130,6 +215,7 @@ class RequireRole:
 
 
 CurrentUser = Annotated["User", Depends(get_current_active_user)]
+AuthenticatedUser = Annotated[AuthUser, Depends(get_active_auth_user)]
 OptionalUser = Annotated["User | None", Depends(get_optional_user)]
 
 
@@ -88,3 +88,30 @@ class Platform(str, Enum):
     TIKTOK = "tiktok"
     INSTAGRAM = "instagram"
     YOUTUBE = "youtube"
+
+
+class ScheduleInterval(str, Enum):
+    """
+    Bucket size for the schedule calendar.
+    """
+    DAY = "day"
+    HOUR = "hour"
+
+
+class ExportFormat(str, Enum):
+    """
+    File formats for video entry export.
+    """
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class BatchItemStatus(str, Enum):
+    """
+    Per item outcome of a bulk video operation.
+    """
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    CONFLICT = "conflict"
+    NOT_FOUND = "not_found"
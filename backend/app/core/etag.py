@@ -0,0 +1,63 @@
+"""
+ⒸAngelaMos | 2025
+etag.py
+"""
+
+import hashlib
+from datetime import UTC, datetime
+from typing import Any
+
+from fastapi import Response, status
+
+
+CACHE_CONTROL_REVALIDATE = "private, no-cache"
+
+
+def weak_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values that identify a representation
+
+    Datetimes are normalized to UTC so naive SQLite values hash the same
+    as the aware values held in memory
+    """
+    normalized = [
+        (p if p.tzinfo else p.replace(tzinfo = UTC)).isoformat()
+        if isinstance(p, datetime) else str(p) for p in parts
+    ]
+    digest = hashlib.blake2b(
+        "|".join(normalized).encode(),
+        digest_size = 12,
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """
+    Attach an ETag that clients must revalidate before reuse
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL_REVALIDATE
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Empty 304 response for a matching If-None-Match
+    """
+    response = Response(status_code = status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
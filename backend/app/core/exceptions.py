@@ -155,6 +155,25 @@ class RateLimitExceeded(BaseAppException):
         self.retry_after = retry_after
 
 
+class ServiceUnavailable(BaseAppException):
+    """
+    Raised when the server is too busy to take the request right now
+    """
+    def __init__(
+        self,
+        message: str = "Service temporarily unavailable",
+        retry_after: int | None = None,
+        extra: dict[str,
+                    Any] | None = None,
+    ) -> None:
+        super().__init__(
+            message = message,
+            status_code = 503,
+            extra = extra
+        )
+        self.retry_after = retry_after
+
+
 class UserNotFound(ResourceNotFound):
     """
     Raised when a user is not found
@@ -0,0 +1,107 @@
+"""
+ⒸAngelaMos | 2025
+hash_pool.py
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from config import settings
+from .exceptions import ServiceUnavailable
+
+
+T = TypeVar("T")
+
+
+class HashPool:
+    """
+    Dedicated bounded thread pool for Argon2 work
+
+    Argon2 releases the GIL so threads hash in parallel without sharing
+    the default executor that asyncio.to_thread uses. At most workers
+    hashes run at once and queue_size more wait, anything past that is
+    rejected straight away instead of piling up behind a login storm.
+    Counters are kept on the event loop thread, so they need no lock
+    """
+    def __init__(self, workers: int, queue_size: int) -> None:
+        self.workers = workers
+        self.queue_size = queue_size
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.hash_seconds = 0.0
+        self.max_hash_seconds = 0.0
+        self._executor = ThreadPoolExecutor(
+            max_workers = workers,
+            thread_name_prefix = "argon2",
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Hashes waiting for a free worker
+        """
+        return max(0, self.in_flight - self.workers)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run fn in the pool, raising ServiceUnavailable when the queue is full
+        """
+        if self.in_flight >= self.workers + self.queue_size:
+            self.rejected += 1
+            raise ServiceUnavailable(
+                message = "Too many password checks in progress",
+                retry_after = 1,
+            )
+
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        self.in_flight += 1
+        future = self._executor.submit(_timed, fn, *args)
+        future.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(self._release)
+        )
+        started, finished, result = await asyncio.wrap_future(future)
+
+        wait = started - submitted
+        duration = finished - started
+        self.completed += 1
+        self.wait_seconds += wait
+        self.max_wait_seconds = max(self.max_wait_seconds, wait)
+        self.hash_seconds += duration
+        self.max_hash_seconds = max(self.max_hash_seconds, duration)
+        return result
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+
+    def shutdown(self) -> None:
+        """
+        Stop the workers, hashes still queued are cancelled
+        """
+        self._executor.shutdown(wait = True, cancel_futures = True)
+
+    def reset_stats(self) -> None:
+        """
+        Zero the counters, the queue itself is left alone
+        """
+        self.completed = self.rejected = 0
+        self.wait_seconds = self.max_wait_seconds = 0.0
+        self.hash_seconds = self.max_hash_seconds = 0.0
+
+
+def _timed(fn: Callable[..., T], *args: Any) -> tuple[float, float, T]:
+    started = time.perf_counter()
+    result = fn(*args)
+    return started, time.perf_counter(), result
+
+
+hash_pool = HashPool(
+    workers = settings.PASSWORD_HASH_WORKERS,
+    queue_size = settings.PASSWORD_HASH_QUEUE_SIZE,
+)
@@ -0,0 +1,36 @@
+"""
+ⒸAngelaMos | 2025
+pagination.py
+"""
+
+import base64
+import json
+from typing import Any
+
+from .exceptions import ValidationError
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    """
+    Encode keyset values into an opaque URL safe cursor
+    """
+    raw = json.dumps(values, separators = (",", ":"), default = str)
+    return base64.urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Raises:
+        ValidationError: If the cursor is malformed or was tampered with
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError as e:
+        raise ValidationError("Invalid cursor", field = "cursor") from e
+
+    if not isinstance(values, dict):
+        raise ValidationError("Invalid cursor", field = "cursor")
+    return values
@@ -9,27 +9,26 @@ from slowapi.util import get_remote_address
 from starlette.requests import Request
 
 from config import settings
+from .security import request_token_claims
 
 
 def get_identifier(request: Request) -> str:
     """
     Get rate limit identifier
 
-    Uses user ID if authenticated, otherwise falls back to IP address
+    Uses user ID if the bearer token verifies, otherwise falls back to IP
+    address so a forged sub cannot spend another user's limit
     (Will add more fingerprinting if needed depending on project)
     """
     auth_header = request.headers.get("Authorization")
     if auth_header and auth_header.startswith("Bearer "):
         try:
             token = auth_header.split(" ")[1]
-            payload = jwt.decode(
-                token,
-                options = {"verify_signature": False},
-            )
+            payload = request_token_claims(request, token)
             user_id = payload.get("sub")
             if user_id:
                 return f"user:{user_id}"
-        except Exception:
+        except (jwt.InvalidTokenError, IndexError):
             pass
 
     return get_remote_address(request)
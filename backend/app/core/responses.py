@@ -43,3 +43,20 @@ CONFLICT_409: dict[int | str,
                                 "description": "Resource conflict"
                             },
                         }
+
+UNAVAILABLE_503: dict[int | str,
+                      dict[str,
+                           Any]] = {
+                               503: {
+                                   "model": ErrorDetail,
+                                   "description": "Server busy, retry later"
+                               },
+                           }
+
+NOT_MODIFIED_304: dict[int | str,
+                       dict[str,
+                            Any]] = {
+                                304: {
+                                    "description": "Not modified since ETag"
+                                },
+                            }
@@ -3,9 +3,10 @@
 security.py
 """
 
-import asyncio
 import hashlib
 import secrets
+import time
+from collections import OrderedDict
 from datetime import (
     UTC,
     datetime,
@@ -15,14 +16,17 @@ from typing import Any
 from uuid import UUID
 
 import jwt
-from fastapi import Response
+from fastapi import Request, Response
 from pwdlib import PasswordHash
 
 from config import (
     API_PREFIX,
     settings,
     TokenType,
+    VERIFIED_TOKEN_CACHE_SIZE,
 )
+from .exceptions import ServiceUnavailable
+from .hash_pool import hash_pool
 
 
 password_hasher = PasswordHash.recommended()
@@ -32,10 +36,13 @@ async def hash_password(password: str) -> str:
     """
     Hash password using Argon2id
 
-    Runs in thread pool to avoid blocking the async event loop
-    since Argon2 is CPU intensive by design
+    Runs in the dedicated hash pool to avoid blocking the async event
+    loop since Argon2 is CPU intensive by design
+
+    Raises:
+        ServiceUnavailable: If the hash pool queue is full
     """
-    return await asyncio.to_thread(password_hasher.hash, password)
+    return await hash_pool.run(password_hasher.hash, password)
 
 
 async def verify_password(plain_password: str,
@@ -47,13 +54,18 @@ async def verify_password(plain_password: str,
     Returns:
         Tuple of (is_valid, new_hash_if_needs_rehash)
         If password is valid but hash params are outdated, returns new hash
+
+    Raises:
+        ServiceUnavailable: If the hash pool queue is full
     """
     try:
-        return await asyncio.to_thread(
+        return await hash_pool.run(
             password_hasher.verify_and_update,
             plain_password,
             hashed_password
         )
+    except ServiceUnavailable:
+        raise
     except Exception:
         return False, None
 
@@ -75,7 +87,7 @@ async def verify_password_with_timing_safety(
     hash operation to prevent timing attacks
     """
     if hashed_password is None:
-        await asyncio.to_thread(
+        await hash_pool.run(
             password_hasher.verify,
             plain_password,
             DUMMY_HASH
@@ -112,12 +124,9 @@ def create_access_token(
     )
 
 
-def create_refresh_token(
-    user_id: UUID,
-    family_id: UUID,
-) -> tuple[str,
-           str,
-           datetime]:
+def create_refresh_token() -> tuple[str,
+                                   str,
+                                   datetime]:
     """
     Create a long lived refresh token
 
@@ -134,14 +143,76 @@ def create_refresh_token(
     return raw_token, token_hash, expires_at
 
 
+class VerifiedTokenCache:
+    """
+    Per worker LRU of access tokens whose signature already checked out
+
+    Keyed by the raw token string, so any change to a token misses and is
+    verified in full. A hit is only served while the token's exp is still
+    ahead, expired entries are dropped and decoded again to raise the
+    usual error. The claims dicts are shared between hits and must not be
+    mutated
+    """
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """
+        Cached claims for a token, None when missing or expired
+        """
+        claims = self._entries.get(token)
+        if claims is not None:
+            if claims["exp"] > time.time():
+                self._entries.move_to_end(token)
+                self.hits += 1
+                return claims
+            del self._entries[token]
+        self.misses += 1
+        return None
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        """
+        Store the claims of a token that was just verified
+        """
+        if self.max_size <= 0:
+            return
+        self._entries[token] = claims
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last = False)
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the counters
+        """
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+verified_tokens = VerifiedTokenCache(VERIFIED_TOKEN_CACHE_SIZE)
+
+
 def decode_access_token(token: str) -> dict[str, Any]:
     """
     Decode and validate an access token
 
+    Tokens verified recently in this worker come from verified_tokens
+    instead of running the signature check again
+
     Raises:
         jwt.InvalidTokenError: If token is invalid or expired
     """
-    return jwt.decode(
+    claims = verified_tokens.get(token)
+    if claims is not None:
+        return claims
+
+    claims = jwt.decode(
         token,
         settings.SECRET_KEY.get_secret_value(),
         algorithms = [settings.JWT_ALGORITHM],
@@ -153,6 +224,24 @@ def decode_access_token(token: str) -> dict[str, Any]:
                         "token_version"]
         },
     )
+    verified_tokens.put(token, claims)
+    return claims
+
+
+def request_token_claims(request: Request, token: str) -> dict[str, Any]:
+    """
+    Verified claims of the access token on a request, decoded once and
+    shared by the rate limit key and the auth dependencies
+
+    Raises:
+        jwt.InvalidTokenError: If token is invalid or expired
+    """
+    cached = getattr(request.state, "token_claims", None)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+    claims = decode_access_token(token)
+    request.state.token_claims = (token, claims)
+    return claims
 
 
 def hash_token(token: str) -> str:
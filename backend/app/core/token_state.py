@@ -0,0 +1,138 @@
+"""
+ⒸAngelaMos | 2025
+token_state.py
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, NamedTuple
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings, UserRole
+
+if TYPE_CHECKING:
+    from user.User import User
+
+
+TOKEN_STATE_KEY = "auth:token_state"
+
+
+class TokenState(NamedTuple):
+    """
+    What an access token check needs to know about its user beyond the
+    token itself
+    """
+    token_version: int
+    is_active: bool
+    role: UserRole
+
+    @classmethod
+    def of(cls, user: "User") -> "TokenState":
+        return cls(user.token_version, user.is_active, user.role)
+
+    def encode(self) -> str:
+        return f"{self.token_version}:{int(self.is_active)}:{self.role.value}"
+
+    @classmethod
+    def decode(cls, raw: str) -> "TokenState":
+        version, active, role = raw.split(":", 2)
+        return cls(int(version), active == "1", UserRole(role))
+
+
+class LocalTokenStateMap:
+    """
+    In process stand in for the shared map, only correct with one worker
+
+    Settings refuse AUTH_STATELESS without REDIS_URL unless
+    AUTH_STATELESS_SINGLE_WORKER is set, so this map is never picked
+    silently for a multi worker deployment
+    """
+    def __init__(self) -> None:
+        self._states: dict[UUID, str] = {}
+
+    async def get(self, user_id: UUID) -> TokenState | None:
+        raw = self._states.get(user_id)
+        return TokenState.decode(raw) if raw is not None else None
+
+    async def set(self, user_id: UUID, state: TokenState) -> None:
+        self._states[user_id] = state.encode()
+
+    async def set_if_missing(self, user_id: UUID, state: TokenState) -> None:
+        self._states.setdefault(user_id, state.encode())
+
+    async def delete(self, user_id: UUID) -> None:
+        self._states.pop(user_id, None)
+
+    async def clear(self) -> None:
+        self._states.clear()
+
+
+class RedisTokenStateMap:
+    """
+    Token state of every user in one Redis hash shared by all workers
+    """
+    def __init__(self, url: str) -> None:
+        self._redis = redis.from_url(url, decode_responses = True)
+
+    async def get(self, user_id: UUID) -> TokenState | None:
+        raw = await self._redis.hget(TOKEN_STATE_KEY, str(user_id))
+        return TokenState.decode(raw) if raw is not None else None
+
+    async def set(self, user_id: UUID, state: TokenState) -> None:
+        await self._redis.hset(TOKEN_STATE_KEY, str(user_id), state.encode())
+
+    async def set_if_missing(self, user_id: UUID, state: TokenState) -> None:
+        await self._redis.hsetnx(
+            TOKEN_STATE_KEY,
+            str(user_id),
+            state.encode(),
+        )
+
+    async def delete(self, user_id: UUID) -> None:
+        await self._redis.hdel(TOKEN_STATE_KEY, str(user_id))
+
+    async def clear(self) -> None:
+        await self._redis.delete(TOKEN_STATE_KEY)
+
+
+token_state_map: LocalTokenStateMap | RedisTokenStateMap = (
+    RedisTokenStateMap(str(settings.REDIS_URL))
+    if settings.REDIS_URL else LocalTokenStateMap()
+)
+
+_pending: set[asyncio.Task[None]] = set()
+
+
+def _forget_on_rollback(session: AsyncSession, user_id: UUID) -> None:
+    """
+    Drop a published state if the transaction that wrote it rolls back,
+    the next request then reloads it from the database
+    """
+    def forget(_) -> None:
+        task = asyncio.get_running_loop().create_task(
+            token_state_map.delete(user_id)
+        )
+        _pending.add(task)
+        task.add_done_callback(_pending.discard)
+
+    event.listen(session.sync_session, "after_rollback", forget, once = True)
+
+
+async def publish_token_state(
+    session: AsyncSession,
+    user_id: UUID,
+    state: TokenState,
+) -> None:
+    """
+    Write a user's new token state to the shared map
+
+    Runs before the commit so no request can accept a token the write is
+    about to revoke
+    """
+    if not settings.AUTH_STATELESS:
+        return
+    await token_state_map.set(user_id, state)
+    _forget_on_rollback(session, user_id)
@@ -14,7 +14,8 @@ from slowapi.errors import RateLimitExceeded
 
 from config import settings, Environment, API_PREFIX
 from core.database import sessionmanager
-from core.exceptions import BaseAppException
+from core.exceptions import BaseAppException, ServiceUnavailable
+from core.hash_pool import hash_pool
 from core.logging import configure_logging
 from core.rate_limit import limiter
 from middleware.correlation import CorrelationIdMiddleware
@@ -35,6 +36,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     sessionmanager.init(str(settings.DATABASE_URL))
     yield
     await sessionmanager.close()
+    hash_pool.shutdown()
 
 
 OPENAPI_TAGS = [
@@ -113,12 +115,17 @@ def create_app() -> FastAPI:
         request: Request,
         exc: BaseAppException,
     ) -> JSONResponse:
+        retry_after = (
+            exc.retry_after if isinstance(exc, ServiceUnavailable) else None
+        )
         return JSONResponse(
             status_code = exc.status_code,
             content = {
                 "detail": exc.message,
                 "type": exc.__class__.__name__,
             },
+            headers = {"Retry-After": str(retry_after)}
+            if retry_after is not None else None,
         )
 
     @app.get("/", response_model = AppInfoResponse, tags = ["root"])
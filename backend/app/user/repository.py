@@ -2,16 +2,32 @@
 ⒸAngelaMos | 2025
 repository.py
 """
+from typing import Any
 from uuid import UUID
+from collections.abc import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Row, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import UserRole
 from .User import User
+from core.auth_cache import auth_user_cache
+from core.token_state import TokenState, publish_token_state
 from core.base_repository import BaseRepository
 
 
+USER_COLUMNS = (
+    User.id,
+    User.created_at,
+    User.updated_at,
+    User.email,
+    User.full_name,
+    User.is_active,
+    User.is_verified,
+    User.role,
+)
+
+
 class UserRepository(BaseRepository[User]):
     """
     Repository for User model database operations
@@ -43,6 +59,35 @@ class UserRepository(BaseRepository[User]):
         """
         return await session.get(User, id)
 
+    @classmethod
+    async def get_row_by_id(
+        cls,
+        session: AsyncSession,
+        id: UUID,
+    ) -> Row[Any] | None:
+        """
+        Get user profile columns by ID without loading an ORM instance
+        """
+        result = await session.execute(
+            select(*USER_COLUMNS).where(User.id == id)
+        )
+        return result.first()
+
+    @classmethod
+    async def get_multi_rows(
+        cls,
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Sequence[Row[Any]]:
+        """
+        Get user profile columns with pagination, read only
+        """
+        result = await session.execute(
+            select(*USER_COLUMNS).offset(skip).limit(limit)
+        )
+        return result.all()
+
     @classmethod
     async def email_exists(
         cls,
@@ -77,7 +122,6 @@ class UserRepository(BaseRepository[User]):
         )
         session.add(user)
         await session.flush()
-        await session.refresh(user)
         return user
 
     @classmethod
@@ -93,19 +137,34 @@ class UserRepository(BaseRepository[User]):
         user.hashed_password = hashed_password
         user.increment_token_version()
         await session.flush()
-        await session.refresh(user)
+        auth_user_cache.invalidate_on_commit(session, user.id)
+        await publish_token_state(session, user.id, TokenState.of(user))
         return user
 
     @classmethod
     async def increment_token_version(
         cls,
         session: AsyncSession,
-        user: User,
-    ) -> User:
+        user_id: UUID,
+    ) -> TokenState | None:
         """
         Invalidate all user tokens
+
+        Bumps the version in a single UPDATE ... RETURNING so callers that
+        only hold the token's AuthUser never load the row, None when the
+        user no longer exists
         """
-        user.increment_token_version()
-        await session.flush()
-        await session.refresh(user)
-        return user
+        result = await session.execute(
+            update(User).where(User.id == user_id).values(
+                token_version = User.token_version + 1
+            ).returning(User.token_version,
+                        User.is_active,
+                        User.role)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        state = TokenState(*row)
+        auth_user_cache.invalidate_on_commit(session, user_id)
+        await publish_token_state(session, user_id, state)
+        return state
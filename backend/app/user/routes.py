@@ -10,11 +10,12 @@ from fastapi import (
     status,
 )
 
-from core.dependencies import CurrentUser
+from core.dependencies import AuthenticatedUser
 from core.responses import (
     AUTH_401,
     CONFLICT_409,
     NOT_FOUND_404,
+    UNAVAILABLE_503,
 )
 from .schemas import (
     UserCreate,
@@ -31,7 +32,10 @@ router = APIRouter(prefix = "/users", tags = ["users"])
     "",
     response_model = UserResponse,
     status_code = status.HTTP_201_CREATED,
-    responses = {**CONFLICT_409},
+    responses = {
+        **CONFLICT_409,
+        **UNAVAILABLE_503
+    },
 )
 async def create_user(
     user_service: UserServiceDep,
@@ -54,7 +58,7 @@ async def create_user(
 async def get_user(
     user_service: UserServiceDep,
     user_id: UUID,
-    _: CurrentUser,
+    _: AuthenticatedUser,
 ) -> UserResponse:
     """
     Get user by ID
@@ -69,10 +73,10 @@ async def get_user(
 )
 async def update_current_user(
     user_service: UserServiceDep,
-    current_user: CurrentUser,
+    current_user: AuthenticatedUser,
     user_data: UserUpdate,
 ) -> UserResponse:
     """
     Update current user profile
     """
-    return await user_service.update_user(current_user, user_data)
+    return await user_service.update_user(current_user.id, user_data)
@@ -9,6 +9,8 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from config import settings, UserRole
+from core.auth_cache import auth_user_cache
+from core.token_state import TokenState, publish_token_state
 from core.exceptions import (
     EmailAlreadyExists,
     InvalidCredentials,
@@ -70,7 +72,7 @@ class UserService:
         """
         Get user by ID
         """
-        user = await UserRepository.get_by_id(self.session, user_id)
+        user = await UserRepository.get_row_by_id(self.session, user_id)
         if not user:
             raise UserNotFound(str(user_id))
         return UserResponse.model_validate(user)
@@ -89,12 +91,13 @@ class UserService:
 
     async def update_user(
         self,
-        user: User,
+        user_id: UUID,
         user_data: UserUpdate,
     ) -> UserResponse:
         """
         Update user profile
         """
+        user = await self.get_user_model_by_id(user_id)
         update_dict = user_data.model_dump(exclude_unset = True)
         updated_user = await UserRepository.update(
             self.session,
@@ -105,13 +108,14 @@ class UserService:
 
     async def change_password(
         self,
-        user: User,
+        user_id: UUID,
         current_password: str,
         new_password: str,
     ) -> None:
         """
         Change user password
         """
+        user = await self.get_user_model_by_id(user_id)
         is_valid, _ = await verify_password(current_password, user.hashed_password)
         if not is_valid:
             raise InvalidCredentials()
@@ -131,6 +135,8 @@ class UserService:
             user,
             is_active = False
         )
+        auth_user_cache.invalidate_on_commit(self.session, user.id)
+        await publish_token_state(self.session, user.id, TokenState.of(user))
         return UserResponse.model_validate(updated)
 
     async def list_users(
@@ -142,7 +148,7 @@ class UserService:
         List users with pagination
         """
         skip = (page - 1) * size
-        users = await UserRepository.get_multi(
+        users = await UserRepository.get_multi_rows(
             self.session,
             skip = skip,
             limit = size
@@ -205,6 +211,8 @@ class UserService:
             user,
             **update_dict
         )
+        auth_user_cache.invalidate_on_commit(self.session, user_id)
+        await publish_token_state(self.session, user_id, TokenState.of(user))
         return UserResponse.model_validate(updated_user)
 
     async def admin_delete_user(
@@ -218,4 +226,7 @@ class UserService:
         if not user:
             raise UserNotFound(str(user_id))
 
+        revoked = TokenState(user.token_version + 1, False, user.role)
         await UserRepository.delete(self.session, user)
+        auth_user_cache.invalidate_on_commit(self.session, user_id)
+        await publish_token_state(self.session, user_id, revoked)
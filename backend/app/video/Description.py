@@ -0,0 +1,70 @@
+"""
+ⒸAngelaMos | 2025
+Description.py
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy import (
+    Computed,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+from core.Base import Base
+
+
+class Description(Base):
+    """
+    Caption text stored once per user and shared by the entries using it
+    """
+    __tablename__ = "descriptions"
+    __table_args__ = (
+        Index(
+            "ix_descriptions_user_body_trgm",
+            "user_id",
+            "body",
+            postgresql_using="gin",
+            postgresql_ops={"body": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_descriptions_user_search_vector",
+            "user_id",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_descriptions_unreferenced",
+            "user_id",
+            "hash",
+            postgresql_where=text("ref_count <= 0"),
+        ),
+    )
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    hash: Mapped[bytes] = mapped_column(LargeBinary(32), primary_key=True)
+
+    body: Mapped[str] = mapped_column(Text)
+
+    ref_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        Computed("to_tsvector('english', body)", persisted=True),
+        deferred=True,
+    )
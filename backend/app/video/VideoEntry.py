@@ -6,17 +6,27 @@ VideoEntry.py
 from __future__ import annotations
 
 from uuid import UUID
-from datetime import datetime
+from datetime import UTC, datetime
 
 from sqlalchemy import (
+    Computed,
     DateTime,
     ForeignKey,
+    ForeignKeyConstraint,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Text,
+    UniqueConstraint,
+    func,
+    select,
+    text,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import (
     Mapped,
+    column_property,
     mapped_column,
     relationship,
 )
@@ -27,6 +37,7 @@ from core.Base import (
     TimestampMixin,
     UUIDMixin,
 )
+from .Description import Description
 
 
 class VideoEntry(Base, UUIDMixin, TimestampMixin):
@@ -34,6 +45,60 @@ class VideoEntry(Base, UUIDMixin, TimestampMixin):
     Video entry for social media content management
     """
     __tablename__ = "video_entries"
+    __table_args__ = (
+        Index(
+            "ix_video_entries_user_created_id",
+            "user_id",
+            "created_at",
+            "id",
+        ),
+        UniqueConstraint(
+            "user_id",
+            "platform",
+            "video_number",
+            name="uq_video_entries_user_platform_number",
+        ),
+        Index(
+            "ix_video_entries_user_updated_id",
+            "user_id",
+            "updated_at",
+            "id",
+        ),
+        ForeignKeyConstraint(
+            ["user_id", "description_hash"],
+            ["descriptions.user_id", "descriptions.hash"],
+        ),
+        Index(
+            "ix_video_entries_user_description_hash",
+            "user_id",
+            "description_hash",
+        ),
+        Index(
+            "ix_video_entries_user_search_vector",
+            "user_id",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_video_entries_user_platform_scheduled",
+            "user_id",
+            "platform",
+            "scheduled_time",
+        ),
+        Index(
+            "ix_video_entries_user_scheduled",
+            "user_id",
+            "scheduled_time",
+            postgresql_where=text("scheduled_time IS NOT NULL"),
+        ),
+        Index(
+            "ix_video_entries_youtube_missing",
+            "id",
+            postgresql_where=text(
+                "platform = 'youtube' AND youtube_description IS NULL"
+            ),
+        ),
+    )
 
     user_id: Mapped[UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -47,7 +112,24 @@ class VideoEntry(Base, UUIDMixin, TimestampMixin):
 
     video_number: Mapped[int] = mapped_column(Integer)
 
-    description: Mapped[str] = mapped_column(Text, default="")
+    description_hash: Mapped[bytes | None] = mapped_column(
+        LargeBinary(32),
+        default=None,
+    )
+
+    description: Mapped[str] = column_property(
+        func.coalesce(
+            select(Description.body)
+            .where(
+                Description.user_id == user_id,
+                Description.hash == description_hash,
+            )
+            .correlate_except(Description)
+            .scalar_subquery(),
+            "",
+        ),
+        expire_on_flush=False,
+    )
 
     youtube_description: Mapped[str | None] = mapped_column(
         Text,
@@ -57,5 +139,19 @@ class VideoEntry(Base, UUIDMixin, TimestampMixin):
     scheduled_time: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
         default=None,
-        index=True,
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
+
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        Computed(
+            "to_tsvector('english', coalesce(youtube_description, ''))",
+            persisted=True,
+        ),
+        deferred=True,
     )
@@ -0,0 +1,71 @@
+"""
+ⒸAngelaMos | 2025
+VideoStats.py
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+from datetime import UTC, datetime
+
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Integer,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+from config import Platform, SafeEnum
+from core.Base import Base
+
+
+class VideoStats(Base):
+    """
+    Denormalized per user, per platform video entry statistics
+    """
+    __tablename__ = "video_stats"
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    platform: Mapped[Platform] = mapped_column(
+        SafeEnum(Platform),
+        primary_key=True,
+    )
+
+    entry_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    max_video_number: Mapped[int] = mapped_column(Integer, default=0)
+
+    last_video_number: Mapped[int] = mapped_column(Integer, default=0)
+
+    version: Mapped[int] = mapped_column(Integer, default=0)
+
+    next_scheduled_time: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        default=None,
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+    )
+
+    @property
+    def is_schedule_stale(self) -> bool:
+        """
+        Check if next_scheduled_time has already passed
+
+        Handles both timezone aware and naive datetimes for SQLite compatibility
+        """
+        if self.next_scheduled_time is None:
+            return False
+        scheduled = self.next_scheduled_time
+        if scheduled.tzinfo is None:
+            scheduled = scheduled.replace(tzinfo=UTC)
+        return scheduled < datetime.now(UTC)
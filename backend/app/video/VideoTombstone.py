@@ -0,0 +1,52 @@
+"""
+ⒸAngelaMos | 2025
+VideoTombstone.py
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+from datetime import UTC, datetime
+
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+from config import Platform, SafeEnum
+from core.Base import Base
+
+
+class VideoTombstone(Base):
+    """
+    Record of a deleted video entry for the delta sync feed
+
+    Written in the same transaction as the delete so clients holding a
+    sync token learn about removals, pruned after the retention window
+    """
+    __tablename__ = "video_tombstones"
+    __table_args__ = (
+        Index(
+            "ix_video_tombstones_user_deleted",
+            "user_id",
+            "deleted_at",
+        ),
+    )
+
+    entry_id: Mapped[UUID] = mapped_column(primary_key=True)
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+    )
+
+    platform: Mapped[Platform] = mapped_column(SafeEnum(Platform))
+
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+    )
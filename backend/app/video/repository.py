@@ -3,15 +3,262 @@
 repository.py
 """
 
+import hashlib
+from typing import Any
 from uuid import UUID
-from collections.abc import Sequence
+from datetime import UTC, datetime
+from collections import Counter
+from collections.abc import (
+    AsyncIterator,
+    Collection,
+    Iterable,
+    Sequence,
+)
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    LargeBinary,
+    Row,
+    RowMapping,
+    Text,
+    Uuid,
+    and_,
+    any_,
+    bindparam,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    table,
+    text,
+    tuple_,
+    union,
+    update,
+    values,
+)
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
-from config import Platform
-from core.base_repository import BaseRepository
+from config import Platform, ScheduleInterval
+from core.base_repository import (
+    BaseRepository,
+    dialect_name,
+    server_uuid7,
+)
+from .Description import Description
 from .VideoEntry import VideoEntry
+from .VideoStats import VideoStats
+from .VideoTombstone import VideoTombstone
+
+
+ENTRY_COLUMNS = (
+    VideoEntry.id,
+    VideoEntry.created_at,
+    VideoEntry.updated_at,
+    VideoEntry.platform,
+    VideoEntry.video_number,
+    VideoEntry.description.label("description"),
+    VideoEntry.youtube_description,
+    VideoEntry.scheduled_time,
+)
+
+# INSERT ... RETURNING does not correlate subqueries to the table being
+# inserted into, so the description lookup names the new row's columns
+INSERTED_COLUMNS = (
+    VideoEntry.id,
+    VideoEntry.created_at,
+    VideoEntry.updated_at,
+    VideoEntry.platform,
+    VideoEntry.video_number,
+    func.coalesce(
+        select(Description.body)
+        .where(
+            Description.user_id == literal_column("video_entries.user_id"),
+            Description.hash ==
+            literal_column("video_entries.description_hash"),
+        )
+        .scalar_subquery(),
+        "",
+    ).label("description"),
+    VideoEntry.youtube_description,
+    VideoEntry.scheduled_time,
+)
+
+IMPORT_STAGING = table(
+    "video_entries_import",
+    column("platform"),
+    column("video_number"),
+    column("description_hash"),
+    column("youtube_description"),
+    column("scheduled_time"),
+)
+
+IMPORT_STAGING_DDL = text(
+    "CREATE TEMPORARY TABLE IF NOT EXISTS video_entries_import ("
+    "platform text NOT NULL, "
+    "video_number integer NOT NULL, "
+    "description_hash bytea, "
+    "youtube_description text, "
+    "scheduled_time timestamptz"
+    ") ON COMMIT DROP"
+)
+
+
+class DescriptionRepository(BaseRepository[Description]):
+    """
+    Repository for each user's content addressed caption texts
+    """
+    model = Description
+
+    @staticmethod
+    def digest(body: str) -> bytes | None:
+        """
+        SHA-256 of a caption's UTF-8 bytes, None for an empty caption
+        """
+        return hashlib.sha256(body.encode()).digest() if body else None
+
+    @staticmethod
+    def sql_digest(body: ColumnElement[str]) -> ColumnElement[bytes]:
+        """
+        digest() as a SQL expression for set based statements
+        """
+        return func.sha256(
+            func.convert_to(func.nullif(body, ""), "UTF8"),
+            type_=LargeBinary(32),
+        )
+
+    @classmethod
+    async def acquire(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        bodies: Sequence[str],
+    ) -> list[bytes | None]:
+        """
+        Store captions, take one reference each and return their hashes
+        """
+        hashes = [cls.digest(body) for body in bodies]
+        refs = Counter(h for h in hashes if h is not None)
+        if not refs:
+            return hashes
+        texts = dict(zip(hashes, bodies))
+        stmt = cls.upsert(session).values([
+            {
+                "user_id": user_id,
+                "hash": digest,
+                "body": texts[digest],
+                "ref_count": count,
+            } for digest, count in sorted(refs.items())
+        ])
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Description.user_id, Description.hash],
+                set_={
+                    "ref_count":
+                    Description.ref_count + stmt.excluded.ref_count,
+                },
+            )
+        )
+        return hashes
+
+    @classmethod
+    async def retain(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        hashes: Iterable[bytes | None],
+    ) -> None:
+        """
+        Take one more reference on already stored captions
+        """
+        await cls._adjust(session, user_id, hashes, 1)
+
+    @classmethod
+    async def release(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        hashes: Iterable[bytes | None],
+    ) -> None:
+        """
+        Drop one reference per hash
+        """
+        await cls._adjust(session, user_id, hashes, -1)
+
+    @classmethod
+    async def _adjust(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        hashes: Iterable[bytes | None],
+        step: int,
+    ) -> None:
+        """
+        Move ref_count of many rows with one executemany UPDATE
+        """
+        refs = Counter(h for h in hashes if h is not None)
+        if not refs:
+            return
+        descriptions = Description.__table__
+        await session.execute(
+            update(descriptions)
+            .where(
+                descriptions.c.user_id == user_id,
+                descriptions.c.hash == bindparam("ref_hash"),
+            )
+            .values(ref_count=descriptions.c.ref_count + bindparam("delta")),
+            [
+                {
+                    "ref_hash": digest,
+                    "delta": step * count,
+                } for digest, count in sorted(refs.items())
+            ],
+        )
+
+    @classmethod
+    async def recount(cls, session: AsyncSession) -> int:
+        """
+        Recompute ref_count from video_entries to repair drift
+        """
+        refs = (
+            select(func.count())
+            .where(
+                VideoEntry.user_id == Description.user_id,
+                VideoEntry.description_hash == Description.hash,
+            )
+            .correlate(Description)
+            .scalar_subquery()
+        )
+        result = await session.execute(
+            update(Description)
+            .where(Description.ref_count != refs)
+            .values(ref_count=refs)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
+
+    @classmethod
+    async def collect_garbage(cls, session: AsyncSession) -> int:
+        """
+        Delete texts no entry points at any more
+        """
+        referenced = select(VideoEntry.id).where(
+            VideoEntry.user_id == Description.user_id,
+            VideoEntry.description_hash == Description.hash,
+        ).exists()
+        result = await session.execute(
+            delete(Description)
+            .where(Description.ref_count <= 0, ~referenced)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
 
 
 class VideoEntryRepository(BaseRepository[VideoEntry]):
@@ -20,6 +267,93 @@ class VideoEntryRepository(BaseRepository[VideoEntry]):
     """
     model = VideoEntry
 
+    @classmethod
+    async def create(
+        cls,
+        session: AsyncSession,
+        description: str = "",
+        **kwargs: Any,
+    ) -> VideoEntry:
+        """
+        Create an entry, storing its description in the shared table
+        """
+        [kwargs["description_hash"]] = await DescriptionRepository.acquire(
+            session,
+            kwargs["user_id"],
+            [description],
+        )
+        entry = await super().create(session, **kwargs)
+        set_committed_value(entry, "description", description)
+        return entry
+
+    @classmethod
+    async def update(
+        cls,
+        session: AsyncSession,
+        instance: VideoEntry,
+        **kwargs: Any,
+    ) -> VideoEntry:
+        """
+        Update an entry, moving its reference when the description changes
+        """
+        description = None
+        if "description" in kwargs:
+            description = kwargs.pop("description") or ""
+            digest = DescriptionRepository.digest(description)
+            if digest != instance.description_hash:
+                await DescriptionRepository.acquire(
+                    session,
+                    instance.user_id,
+                    [description],
+                )
+                await DescriptionRepository.release(
+                    session,
+                    instance.user_id,
+                    [instance.description_hash],
+                )
+                kwargs["description_hash"] = digest
+        entry = await super().update(session, instance, **kwargs)
+        if description is not None:
+            set_committed_value(entry, "description", description)
+        return entry
+
+    @classmethod
+    async def delete(
+        cls,
+        session: AsyncSession,
+        instance: VideoEntry,
+    ) -> None:
+        """
+        Delete an entry and release its description
+        """
+        await DescriptionRepository.release(
+            session,
+            instance.user_id,
+            [instance.description_hash],
+        )
+        await super().delete(session, instance)
+
+    @staticmethod
+    async def _store_descriptions(
+        session: AsyncSession,
+        user_id: UUID,
+        rows: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Acquire the description of every row, swapping the text for its hash
+        """
+        hashes = await DescriptionRepository.acquire(
+            session,
+            user_id,
+            [row.get("description", "") for row in rows],
+        )
+        return [
+            {
+                **{k: v for k, v in row.items() if k != "description"},
+                "description_hash": digest,
+            } for row, digest in zip(rows, hashes)
+        ]
+
     @classmethod
     async def get_by_user(
         cls,
@@ -27,18 +361,23 @@ class VideoEntryRepository(BaseRepository[VideoEntry]):
         user_id: UUID,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[VideoEntry]:
+        after: tuple[datetime, UUID] | None = None,
+    ) -> Sequence[Row[Any]]:
         """
-        Get all video entries for a user
+        Get all video entries for a user as column rows, newest first
         """
+        query = select(*ENTRY_COLUMNS).where(VideoEntry.user_id == user_id)
+        if after is not None:
+            query = query.where(
+                tuple_(VideoEntry.created_at, VideoEntry.id) < after
+            )
         result = await session.execute(
-            select(VideoEntry)
-            .where(VideoEntry.user_id == user_id)
-            .order_by(VideoEntry.created_at.desc())
+            query
+            .order_by(VideoEntry.created_at.desc(), VideoEntry.id.desc())
             .offset(skip)
             .limit(limit)
         )
-        return result.scalars().all()
+        return result.all()
 
     @classmethod
     async def get_by_user_and_platform(
@@ -48,21 +387,650 @@ class VideoEntryRepository(BaseRepository[VideoEntry]):
         platform: Platform,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[VideoEntry]:
+        after: int | None = None,
+    ) -> Sequence[Row[Any]]:
         """
-        Get video entries for a user filtered by platform
+        Get video entries for a user and platform as column rows
         """
+        query = select(*ENTRY_COLUMNS).where(
+            VideoEntry.user_id == user_id,
+            VideoEntry.platform == platform,
+        )
+        if after is not None:
+            query = query.where(VideoEntry.video_number > after)
         result = await session.execute(
-            select(VideoEntry)
-            .where(
-                VideoEntry.user_id == user_id,
-                VideoEntry.platform == platform,
-            )
+            query
             .order_by(VideoEntry.video_number.asc())
             .offset(skip)
             .limit(limit)
         )
-        return result.scalars().all()
+        return result.all()
+
+    @classmethod
+    async def get_changed(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        limit: int,
+        after: tuple[datetime, UUID | None] | None = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Get entries updated after a sync position, oldest first
+        """
+        query = select(*ENTRY_COLUMNS).where(VideoEntry.user_id == user_id)
+        if after is not None:
+            changed_at, entry_id = after
+            if entry_id is None:
+                query = query.where(VideoEntry.updated_at >= changed_at)
+            else:
+                query = query.where(
+                    tuple_(VideoEntry.updated_at, VideoEntry.id) > after
+                )
+        result = await session.execute(
+            query
+            .order_by(VideoEntry.updated_at.asc(), VideoEntry.id.asc())
+            .limit(limit)
+        )
+        return result.all()
+
+    @classmethod
+    async def search(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        query: str,
+        limit: int,
+        platform: Platform | None = None,
+        after: tuple[float, UUID] | None = None,
+    ) -> Sequence[tuple[Row[Any], float]]:
+        """
+        Full text search over both descriptions as (row, rank)
+        """
+        if dialect_name(session) == "sqlite":
+            fts = literal_column("video_entries_fts")
+            rank = -func.bm25(fts)
+            stmt = select(*ENTRY_COLUMNS, rank.label("rank")).join(
+                table("video_entries_fts"),
+                literal_column("video_entries_fts.rowid") ==
+                literal_column("video_entries.rowid"),
+            ).where(fts.op("MATCH")(cls._fts5_query(query)))
+        else:
+            tsquery = postgresql.websearch_to_tsquery("english", query)
+            described = and_(
+                Description.user_id == VideoEntry.user_id,
+                Description.hash == VideoEntry.description_hash,
+            )
+            matched = union(
+                select(VideoEntry.id).join(Description, described).where(
+                    Description.user_id == user_id,
+                    Description.search_vector.op("@@")(tsquery),
+                ),
+                select(VideoEntry.id).where(
+                    VideoEntry.user_id == user_id,
+                    VideoEntry.search_vector.op("@@")(tsquery),
+                ),
+            ).subquery("matched")
+            rank = func.coalesce(
+                func.ts_rank_cd(Description.search_vector, tsquery),
+                0,
+            ) + func.ts_rank_cd(VideoEntry.search_vector, tsquery)
+            stmt = (
+                select(*ENTRY_COLUMNS, rank.label("rank"))
+                .join(matched, matched.c.id == VideoEntry.id)
+                .outerjoin(Description, described)
+            )
+
+        stmt = stmt.where(VideoEntry.user_id == user_id)
+        if platform is not None:
+            stmt = stmt.where(VideoEntry.platform == platform)
+        if after is not None:
+            stmt = stmt.where(tuple_(rank, VideoEntry.id) < after)
+        result = await session.execute(
+            stmt.order_by(rank.desc(), VideoEntry.id.desc()).limit(limit)
+        )
+        return [(row, float(row.rank)) for row in result]
+
+    @classmethod
+    async def find_similar(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        text: str,
+        limit: int,
+        min_score: float,
+        platform: Platform | None = None,
+        exclude_id: UUID | None = None,
+    ) -> Sequence[tuple[Row[Any], float]]:
+        """
+        Get entries with a trigram similar description as (row, score)
+        """
+        score = func.similarity(Description.body, text)
+        stmt = select(*ENTRY_COLUMNS, score.label("score")).join(
+            Description,
+            and_(
+                Description.user_id == VideoEntry.user_id,
+                Description.hash == VideoEntry.description_hash,
+            ),
+        ).where(
+            Description.user_id == user_id,
+            VideoEntry.user_id == user_id,
+            score >= min_score,
+        )
+        if dialect_name(session) != "sqlite":
+            stmt = stmt.where(Description.body.op("%")(text))
+        if platform is not None:
+            stmt = stmt.where(VideoEntry.platform == platform)
+        if exclude_id is not None:
+            stmt = stmt.where(VideoEntry.id != exclude_id)
+        result = await session.execute(
+            stmt.order_by(score.desc(), VideoEntry.id.desc()).limit(limit)
+        )
+        return [(row, float(row.score)) for row in result]
+
+    @staticmethod
+    def _fts5_query(query: str) -> str:
+        """
+        Quote each word so FTS5 treats user input as plain terms
+        """
+        return " ".join(
+            '"' + word.replace('"', '""') + '"' for word in query.split()
+        )
+
+    @staticmethod
+    def _schedule_filter(
+        user_id: UUID,
+        start: datetime,
+        end: datetime,
+        platform: Platform | None = None,
+    ) -> list[ColumnElement[bool]]:
+        """
+        WHERE clauses for entries scheduled in [start, end)
+        """
+        conditions = [
+            VideoEntry.user_id == user_id,
+            VideoEntry.scheduled_time >= start,
+            VideoEntry.scheduled_time < end,
+        ]
+        if platform is not None:
+            conditions.append(VideoEntry.platform == platform)
+        return conditions
+
+    @classmethod
+    async def count_scheduled_by_bucket(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        start: datetime,
+        end: datetime,
+        interval: ScheduleInterval,
+        tz: str,
+        platform: Platform | None = None,
+    ) -> Sequence[tuple[datetime, int]]:
+        """
+        Count entries scheduled in [start, end) per day or hour
+        """
+        local_time = func.timezone(tz, VideoEntry.scheduled_time)
+        bucket = func.timezone(
+            tz,
+            func.date_trunc(interval.value, local_time),
+            type_=DateTime(timezone=True),
+        ).label("bucket")
+        result = await session.execute(
+            select(bucket, func.count())
+            .where(*cls._schedule_filter(user_id, start, end, platform))
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+        return [(row[0], row[1]) for row in result]
+
+    @classmethod
+    async def get_scheduled(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        start: datetime,
+        end: datetime,
+        limit: int,
+        platform: Platform | None = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Get entries scheduled in [start, end) as column rows, soonest first
+        """
+        result = await session.execute(
+            select(*ENTRY_COLUMNS)
+            .where(*cls._schedule_filter(user_id, start, end, platform))
+            .order_by(VideoEntry.scheduled_time.asc(), VideoEntry.id.asc())
+            .limit(limit)
+        )
+        return result.all()
+
+    @classmethod
+    async def get_updated_at(
+        cls,
+        session: AsyncSession,
+        entry_id: UUID,
+        user_id: UUID,
+    ) -> datetime | None:
+        """
+        Get only updated_at of a user's entry, for ETag validation
+        """
+        result = await session.execute(
+            select(VideoEntry.updated_at).where(
+                VideoEntry.id == entry_id,
+                VideoEntry.user_id == user_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def stream_by_user(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        platform: Platform | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """
+        Stream a user's entries in batches from a server side cursor
+        """
+        query = select(*ENTRY_COLUMNS).where(VideoEntry.user_id == user_id)
+        if platform is not None:
+            query = query.where(VideoEntry.platform == platform)
+        result = await session.stream(
+            query
+            .order_by(VideoEntry.platform, VideoEntry.video_number)
+            .execution_options(yield_per=batch_size)
+        )
+        async for partition in result.mappings().partitions():
+            yield partition
+
+    @classmethod
+    async def create_many(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        rows: list[dict[str, Any]],
+    ) -> Sequence[Row[Any]]:
+        """
+        Insert many entries, skipping taken video numbers
+        """
+        if not rows:
+            return []
+        rows = await cls._store_descriptions(session, user_id, rows)
+        stmt = cls.upsert(session).values(
+            [{**row, "user_id": user_id} for row in rows]
+        ).on_conflict_do_nothing(
+            index_elements=[
+                VideoEntry.user_id,
+                VideoEntry.platform,
+                VideoEntry.video_number,
+            ],
+        ).returning(*INSERTED_COLUMNS)
+        result = await session.execute(stmt)
+        inserted = result.all()
+        if len(inserted) < len(rows):
+            keys = {(row.platform, row.video_number) for row in inserted}
+            await DescriptionRepository.release(
+                session,
+                user_id,
+                [
+                    row["description_hash"] for row in rows
+                    if (row["platform"], row["video_number"]) not in keys
+                ],
+            )
+        return inserted
+
+    @classmethod
+    async def import_many(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        rows: list[dict[str, Any]],
+    ) -> set[tuple[Platform, int]]:
+        """
+        Bulk insert imported rows, skipping taken video numbers
+        """
+        if not rows:
+            return set()
+        rows = await cls._store_descriptions(session, user_id, rows)
+        conflict_columns = [
+            VideoEntry.user_id,
+            VideoEntry.platform,
+            VideoEntry.video_number,
+        ]
+        if dialect_name(session) == "sqlite":
+            stmt = cls.upsert(session).values(
+                [{**row, "user_id": user_id} for row in rows]
+            )
+        else:
+            await session.execute(IMPORT_STAGING_DDL)
+            await session.execute(delete(IMPORT_STAGING))
+            connection = await session.connection()
+            raw = await connection.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                IMPORT_STAGING.name,
+                records=[
+                    (
+                        row["platform"].value,
+                        row["video_number"],
+                        row["description_hash"],
+                        row["youtube_description"],
+                        row["scheduled_time"],
+                    ) for row in rows
+                ],
+                columns=[c.name for c in IMPORT_STAGING.columns],
+            )
+            now = literal(datetime.now(UTC), DateTime(timezone=True))
+            staged = IMPORT_STAGING.c
+            stmt = cls.upsert(session).from_select(
+                [
+                    VideoEntry.id,
+                    VideoEntry.user_id,
+                    VideoEntry.platform,
+                    VideoEntry.video_number,
+                    VideoEntry.description_hash,
+                    VideoEntry.youtube_description,
+                    VideoEntry.scheduled_time,
+                    VideoEntry.created_at,
+                    VideoEntry.updated_at,
+                ],
+                select(
+                    server_uuid7(session),
+                    literal(user_id, VideoEntry.user_id.type),
+                    cast(staged.platform, VideoEntry.platform.type),
+                    staged.video_number,
+                    staged.description_hash,
+                    staged.youtube_description,
+                    staged.scheduled_time,
+                    now,
+                    now,
+                ),
+            )
+        result = await session.execute(
+            stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+            .returning(VideoEntry.platform, VideoEntry.video_number)
+        )
+        inserted = {(platform, number) for platform, number in result}
+        await DescriptionRepository.release(
+            session,
+            user_id,
+            [
+                row["description_hash"] for row in rows
+                if (row["platform"], row["video_number"]) not in inserted
+            ],
+        )
+        return inserted
+
+    @classmethod
+    async def get_missing_youtube_description(
+        cls,
+        session: AsyncSession,
+        limit: int,
+        user_id: UUID | None = None,
+        after: UUID | None = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Get YouTube entries without a youtube_description in id order
+        """
+        query = select(
+            VideoEntry.id,
+            VideoEntry.user_id,
+            VideoEntry.description.label("description"),
+        ).where(
+            VideoEntry.platform == Platform.YOUTUBE,
+            VideoEntry.youtube_description.is_(None),
+        )
+        if user_id is not None:
+            query = query.where(VideoEntry.user_id == user_id)
+        if after is not None:
+            query = query.where(VideoEntry.id > after)
+        result = await session.execute(
+            query.order_by(VideoEntry.id).limit(limit)
+        )
+        return result.all()
+
+    @classmethod
+    async def set_youtube_descriptions(
+        cls,
+        session: AsyncSession,
+        descriptions: Sequence[tuple[UUID, str]],
+    ) -> int:
+        """
+        Write youtube_description for many entries, returning rows written
+        """
+        if not descriptions:
+            return 0
+        now = datetime.now(UTC)
+        if dialect_name(session) == "sqlite":
+            await session.execute(
+                update(VideoEntry),
+                [
+                    {
+                        "id": entry_id,
+                        "youtube_description": description,
+                        "updated_at": now,
+                    } for entry_id, description in descriptions
+                ],
+            )
+            return len(descriptions)
+        source = values(
+            column("id", Uuid),
+            column("youtube_description", Text),
+            name="source",
+        ).data(list(descriptions))
+        result = await session.execute(
+            update(VideoEntry)
+            .where(
+                VideoEntry.id == source.c.id,
+                VideoEntry.youtube_description.is_(None),
+            )
+            .values(
+                youtube_description=source.c.youtube_description,
+                updated_at=now,
+            )
+        )
+        return result.rowcount
+
+    @classmethod
+    async def update_many(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        ids: Sequence[UUID],
+        **values: Any,
+    ) -> Sequence[Row[Any]]:
+        """
+        Update many of a user's entries in one UPDATE ... RETURNING
+        """
+        owned = (cls.id_in(session, ids), VideoEntry.user_id == user_id)
+        if "description" in values:
+            description = values.pop("description") or ""
+            previous = await session.scalars(
+                select(VideoEntry.description_hash)
+                .where(*owned)
+                .with_for_update()
+            )
+            old_hashes = previous.all()
+            await DescriptionRepository.acquire(
+                session,
+                user_id,
+                [description] * len(old_hashes),
+            )
+            await DescriptionRepository.release(session, user_id, old_hashes)
+            values["description_hash"] = DescriptionRepository.digest(
+                description
+            )
+        result = await session.execute(
+            update(VideoEntry)
+            .where(*owned)
+            .values(**values)
+            .returning(*ENTRY_COLUMNS)
+        )
+        return result.all()
+
+    @classmethod
+    async def delete_many(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        ids: Sequence[UUID],
+    ) -> Sequence[tuple[UUID, Platform]]:
+        """
+        Delete many of a user's entries in one DELETE ... RETURNING
+        """
+        result = await session.execute(
+            delete(VideoEntry)
+            .where(cls.id_in(session, ids), VideoEntry.user_id == user_id)
+            .returning(
+                VideoEntry.id,
+                VideoEntry.platform,
+                VideoEntry.description_hash,
+            )
+        )
+        deleted = result.all()
+        await DescriptionRepository.release(
+            session,
+            user_id,
+            [row.description_hash for row in deleted],
+        )
+        return [(row.id, row.platform) for row in deleted]
+
+    @staticmethod
+    def copy_source_filter(
+        user_id: UUID,
+        entry_ids: list[UUID] | None = None,
+        source_platform: Platform | None = None,
+        after_video_number: int | None = None,
+    ) -> list[ColumnElement[bool]]:
+        """
+        WHERE clauses selecting the source rows of a bulk copy
+        """
+        conditions = [VideoEntry.user_id == user_id]
+        if entry_ids is not None:
+            conditions.append(VideoEntry.id.in_(entry_ids))
+        if source_platform is not None:
+            conditions.append(VideoEntry.platform == source_platform)
+        if after_video_number is not None:
+            conditions.append(VideoEntry.video_number > after_video_number)
+        return conditions
+
+    @classmethod
+    async def count_where(
+        cls,
+        session: AsyncSession,
+        conditions: list[ColumnElement[bool]],
+    ) -> int:
+        """
+        Count entries matching a set of WHERE clauses
+        """
+        result = await session.execute(
+            select(func.count()).select_from(VideoEntry).where(*conditions)
+        )
+        return result.scalar_one()
+
+    @classmethod
+    async def copy_many(
+        cls,
+        session: AsyncSession,
+        conditions: list[ColumnElement[bool]],
+        target_platform: Platform,
+        first_number: int,
+        limit: int,
+        shorten_for_youtube: bool = True,
+    ) -> list[int]:
+        """
+        Copy matching entries to a platform with one INSERT ... SELECT
+        """
+        order = (VideoEntry.video_number, VideoEntry.id)
+        selected = VideoEntry.id.in_(
+            select(VideoEntry.id)
+            .where(*conditions)
+            .order_by(*order)
+            .limit(limit)
+        )
+        description_hash: ColumnElement[bytes | None] = (
+            VideoEntry.description_hash
+        )
+        youtube_description: ColumnElement[str | None] = literal(None)
+        if target_platform == Platform.YOUTUBE and shorten_for_youtube:
+            shortened = func.coalesce(
+                func.nullif(VideoEntry.youtube_description, ""),
+                func.shorten_description(VideoEntry.description, 100),
+            )
+            description_hash = DescriptionRepository.sql_digest(shortened)
+            youtube_description = shortened
+            await session.execute(
+                DescriptionRepository.upsert(session).from_select(
+                    [
+                        Description.user_id,
+                        Description.hash,
+                        Description.body,
+                        Description.ref_count,
+                    ],
+                    select(
+                        VideoEntry.user_id,
+                        description_hash,
+                        shortened,
+                        literal(0),
+                    )
+                    .where(selected, shortened != "")
+                    .distinct(),
+                ).on_conflict_do_nothing(
+                    index_elements=[Description.user_id, Description.hash],
+                )
+            )
+
+        now = literal(datetime.now(UTC), DateTime(timezone=True))
+        source = (
+            select(
+                server_uuid7(session),
+                VideoEntry.user_id,
+                cast(
+                    literal(target_platform, VideoEntry.platform.type),
+                    VideoEntry.platform.type,
+                ),
+                first_number - 1 + func.row_number().over(order_by=order),
+                description_hash,
+                youtube_description,
+                VideoEntry.scheduled_time,
+                now,
+                now,
+            )
+            .where(selected)
+            .order_by(*order)
+        )
+        stmt = cls.upsert(session).from_select(
+            [
+                VideoEntry.id,
+                VideoEntry.user_id,
+                VideoEntry.platform,
+                VideoEntry.video_number,
+                VideoEntry.description_hash,
+                VideoEntry.youtube_description,
+                VideoEntry.scheduled_time,
+                VideoEntry.created_at,
+                VideoEntry.updated_at,
+            ],
+            source,
+        ).on_conflict_do_nothing(
+            index_elements=[
+                VideoEntry.user_id,
+                VideoEntry.platform,
+                VideoEntry.video_number,
+            ],
+        ).returning(
+            VideoEntry.user_id,
+            VideoEntry.description_hash,
+            VideoEntry.video_number,
+        )
+        copied = (await session.execute(stmt)).all()
+        if copied:
+            await DescriptionRepository.retain(
+                session,
+                copied[0].user_id,
+                [row.description_hash for row in copied],
+            )
+        return sorted(row.video_number for row in copied)
 
     @classmethod
     async def count_by_user(
@@ -74,7 +1042,6 @@ class VideoEntryRepository(BaseRepository[VideoEntry]):
         """
         Count video entries for a user, optionally filtered by platform
         """
-        from sqlalchemy import func
         query = select(func.count()).select_from(VideoEntry).where(
             VideoEntry.user_id == user_id
         )
@@ -84,40 +1051,419 @@ class VideoEntryRepository(BaseRepository[VideoEntry]):
         return result.scalar_one()
 
     @classmethod
-    async def get_next_video_number(
+    async def get_by_id_and_user(
         cls,
         session: AsyncSession,
+        entry_id: UUID,
         user_id: UUID,
-        platform: Platform,
-    ) -> int:
+    ) -> VideoEntry | None:
         """
-        Get the next available video number for a platform
+        Get a video entry by ID, ensuring it belongs to the user
         """
-        from sqlalchemy import func
         result = await session.execute(
-            select(func.max(VideoEntry.video_number))
-            .where(
+            select(VideoEntry).where(
+                VideoEntry.id == entry_id,
                 VideoEntry.user_id == user_id,
-                VideoEntry.platform == platform,
             )
         )
-        max_num = result.scalar_one_or_none()
-        return (max_num or 0) + 1
+        return result.scalars().first()
 
     @classmethod
-    async def get_by_id_and_user(
+    async def get_row_by_id_and_user(
         cls,
         session: AsyncSession,
         entry_id: UUID,
         user_id: UUID,
-    ) -> VideoEntry | None:
+    ) -> Row[Any] | None:
         """
-        Get a video entry by ID, ensuring it belongs to the user
+        Get a user's video entry as a column row, without an ORM object
         """
         result = await session.execute(
-            select(VideoEntry).where(
+            select(*ENTRY_COLUMNS).where(
                 VideoEntry.id == entry_id,
                 VideoEntry.user_id == user_id,
             )
         )
-        return result.scalars().first()
+        return result.first()
+
+
+class VideoStatsRepository(BaseRepository[VideoStats]):
+    """
+    Repository for the denormalized VideoStats table
+    """
+    model = VideoStats
+
+    @classmethod
+    async def get_by_user(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+    ) -> Sequence[VideoStats]:
+        """
+        Get every platform stats row for a user (primary key prefix scan)
+        """
+        result = await session.execute(
+            select(VideoStats)
+            .where(VideoStats.user_id == user_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalars().all()
+
+    @classmethod
+    async def count_entries(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        platform: Platform | None = None,
+    ) -> int:
+        """
+        Entry count for a user served from the stats rows
+        """
+        query = select(func.coalesce(func.sum(VideoStats.entry_count), 0)
+                       ).where(VideoStats.user_id == user_id)
+        if platform:
+            query = query.where(VideoStats.platform == platform)
+        result = await session.execute(query)
+        return result.scalar_one()
+
+    @classmethod
+    async def lock(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        platforms: Sequence[Platform] | None = None,
+    ) -> None:
+        """
+        Lock a user's stats rows, all platforms when none are given
+        """
+        query = select(VideoStats.platform).where(
+            VideoStats.user_id == user_id
+        )
+        if platforms is not None:
+            query = query.where(VideoStats.platform.in_(platforms))
+        await session.execute(
+            query.order_by(VideoStats.platform).with_for_update()
+        )
+
+    @classmethod
+    async def refresh(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        platform: Platform,
+        count_delta: int = 0,
+    ) -> None:
+        """
+        Apply a write to the stats row the caller has locked
+        """
+        now = datetime.now(UTC)
+        scope = (
+            VideoEntry.user_id == user_id,
+            VideoEntry.platform == platform,
+        )
+        max_number = select(
+            func.coalesce(func.max(VideoEntry.video_number), 0)
+        ).where(*scope).scalar_subquery()
+        next_scheduled = select(
+            func.min(VideoEntry.scheduled_time)
+        ).where(*scope, VideoEntry.scheduled_time >= now).scalar_subquery()
+
+        stmt = cls.upsert(session).values(
+            user_id=user_id,
+            platform=platform,
+            entry_count=count_delta,
+            max_video_number=max_number,
+            next_scheduled_time=next_scheduled,
+            version=1,
+            updated_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VideoStats.user_id, VideoStats.platform],
+            set_={
+                "entry_count": VideoStats.entry_count + count_delta,
+                "max_video_number": case(
+                    (
+                        VideoStats.max_video_number >
+                        stmt.excluded.max_video_number,
+                        VideoStats.max_video_number,
+                    ),
+                    else_=stmt.excluded.max_video_number,
+                ) if count_delta > 0 else stmt.excluded.max_video_number,
+                "next_scheduled_time": stmt.excluded.next_scheduled_time,
+                "version": VideoStats.version + 1,
+                "updated_at": now,
+            },
+        )
+        await session.execute(stmt)
+
+    @classmethod
+    async def bump_version(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        platforms: Sequence[Platform],
+    ) -> None:
+        """
+        Bump the write version for edits that leave the stats unchanged
+        """
+        if not platforms:
+            return
+        await session.execute(
+            update(VideoStats).where(
+                VideoStats.user_id == user_id,
+                VideoStats.platform.in_(platforms),
+            ).values(
+                version=VideoStats.version + 1,
+                updated_at=datetime.now(UTC),
+            )
+        )
+
+    @classmethod
+    async def bump_versions(
+        cls,
+        session: AsyncSession,
+        user_ids: Collection[UUID],
+        platform: Platform,
+    ) -> None:
+        """
+        Bump one platform's write version for many users at once
+        """
+        if not user_ids:
+            return
+        if dialect_name(session) == "sqlite":
+            owned = VideoStats.user_id.in_(user_ids)
+        else:
+            owned = VideoStats.user_id == any_(
+                literal(list(user_ids), postgresql.ARRAY(Uuid))
+            )
+        await session.execute(
+            update(VideoStats).where(
+                owned,
+                VideoStats.platform == platform,
+            ).values(
+                version=VideoStats.version + 1,
+                updated_at=datetime.now(UTC),
+            )
+        )
+
+    @classmethod
+    async def get_version(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        platform: Platform | None = None,
+    ) -> tuple[int, datetime | None]:
+        """
+        Get (summed write version, last write time) for a user's entries
+        """
+        query = select(
+            func.coalesce(func.sum(VideoStats.version), 0),
+            func.max(VideoStats.updated_at),
+        ).where(VideoStats.user_id == user_id)
+        if platform is not None:
+            query = query.where(VideoStats.platform == platform)
+        result = await session.execute(query)
+        version, updated_at = result.one()
+        return int(version), updated_at
+
+    @classmethod
+    async def allocate_numbers(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        platform: Platform,
+        count: int = 1,
+    ) -> int:
+        """
+        Atomically reserve count consecutive video numbers
+        """
+        stmt = cls.upsert(session).values(
+            user_id=user_id,
+            platform=platform,
+            last_video_number=count,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VideoStats.user_id, VideoStats.platform],
+            set_={"last_video_number": VideoStats.last_video_number + count},
+        ).returning(VideoStats.last_video_number)
+        result = await session.execute(stmt)
+        return result.scalar_one() - count + 1
+
+    @classmethod
+    async def release_numbers(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        platform: Platform,
+        first: int,
+        last: int,
+    ) -> None:
+        """
+        Give back the unused tail of a block from allocate_numbers
+        """
+        highest = select(
+            func.coalesce(func.max(VideoEntry.video_number), first - 1)
+        ).where(
+            VideoEntry.user_id == user_id,
+            VideoEntry.platform == platform,
+            VideoEntry.video_number.between(first, last),
+        ).scalar_subquery()
+        await session.execute(
+            update(VideoStats).where(
+                VideoStats.user_id == user_id,
+                VideoStats.platform == platform,
+                VideoStats.last_video_number == last,
+            ).values(last_video_number=highest)
+        )
+
+    @classmethod
+    async def reserve_number(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        platform: Platform,
+        video_number: int,
+    ) -> None:
+        """
+        Move the counter past a number chosen by the client
+        """
+        stmt = cls.upsert(session).values(
+            user_id=user_id,
+            platform=platform,
+            last_video_number=video_number,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VideoStats.user_id, VideoStats.platform],
+            set_={
+                "last_video_number": case(
+                    (
+                        VideoStats.last_video_number < video_number,
+                        video_number,
+                    ),
+                    else_=VideoStats.last_video_number,
+                )
+            },
+        )
+        await session.execute(stmt)
+
+    @classmethod
+    async def rebuild(
+        cls,
+        session: AsyncSession,
+        user_id: UUID | None = None,
+    ) -> int:
+        """
+        Recompute stats rows from video_entries to repair drift
+        """
+        now = datetime.now(UTC)
+        source = select(
+            VideoEntry.user_id,
+            VideoEntry.platform,
+            func.count(),
+            func.max(VideoEntry.video_number),
+            func.max(VideoEntry.video_number),
+            func.min(VideoEntry.scheduled_time
+                     ).filter(VideoEntry.scheduled_time >= now),
+            literal(now, DateTime(timezone=True)),
+        ).group_by(VideoEntry.user_id, VideoEntry.platform)
+        clear = delete(VideoStats)
+
+        if user_id is not None:
+            source = source.where(VideoEntry.user_id == user_id)
+            clear = clear.where(VideoStats.user_id == user_id)
+
+        await session.execute(clear)
+        result = await session.execute(
+            insert(VideoStats).from_select(
+                [
+                    VideoStats.user_id,
+                    VideoStats.platform,
+                    VideoStats.entry_count,
+                    VideoStats.max_video_number,
+                    VideoStats.last_video_number,
+                    VideoStats.next_scheduled_time,
+                    VideoStats.updated_at,
+                ],
+                source,
+            )
+        )
+        await session.flush()
+        return result.rowcount or 0
+
+
+class VideoTombstoneRepository(BaseRepository[VideoTombstone]):
+    """
+    Repository for deleted entry records read by the delta sync feed
+    """
+    model = VideoTombstone
+
+    @classmethod
+    async def record(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        deleted: Sequence[tuple[UUID, Platform]],
+    ) -> None:
+        """
+        Record deleted entries with one multi row INSERT
+        """
+        if not deleted:
+            return
+        now = datetime.now(UTC)
+        await session.execute(
+            cls.upsert(session).values([
+                {
+                    "entry_id": entry_id,
+                    "user_id": user_id,
+                    "platform": platform,
+                    "deleted_at": now,
+                } for entry_id, platform in deleted
+            ]).on_conflict_do_nothing(
+                index_elements=[VideoTombstone.entry_id],
+            )
+        )
+
+    @classmethod
+    async def get_deleted(
+        cls,
+        session: AsyncSession,
+        user_id: UUID,
+        limit: int,
+        after: tuple[datetime, UUID | None],
+    ) -> Sequence[tuple[UUID, datetime]]:
+        """
+        Get tombstones after a sync position, oldest first
+        """
+        deleted_at, entry_id = after
+        query = select(
+            VideoTombstone.entry_id,
+            VideoTombstone.deleted_at,
+        ).where(VideoTombstone.user_id == user_id)
+        if entry_id is None:
+            query = query.where(VideoTombstone.deleted_at >= deleted_at)
+        else:
+            query = query.where(
+                tuple_(VideoTombstone.deleted_at, VideoTombstone.entry_id) >
+                after
+            )
+        result = await session.execute(
+            query.order_by(
+                VideoTombstone.deleted_at.asc(),
+                VideoTombstone.entry_id.asc(),
+            ).limit(limit)
+        )
+        return [(row.entry_id, row.deleted_at) for row in result]
+
+    @classmethod
+    async def prune(
+        cls,
+        session: AsyncSession,
+        before: datetime,
+    ) -> int:
+        """
+        Delete tombstones older than before
+        """
+        result = await session.execute(
+            delete(VideoTombstone).where(VideoTombstone.deleted_at < before)
+        )
+        return result.rowcount or 0
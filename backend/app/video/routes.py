@@ -4,101 +4,432 @@ routes.py
 """
 
 from uuid import UUID
+from datetime import datetime
 
 from fastapi import (
     APIRouter,
+    Depends,
+    Header,
     Query,
+    Request,
+    Response,
     status,
 )
+from fastapi.responses import StreamingResponse
 
-from config import Platform
-from core.dependencies import CurrentUser
+from config import (
+    VIDEO_SIMILAR_MIN_SCORE,
+    ExportFormat,
+    Platform,
+    ScheduleInterval,
+)
+from core.database import allow_db_writes
+from core.dependencies import AuthenticatedUser
+from core.etag import (
+    etag_matches,
+    not_modified,
+    set_etag,
+)
 from core.responses import (
     AUTH_401,
     NOT_FOUND_404,
+    NOT_MODIFIED_304,
 )
 from .schemas import (
+    BulkCopyRequest,
+    BulkCopyResponse,
     CopyToTargetRequest,
+    VideoChangesResponse,
+    VideoEntryBatchCreate,
+    VideoEntryBatchResponse,
+    VideoEntryBulkDelete,
+    VideoEntryBulkResponse,
+    VideoEntryBulkUpdate,
     VideoEntryCreate,
     VideoEntryListResponse,
     VideoEntryResponse,
+    VideoEntrySimilarResponse,
     VideoEntryUpdate,
+    VideoEntryWriteResponse,
+    VideoImportResponse,
+    VideoScheduleResponse,
+    VideoSearchResponse,
+    VideoStatsResponse,
 )
 from .dependencies import VideoServiceDep
 
 
 router = APIRouter(prefix="/videos", tags=["videos"])
 
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
 
 @router.post(
     "",
-    response_model=VideoEntryResponse,
+    response_model=VideoEntryWriteResponse,
     status_code=status.HTTP_201_CREATED,
     responses={**AUTH_401},
 )
 async def create_video_entry(
     video_service: VideoServiceDep,
-    current_user: CurrentUser,
+    current_user: AuthenticatedUser,
     data: VideoEntryCreate,
-) -> VideoEntryResponse:
+) -> VideoEntryWriteResponse:
     """
     Create a new video entry
+
+    duplicates lists entries on the same platform with a near identical
+    description
     """
     return await video_service.create_entry(current_user.id, data)
 
 
+@router.post(
+    "/batch",
+    response_model=VideoEntryBatchResponse,
+    responses={**AUTH_401},
+)
+async def create_video_entries(
+    video_service: VideoServiceDep,
+    current_user: AuthenticatedUser,
+    data: VideoEntryBatchCreate,
+) -> VideoEntryBatchResponse:
+    """
+    Create many video entries at once with a result per item
+    """
+    return await video_service.create_entries(current_user.id, data.items)
+
+
+@router.patch(
+    "/batch",
+    response_model=VideoEntryBulkResponse,
+    responses={**AUTH_401},
+)
+async def update_video_entries(
+    video_service: VideoServiceDep,
+    current_user: AuthenticatedUser,
+    data: VideoEntryBulkUpdate,
+) -> VideoEntryBulkResponse:
+    """
+    Apply the same change to many video entries with a result per id
+    """
+    return await video_service.update_entries(current_user.id, data)
+
+
+@router.post(
+    "/batch/delete",
+    response_model=VideoEntryBulkResponse,
+    responses={**AUTH_401},
+)
+async def delete_video_entries(
+    video_service: VideoServiceDep,
+    current_user: AuthenticatedUser,
+    data: VideoEntryBulkDelete,
+) -> VideoEntryBulkResponse:
+    """
+    Delete many video entries with a result per id
+    """
+    return await video_service.delete_entries(current_user.id, data.ids)
+
+
+@router.post(
+    "/copy",
+    response_model=BulkCopyResponse,
+    responses={**AUTH_401},
+)
+async def copy_video_entries(
+    video_service: VideoServiceDep,
+    current_user: AuthenticatedUser,
+    data: BulkCopyRequest,
+) -> BulkCopyResponse:
+    """
+    Copy many video entries to another platform in one statement
+    """
+    return await video_service.copy_many_to_platform(current_user.id, data)
+
+
+@router.post(
+    "/import",
+    response_model=VideoImportResponse,
+    responses={**AUTH_401},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {},
+                "text/csv": {},
+            },
+        },
+    },
+)
+async def import_video_entries(
+    request: Request,
+    video_service: VideoServiceDep,
+    current_user: AuthenticatedUser,
+    import_format: ExportFormat = Query(
+        default=ExportFormat.NDJSON,
+        alias="format",
+    ),
+) -> VideoImportResponse:
+    """
+    Import entries from an NDJSON or CSV request body
+
+    The body is parsed as it is received and written in batches, the
+    same columns as the export are accepted. Leave video_number empty
+    to number entries automatically. Rejected lines are listed by line
+    number and do not stop the import
+    """
+    return await video_service.import_entries(
+        current_user.id,
+        request.stream(),
+        import_format=import_format,
+    )
+
+
 @router.get(
     "",
     response_model=VideoEntryListResponse,
-    responses={**AUTH_401},
+    responses={**AUTH_401, **NOT_MODIFIED_304},
 )
 async def list_video_entries(
     video_service: VideoServiceDep,
-    current_user: CurrentUser,
+    current_user: AuthenticatedUser,
     platform: Platform | None = Query(default=None),
     page: int = Query(default=1, ge=1),
     size: int = Query(default=20, ge=1, le=100),
-) -> VideoEntryListResponse:
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=False),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
     """
     List video entries with optional platform filter
+
+    Pass the next_cursor of a previous page as cursor to keep paging
+    without OFFSET, page is ignored when a cursor is given. total is only
+    counted when include_total is set, use has_more to drive scrolling.
+    A matching If-None-Match returns 304 without loading any entry. The
+    body is serialized from column rows, response_model only documents
+    its shape
+    """
+    etag = await video_service.get_list_etag(
+        current_user.id,
+        platform,
+        page,
+        size,
+        cursor,
+        include_total,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    response = Response(
+        await video_service.list_entries(
+            current_user.id,
+            platform=platform,
+            page=page,
+            size=size,
+            cursor=cursor,
+            include_total=include_total,
+        ),
+        media_type="application/json",
+    )
+    set_etag(response, etag)
+    return response
+
+
+@router.get(
+    "/search",
+    response_model=VideoSearchResponse,
+    responses={**AUTH_401},
+)
+async def search_video_entries(
+    video_service: VideoServiceDep,
+    current_user: AuthenticatedUser,
+    q: str = Query(min_length=1, max_length=200),
+    platform: Platform | None = Query(default=None),
+    size: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+) -> VideoSearchResponse:
+    """
+    Search descriptions by wording, best match first
+
+    q accepts web search syntax, "quoted phrases", or and -excluded
+    words. Pass next_cursor back as cursor for the next page
     """
-    return await video_service.list_entries(
+    return await video_service.search_entries(
         current_user.id,
+        q,
         platform=platform,
-        page=page,
         size=size,
+        cursor=cursor,
     )
 
 
+@router.get(
+    "/schedule",
+    response_model=VideoScheduleResponse,
+    responses={**AUTH_401},
+)
+async def get_video_schedule(
+    video_service: VideoServiceDep,
+    current_user: AuthenticatedUser,
+    start: datetime = Query(alias="from"),
+    end: datetime = Query(alias="to"),
+    tz: str = Query(default="UTC", max_length=64),
+    interval: ScheduleInterval = Query(default=ScheduleInterval.DAY),
+    platform: Platform | None = Query(default=None),
+) -> VideoScheduleResponse:
+    """
+    Calendar of entries scheduled between from and to
+
+    tz is an IANA zone name used for day and hour buckets and for naive
+    from and to values, counts are computed in the database
+    """
+    return await video_service.get_schedule(
+        current_user.id,
+        start,
+        end,
+        tz=tz,
+        interval=interval,
+        platform=platform,
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        **AUTH_401,
+        200: {
+            "content": {
+                "application/x-ndjson": {},
+                "text/csv": {},
+            },
+        },
+    },
+)
+async def export_video_entries(
+    video_service: VideoServiceDep,
+    current_user: AuthenticatedUser,
+    export_format: ExportFormat = Query(
+        default=ExportFormat.NDJSON,
+        alias="format",
+    ),
+    platform: Platform | None = Query(default=None),
+) -> StreamingResponse:
+    """
+    Download every entry as NDJSON or CSV
+
+    The file is streamed from a database cursor in batches, so large
+    libraries export without being held in memory
+    """
+    media_type = EXPORT_MEDIA_TYPES[export_format]
+    filename = f"video-entries.{export_format.value}"
+    return StreamingResponse(
+        video_service.export_entries(
+            current_user.id,
+            export_format=export_format,
+            platform=platform,
+        ),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        },
+    )
+
+
+@router.get(
+    "/changes",
+    response_model=VideoChangesResponse,
+    responses={**AUTH_401},
+)
+async def get_video_changes(
+    video_service: VideoServiceDep,
+    current_user: AuthenticatedUser,
+    since: str | None = Query(default=None),
+    size: int = Query(default=100, ge=1, le=500),
+) -> VideoChangesResponse:
+    """
+    Delta sync feed of entries changed and ids deleted since a token
+
+    Omit since for a full snapshot, then pass back next_token to receive
+    only what changed. reset means the local store must be replaced
+    """
+    return await video_service.get_changes(
+        current_user.id,
+        since=since,
+        size=size,
+    )
+
+
+@router.get(
+    "/stats",
+    response_model=VideoStatsResponse,
+    responses={**AUTH_401},
+    dependencies=[Depends(allow_db_writes)],
+)
+async def get_video_stats(
+    video_service: VideoServiceDep,
+    current_user: AuthenticatedUser,
+) -> VideoStatsResponse:
+    """
+    Get entry counts, highest video number and next scheduled time
+    per platform
+
+    Read write, a next scheduled time that has passed is recomputed and
+    stored
+    """
+    return await video_service.get_stats(current_user.id)
+
+
 @router.get(
     "/{entry_id}",
     response_model=VideoEntryResponse,
-    responses={**AUTH_401, **NOT_FOUND_404},
+    responses={**AUTH_401, **NOT_FOUND_404, **NOT_MODIFIED_304},
 )
 async def get_video_entry(
     video_service: VideoServiceDep,
-    current_user: CurrentUser,
+    current_user: AuthenticatedUser,
     entry_id: UUID,
-) -> VideoEntryResponse:
+    if_none_match: str | None = Header(default=None),
+) -> Response:
     """
     Get a video entry by ID
+
+    A matching If-None-Match returns 304 after reading only updated_at.
+    The body is serialized from a column row, response_model only
+    documents its shape
     """
-    return await video_service.get_entry(entry_id, current_user.id)
+    if if_none_match:
+        etag = await video_service.get_entry_etag(entry_id, current_user.id)
+        if etag and etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    body, etag = await video_service.get_entry(entry_id, current_user.id)
+    response = Response(body, media_type="application/json")
+    set_etag(response, etag)
+    return response
 
 
 @router.patch(
     "/{entry_id}",
-    response_model=VideoEntryResponse,
+    response_model=VideoEntryWriteResponse,
     responses={**AUTH_401, **NOT_FOUND_404},
 )
 async def update_video_entry(
     video_service: VideoServiceDep,
-    current_user: CurrentUser,
+    current_user: AuthenticatedUser,
     entry_id: UUID,
     data: VideoEntryUpdate,
-) -> VideoEntryResponse:
+) -> VideoEntryWriteResponse:
     """
     Update a video entry
+
+    duplicates lists entries on the same platform with a near identical
+    description when the description changed
     """
     return await video_service.update_entry(entry_id, current_user.id, data)
 
@@ -110,7 +441,7 @@ async def update_video_entry(
 )
 async def delete_video_entry(
     video_service: VideoServiceDep,
-    current_user: CurrentUser,
+    current_user: AuthenticatedUser,
     entry_id: UUID,
 ) -> None:
     """
@@ -119,6 +450,37 @@ async def delete_video_entry(
     await video_service.delete_entry(entry_id, current_user.id)
 
 
+@router.get(
+    "/{entry_id}/similar",
+    response_model=VideoEntrySimilarResponse,
+    responses={**AUTH_401, **NOT_FOUND_404},
+)
+async def get_similar_video_entries(
+    video_service: VideoServiceDep,
+    current_user: AuthenticatedUser,
+    entry_id: UUID,
+    platform: Platform | None = Query(default=None),
+    limit: int = Query(default=10, ge=1, le=50),
+    min_score: float = Query(
+        default=VIDEO_SIMILAR_MIN_SCORE,
+        ge=VIDEO_SIMILAR_MIN_SCORE,
+        le=1.0,
+    ),
+) -> VideoEntrySimilarResponse:
+    """
+    Find entries whose description is similar to this one
+
+    Scores are pg_trgm trigram similarity from 0 to 1, closest first
+    """
+    return await video_service.find_similar(
+        entry_id,
+        current_user.id,
+        limit=limit,
+        min_score=min_score,
+        platform=platform,
+    )
+
+
 @router.post(
     "/{entry_id}/copy",
     response_model=VideoEntryResponse,
@@ -127,7 +489,7 @@ async def delete_video_entry(
 )
 async def copy_video_entry(
     video_service: VideoServiceDep,
-    current_user: CurrentUser,
+    current_user: AuthenticatedUser,
     entry_id: UUID,
     data: CopyToTargetRequest,
 ) -> VideoEntryResponse:
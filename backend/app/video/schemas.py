@@ -3,11 +3,18 @@
 schemas.py
 """
 
+from uuid import UUID
 from datetime import datetime
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter, model_validator
+from typing_extensions import TypedDict
 
-from config import Platform
+from config import (
+    VIDEO_BATCH_MAX_ITEMS,
+    BatchItemStatus,
+    Platform,
+    ScheduleInterval,
+)
 from core.base_schema import (
     BaseSchema,
     BaseResponseSchema,
@@ -17,14 +24,26 @@ from core.base_schema import (
 class VideoEntryCreate(BaseSchema):
     """
     Schema for creating a video entry
+
+    Leave video_number empty to get the next free number for the platform
     """
     platform: Platform
-    video_number: int = Field(ge=1)
+    video_number: int | None = Field(default=None, ge=1)
     description: str = ""
     youtube_description: str | None = None
     scheduled_time: datetime | None = None
 
 
+class VideoEntryBatchCreate(BaseSchema):
+    """
+    Schema for creating many video entries in one request
+    """
+    items: list[VideoEntryCreate] = Field(
+        min_length=1,
+        max_length=VIDEO_BATCH_MAX_ITEMS,
+    )
+
+
 class VideoEntryUpdate(BaseSchema):
     """
     Schema for updating a video entry
@@ -35,6 +54,32 @@ class VideoEntryUpdate(BaseSchema):
     video_number: int | None = Field(default=None, ge=1)
 
 
+class VideoEntryBulkUpdate(BaseSchema):
+    """
+    Schema for applying the same change to many video entries
+    """
+    ids: list[UUID] = Field(min_length=1, max_length=VIDEO_BATCH_MAX_ITEMS)
+    description: str | None = None
+    youtube_description: str | None = None
+    scheduled_time: datetime | None = None
+
+    @model_validator(mode="after")
+    def validate_has_changes(self) -> "VideoEntryBulkUpdate":
+        """
+        At least one field besides ids must be set
+        """
+        if not self.model_fields_set - {"ids"}:
+            raise ValueError("No fields to update")
+        return self
+
+
+class VideoEntryBulkDelete(BaseSchema):
+    """
+    Schema for deleting many video entries
+    """
+    ids: list[UUID] = Field(min_length=1, max_length=VIDEO_BATCH_MAX_ITEMS)
+
+
 class VideoEntryResponse(BaseResponseSchema):
     """
     Schema for video entry API responses
@@ -46,14 +91,200 @@ class VideoEntryResponse(BaseResponseSchema):
     scheduled_time: datetime | None
 
 
+class VideoEntryMatch(BaseSchema):
+    """
+    Schema for an entry with its description similarity score
+    """
+    entry: VideoEntryResponse
+    score: float
+
+
+class VideoEntryWriteResponse(VideoEntryResponse):
+    """
+    Schema for a created or updated entry with near duplicate captions
+    """
+    duplicates: list[VideoEntryMatch] = []
+
+
+class VideoEntrySimilarResponse(BaseSchema):
+    """
+    Schema for entries with similar descriptions, closest first
+    """
+    items: list[VideoEntryMatch]
+
+
 class VideoEntryListResponse(BaseSchema):
     """
     Schema for paginated video entry list
     """
     items: list[VideoEntryResponse]
-    total: int
+    total: int | None = None
+    page: int
+    size: int
+    has_more: bool
+    next_cursor: str | None = None
+
+
+class VideoEntryRow(TypedDict):
+    """
+    Plain column row with the same JSON shape as VideoEntryResponse
+    """
+    id: UUID
+    created_at: datetime
+    updated_at: datetime | None
+    platform: Platform
+    video_number: int
+    description: str
+    youtube_description: str | None
+    scheduled_time: datetime | None
+
+
+class VideoEntryPage(TypedDict):
+    """
+    Plain dict with the same JSON shape as VideoEntryListResponse
+    """
+    items: list[VideoEntryRow]
+    total: int | None
     page: int
     size: int
+    has_more: bool
+    next_cursor: str | None
+
+
+VIDEO_ENTRY_JSON = TypeAdapter(VideoEntryRow)
+VIDEO_ENTRY_PAGE_JSON = TypeAdapter(VideoEntryPage)
+
+
+class VideoSearchResponse(BaseSchema):
+    """
+    Schema for a page of full text search hits, best match first
+    """
+    items: list[VideoEntryResponse]
+    size: int
+    has_more: bool
+    next_cursor: str | None = None
+
+
+class VideoScheduleBucket(BaseSchema):
+    """
+    Schema for the entry count of one day or hour of the calendar
+    """
+    start: datetime
+    count: int
+
+
+class VideoScheduleResponse(BaseSchema):
+    """
+    Schema for entries and bucket counts of a calendar range
+    """
+    start: datetime
+    end: datetime
+    tz: str
+    interval: ScheduleInterval
+    buckets: list[VideoScheduleBucket]
+    entries: list[VideoEntryResponse]
+    truncated: bool
+
+
+class VideoChangesResponse(BaseSchema):
+    """
+    Schema for a page of the delta sync feed
+    """
+    upserted: list[VideoEntryResponse]
+    deleted: list[UUID]
+    next_token: str
+    has_more: bool
+    reset: bool = False
+
+
+class BulkCopyRequest(BaseSchema):
+    """
+    Schema for copying many video entries to another platform
+
+    Select sources either by entry_ids or by source_platform, optionally
+    limited to numbers above after_video_number
+    """
+    target_platform: Platform
+    shorten_for_youtube: bool = True
+    entry_ids: list[UUID] | None = Field(
+        default=None,
+        min_length=1,
+        max_length=VIDEO_BATCH_MAX_ITEMS,
+    )
+    source_platform: Platform | None = None
+    after_video_number: int | None = Field(default=None, ge=0)
+
+    @model_validator(mode="after")
+    def validate_selection(self) -> "BulkCopyRequest":
+        """
+        Exactly one way of selecting source entries
+        """
+        if (self.entry_ids is None) == (self.source_platform is None):
+            raise ValueError("Provide either entry_ids or source_platform")
+        if self.after_video_number is not None and self.source_platform is None:
+            raise ValueError("after_video_number requires source_platform")
+        return self
+
+
+class BulkCopyResponse(BaseSchema):
+    """
+    Schema for bulk copy results
+    """
+    copied: int
+    first_video_number: int | None = None
+    last_video_number: int | None = None
+
+
+class VideoEntryBatchResult(BaseSchema):
+    """
+    Schema for the outcome of one item in a bulk request
+    """
+    index: int
+    status: BatchItemStatus
+    entry: VideoEntryResponse | None = None
+    detail: str | None = None
+
+
+class VideoEntryBatchResponse(BaseSchema):
+    """
+    Schema for bulk create results, in request order
+    """
+    results: list[VideoEntryBatchResult]
+    created: int
+
+
+class VideoImportError(BaseSchema):
+    """
+    Schema for one rejected line of an import
+    """
+    line: int
+    detail: str
+
+
+class VideoImportResponse(BaseSchema):
+    """
+    Schema for import results, errors hold the first rejected lines
+    """
+    imported: int
+    failed: int
+    errors: list[VideoImportError]
+
+
+class VideoEntryBulkResult(BaseSchema):
+    """
+    Schema for the outcome of one id in a bulk update or delete
+    """
+    id: UUID
+    status: BatchItemStatus
+    entry: VideoEntryResponse | None = None
+
+
+class VideoEntryBulkResponse(BaseSchema):
+    """
+    Schema for bulk update and delete results, in request order
+    """
+    results: list[VideoEntryBulkResult]
+    affected: int
 
 
 class CopyToTargetRequest(BaseSchema):
@@ -62,3 +293,53 @@ class CopyToTargetRequest(BaseSchema):
     """
     target_platform: Platform
     shorten_for_youtube: bool = True
+
+
+class PlatformStatsResponse(BaseSchema):
+    """
+    Schema for one platform's video statistics
+    """
+    platform: Platform
+    entry_count: int = 0
+    max_video_number: int = 0
+    next_scheduled_time: datetime | None = None
+
+
+class VideoStatsResponse(BaseSchema):
+    """
+    Schema for a user's video statistics across platforms
+    """
+    platforms: list[PlatformStatsResponse]
+    total_entries: int
+
+
+class VideoStatsRebuildResponse(BaseSchema):
+    """
+    Schema for the admin stats rebuild result
+    """
+    rebuilt: int
+
+
+class VideoBackfillResponse(BaseSchema):
+    """
+    Schema for a YouTube description backfill run
+
+    next_cursor is set when entries may remain, pass it back as cursor
+    """
+    updated: int
+    next_cursor: str | None = None
+
+
+class DescriptionCollectResponse(BaseSchema):
+    """
+    Schema for a description garbage collection run
+    """
+    recounted: int
+    deleted: int
+
+
+class VideoTombstonePruneResponse(BaseSchema):
+    """
+    Schema for a tombstone prune result
+    """
+    pruned: int
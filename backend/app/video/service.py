@@ -3,20 +3,92 @@
 service.py
 """
 
+import io
+import re
+import csv
+import codecs
+import hashlib
+from typing import Any
 from uuid import UUID
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from config import Platform
-from core.exceptions import NotFoundError
+from config import (
+    VIDEO_BACKFILL_BATCH_SIZE,
+    VIDEO_BACKFILL_MAX_ROWS,
+    VIDEO_DUPLICATE_MAX_MATCHES,
+    VIDEO_DUPLICATE_MIN_SCORE,
+    VIDEO_EXPORT_BATCH_SIZE,
+    VIDEO_IMPORT_BATCH_SIZE,
+    VIDEO_IMPORT_MAX_ERRORS,
+    VIDEO_SCHEDULE_MAX_DAYS,
+    VIDEO_SCHEDULE_MAX_ENTRIES,
+    VIDEO_SIMILAR_MIN_SCORE,
+    BatchItemStatus,
+    ExportFormat,
+    Platform,
+    ScheduleInterval,
+    settings,
+)
+from core.exceptions import (
+    ConflictError,
+    NotFoundError,
+    ValidationError,
+)
+from core.etag import weak_etag
+from core.pagination import decode_cursor, encode_cursor
 from .VideoEntry import VideoEntry
-from .repository import VideoEntryRepository
+from .repository import (
+    DescriptionRepository,
+    VideoEntryRepository,
+    VideoStatsRepository,
+    VideoTombstoneRepository,
+)
 from .schemas import (
+    VIDEO_ENTRY_JSON,
+    VIDEO_ENTRY_PAGE_JSON,
+    BulkCopyRequest,
+    BulkCopyResponse,
+    DescriptionCollectResponse,
+    PlatformStatsResponse,
+    VideoChangesResponse,
+    VideoBackfillResponse,
+    VideoEntryBatchResponse,
+    VideoEntryBatchResult,
+    VideoEntryBulkResponse,
+    VideoEntryBulkResult,
+    VideoEntryBulkUpdate,
     VideoEntryCreate,
     VideoEntryUpdate,
     VideoEntryResponse,
-    VideoEntryListResponse,
+    VideoEntryMatch,
+    VideoEntrySimilarResponse,
+    VideoEntryWriteResponse,
+    VideoImportError,
+    VideoImportResponse,
+    VideoScheduleBucket,
+    VideoScheduleResponse,
+    VideoSearchResponse,
+    VideoStatsResponse,
+)
+
+
+ZWJ = "\u200d"
+
+EMOJI_JOINER = re.compile(
+    r"[\u200d\ufe0e\ufe0f\u20e3\u0300-\u036f"
+    r"\U0001f3fb-\U0001f3ff\U000e0020-\U000e007f]"
 )
+PARTIAL_WORD = re.compile(r"\s+\S*$")
+TRAILING_JUNK = re.compile(r"[\s#@,;:.-]+$")
+
+SyncPosition = tuple[datetime, UUID | None]
 
 
 class VideoEntryService:
@@ -30,54 +102,395 @@ class VideoEntryService:
         self,
         user_id: UUID,
         data: VideoEntryCreate,
-    ) -> VideoEntryResponse:
+    ) -> VideoEntryWriteResponse:
         """
-        Create a new video entry
+        Create a new video entry, reporting near duplicate captions
         """
         video_number = data.video_number
-        if video_number == 0:
-            video_number = await VideoEntryRepository.get_next_video_number(
+        if video_number is None:
+            video_number = await VideoStatsRepository.allocate_numbers(
                 self.session,
                 user_id,
                 data.platform,
             )
+        else:
+            await VideoStatsRepository.reserve_number(
+                self.session,
+                user_id,
+                data.platform,
+                video_number,
+            )
 
-        entry = await VideoEntryRepository.create(
+        try:
+            entry = await VideoEntryRepository.create(
+                self.session,
+                user_id=user_id,
+                platform=data.platform,
+                video_number=video_number,
+                description=data.description,
+                youtube_description=data.youtube_description,
+                scheduled_time=data.scheduled_time,
+            )
+        except IntegrityError as e:
+            raise self._number_taken(data.platform, video_number) from e
+        await VideoStatsRepository.refresh(
             self.session,
-            user_id=user_id,
-            platform=data.platform,
-            video_number=video_number,
-            description=data.description,
-            youtube_description=data.youtube_description,
-            scheduled_time=data.scheduled_time,
+            user_id,
+            data.platform,
+            count_delta=1,
+        )
+        return await self._with_duplicates(entry)
+
+    async def create_entries(
+        self,
+        user_id: UUID,
+        items: list[VideoEntryCreate],
+    ) -> VideoEntryBatchResponse:
+        """
+        Create many video entries in one round of statements
+        """
+        numbers = await self._assign_numbers(user_id, items)
+
+        rows = []
+        first_index: dict[tuple[Platform, int], int] = {}
+        for index, item in enumerate(items):
+            key = (item.platform, numbers[index])
+            if key in first_index:
+                continue
+            first_index[key] = index
+            rows.append({
+                "platform": item.platform,
+                "video_number": numbers[index],
+                "description": item.description,
+                "youtube_description": item.youtube_description,
+                "scheduled_time": item.scheduled_time,
+            })
+
+        inserted = await VideoEntryRepository.create_many(
+            self.session,
+            user_id,
+            rows,
+        )
+        created = {(e.platform, e.video_number): e for e in inserted}
+
+        for platform in {e.platform for e in inserted}:
+            await VideoStatsRepository.refresh(
+                self.session,
+                user_id,
+                platform,
+                count_delta=sum(1 for e in inserted if e.platform == platform),
+            )
+
+        results = []
+        for index, item in enumerate(items):
+            key = (item.platform, numbers[index])
+            entry = created.get(key)
+            if entry is not None and first_index[key] == index:
+                results.append(
+                    VideoEntryBatchResult(
+                        index=index,
+                        status=BatchItemStatus.CREATED,
+                        entry=VideoEntryResponse.model_validate(entry),
+                    )
+                )
+            else:
+                results.append(
+                    VideoEntryBatchResult(
+                        index=index,
+                        status=BatchItemStatus.CONFLICT,
+                        detail=self._number_taken(*key).message,
+                    )
+                )
+
+        return VideoEntryBatchResponse(
+            results=results,
+            created=len(inserted),
+        )
+
+    async def _assign_numbers(
+        self,
+        user_id: UUID,
+        items: Sequence[VideoEntryCreate],
+    ) -> list[int]:
+        """
+        Resolve the video number of every item, in order
+        """
+        numbers = [item.video_number or 0 for item in items]
+        by_platform: dict[Platform, list[int]] = {}
+        for index, item in enumerate(items):
+            by_platform.setdefault(item.platform, []).append(index)
+
+        for platform, indexes in by_platform.items():
+            explicit = [
+                number for i in indexes
+                if (number := items[i].video_number) is not None
+            ]
+            if explicit:
+                await VideoStatsRepository.reserve_number(
+                    self.session,
+                    user_id,
+                    platform,
+                    max(explicit),
+                )
+            auto = [i for i in indexes if items[i].video_number is None]
+            if auto:
+                first = await VideoStatsRepository.allocate_numbers(
+                    self.session,
+                    user_id,
+                    platform,
+                    count=len(auto),
+                )
+                for offset, i in enumerate(auto):
+                    numbers[i] = first + offset
+        return numbers
+
+    async def import_entries(
+        self,
+        user_id: UUID,
+        chunks: AsyncIterator[bytes],
+        import_format: ExportFormat = ExportFormat.NDJSON,
+    ) -> VideoImportResponse:
+        """
+        Import entries from an NDJSON or CSV upload as it streams in
+        """
+        report = VideoImportResponse(imported=0, failed=0, errors=[])
+        batch: list[tuple[int, VideoEntryCreate]] = []
+
+        lines = self._read_lines(chunks)
+        records: AsyncIterator[tuple[int, str | dict[str, str]]] = (
+            self._read_csv_records(lines)
+            if import_format == ExportFormat.CSV else lines
+        )
+        async for line, record in records:
+            if isinstance(record, str) and not record.strip():
+                continue
+            try:
+                item = (
+                    VideoEntryCreate.model_validate_json(record)
+                    if isinstance(record, str) else
+                    VideoEntryCreate.model_validate(record)
+                )
+            except PydanticValidationError as e:
+                self._report_error(report, line, self._describe(e))
+                continue
+            batch.append((line, item))
+            if len(batch) >= VIDEO_IMPORT_BATCH_SIZE:
+                await self._import_batch(user_id, batch, report)
+                batch = []
+
+        await self._import_batch(user_id, batch, report)
+        report.errors.sort(key=lambda e: e.line)
+        return report
+
+    async def _import_batch(
+        self,
+        user_id: UUID,
+        batch: list[tuple[int, VideoEntryCreate]],
+        report: VideoImportResponse,
+    ) -> None:
+        """
+        Number and bulk insert one batch of validated import lines
+        """
+        if not batch:
+            return
+        items = [item for _, item in batch]
+        numbers = await self._assign_numbers(user_id, items)
+
+        rows = []
+        first_line: dict[tuple[Platform, int], int] = {}
+        for (line, item), number in zip(batch, numbers):
+            key = (item.platform, number)
+            if key in first_line:
+                continue
+            first_line[key] = line
+            rows.append({
+                "platform": item.platform,
+                "video_number": number,
+                "description": item.description,
+                "youtube_description": item.youtube_description,
+                "scheduled_time": item.scheduled_time,
+            })
+
+        inserted = await VideoEntryRepository.import_many(
+            self.session,
+            user_id,
+            rows,
+        )
+        for platform in {platform for platform, _ in inserted}:
+            await VideoStatsRepository.refresh(
+                self.session,
+                user_id,
+                platform,
+                count_delta=sum(1 for p, _ in inserted if p == platform),
+            )
+
+        report.imported += len(inserted)
+        for (line, item), number in zip(batch, numbers):
+            key = (item.platform, number)
+            if key not in inserted or first_line[key] != line:
+                self._report_error(
+                    report,
+                    line,
+                    self._number_taken(*key).message,
+                )
+
+    @staticmethod
+    async def _read_lines(
+        chunks: AsyncIterator[bytes],
+    ) -> AsyncIterator[tuple[int, str]]:
+        """
+        Split a byte stream into numbered text lines as it arrives
+        """
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        pending = ""
+        line = 0
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *complete, pending = pending.split("\n")
+            for text in complete:
+                line += 1
+                yield line, text.removesuffix("\r")
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield line + 1, pending.removesuffix("\r")
+
+    @staticmethod
+    async def _join_csv_lines(
+        lines: AsyncIterator[tuple[int, str]],
+    ) -> AsyncIterator[tuple[int, str]]:
+        """
+        Join lines into CSV records, a quoted cell may span several lines
+        """
+        start = 0
+        parts: list[str] = []
+        async for line, text in lines:
+            if not parts:
+                start = line
+            parts.append(text)
+            if sum(part.count('"') for part in parts) % 2 == 0:
+                yield start, "\n".join(parts)
+                parts = []
+        if parts:
+            yield start, "\n".join(parts)
+
+    @classmethod
+    async def _read_csv_records(
+        cls,
+        lines: AsyncIterator[tuple[int, str]],
+    ) -> AsyncIterator[tuple[int, dict[str, str]]]:
+        """
+        Parse numbered lines as CSV rows keyed by the header row
+        """
+        header: list[str] | None = None
+        async for line, record in cls._join_csv_lines(lines):
+            if not record.strip():
+                continue
+            values = next(csv.reader([record]))
+            if header is None:
+                header = [name.strip() for name in values]
+                if "platform" not in header:
+                    raise ValidationError(
+                        "CSV header must include a platform column",
+                        field="format",
+                    )
+                continue
+            yield line, {
+                name: value
+                for name, value in zip(header, values)
+                if value != ""
+            }
+
+    @staticmethod
+    def _report_error(
+        report: VideoImportResponse,
+        line: int,
+        detail: str,
+    ) -> None:
+        """
+        Count a failed line, keeping the first VIDEO_IMPORT_MAX_ERRORS
+        """
+        report.failed += 1
+        if len(report.errors) < VIDEO_IMPORT_MAX_ERRORS:
+            report.errors.append(VideoImportError(line=line, detail=detail))
+
+    @staticmethod
+    def _describe(error: PydanticValidationError) -> str:
+        """
+        Flatten a pydantic error into one readable message
+        """
+        return "; ".join(
+            f"{'.'.join(str(p) for p in e['loc']) or 'line'}: {e['msg']}"
+            for e in error.errors()
         )
-        return VideoEntryResponse.model_validate(entry)
 
     async def get_entry(
         self,
         entry_id: UUID,
         user_id: UUID,
-    ) -> VideoEntryResponse:
+    ) -> tuple[bytes, str]:
         """
-        Get a video entry by ID
+        Get a video entry by ID as response JSON along with its ETag
         """
-        entry = await VideoEntryRepository.get_by_id_and_user(
+        entry = await VideoEntryRepository.get_row_by_id_and_user(
             self.session,
             entry_id,
             user_id,
         )
         if not entry:
             raise NotFoundError("Video entry not found")
-        return VideoEntryResponse.model_validate(entry)
+        return (
+            VIDEO_ENTRY_JSON.dump_json(self._row_dicts([entry])[0]),
+            self.entry_etag(entry),
+        )
+
+    async def get_entry_etag(
+        self,
+        entry_id: UUID,
+        user_id: UUID,
+    ) -> str | None:
+        """
+        ETag of an entry read without loading the row, None if missing
+        """
+        updated_at = await VideoEntryRepository.get_updated_at(
+            self.session,
+            entry_id,
+            user_id,
+        )
+        if updated_at is None:
+            return None
+        return weak_etag(entry_id, updated_at)
+
+    @staticmethod
+    def entry_etag(entry: VideoEntryResponse | Row[Any]) -> str:
+        """
+        ETag of an already loaded entry
+        """
+        return weak_etag(entry.id, entry.updated_at)
+
+    async def get_list_etag(
+        self,
+        user_id: UUID,
+        platform: Platform | None,
+        *params: object,
+    ) -> str:
+        """
+        ETag of a list view from the user's write version
+        """
+        version, updated_at = await VideoStatsRepository.get_version(
+            self.session,
+            user_id,
+            platform,
+        )
+        return weak_etag(user_id, version, updated_at, platform, *params)
 
     async def update_entry(
         self,
         entry_id: UUID,
         user_id: UUID,
         data: VideoEntryUpdate,
-    ) -> VideoEntryResponse:
+    ) -> VideoEntryWriteResponse:
         """
-        Update a video entry
+        Update a video entry, reporting near duplicate captions
         """
         entry = await VideoEntryRepository.get_by_id_and_user(
             self.session,
@@ -88,12 +501,96 @@ class VideoEntryService:
             raise NotFoundError("Video entry not found")
 
         update_dict = data.model_dump(exclude_unset=True)
-        updated = await VideoEntryRepository.update(
+        restats = bool(update_dict.keys() & {"video_number", "scheduled_time"})
+        if restats:
+            await VideoStatsRepository.lock(
+                self.session,
+                user_id,
+                [entry.platform],
+            )
+        video_number = update_dict.get("video_number")
+        if video_number is not None:
+            await VideoStatsRepository.reserve_number(
+                self.session,
+                user_id,
+                entry.platform,
+                video_number,
+            )
+        try:
+            updated = await VideoEntryRepository.update(
+                self.session,
+                entry,
+                **update_dict,
+            )
+        except IntegrityError as e:
+            if video_number is None:
+                raise
+            raise self._number_taken(entry.platform, video_number) from e
+        if restats:
+            await VideoStatsRepository.refresh(
+                self.session,
+                user_id,
+                updated.platform,
+            )
+        else:
+            await VideoStatsRepository.bump_version(
+                self.session,
+                user_id,
+                [updated.platform],
+            )
+        if "description" in update_dict:
+            return await self._with_duplicates(updated)
+        return VideoEntryWriteResponse.model_validate(updated)
+
+    async def find_similar(
+        self,
+        entry_id: UUID,
+        user_id: UUID,
+        limit: int = 10,
+        min_score: float = VIDEO_SIMILAR_MIN_SCORE,
+        platform: Platform | None = None,
+    ) -> VideoEntrySimilarResponse:
+        """
+        Find the user's entries with descriptions similar to an entry
+        """
+        entry = await VideoEntryRepository.get_by_id_and_user(
+            self.session,
+            entry_id,
+            user_id,
+        )
+        if not entry:
+            raise NotFoundError("Video entry not found")
+        matches = await VideoEntryRepository.find_similar(
             self.session,
-            entry,
-            **update_dict,
+            user_id,
+            entry.description,
+            limit=limit,
+            min_score=min_score,
+            platform=platform,
+            exclude_id=entry.id,
         )
-        return VideoEntryResponse.model_validate(updated)
+        return VideoEntrySimilarResponse(items=self._matches(matches))
+
+    async def _with_duplicates(
+        self,
+        entry: VideoEntry,
+    ) -> VideoEntryWriteResponse:
+        """
+        Serialize a written entry with near duplicates on its platform
+        """
+        response = VideoEntryWriteResponse.model_validate(entry)
+        if entry.description.strip():
+            matches = await VideoEntryRepository.find_similar(
+                self.session,
+                entry.user_id,
+                entry.description,
+                limit=VIDEO_DUPLICATE_MAX_MATCHES,
+                min_score=VIDEO_DUPLICATE_MIN_SCORE,
+                platform=entry.platform,
+                exclude_id=entry.id,
+            )
+            response.duplicates = self._matches(matches)
+        return response
 
     async def delete_entry(
         self,
@@ -110,7 +607,334 @@ class VideoEntryService:
         )
         if not entry:
             raise NotFoundError("Video entry not found")
+        platform = entry.platform
+        await VideoStatsRepository.lock(self.session, user_id, [platform])
         await VideoEntryRepository.delete(self.session, entry)
+        await VideoTombstoneRepository.record(
+            self.session,
+            user_id,
+            [(entry_id, platform)],
+        )
+        await VideoStatsRepository.refresh(
+            self.session,
+            user_id,
+            platform,
+            count_delta=-1,
+        )
+
+    async def update_entries(
+        self,
+        user_id: UUID,
+        data: VideoEntryBulkUpdate,
+    ) -> VideoEntryBulkResponse:
+        """
+        Apply the same change to many entries in a single UPDATE
+        """
+        ids = list(dict.fromkeys(data.ids))
+        changes = data.model_dump(exclude_unset=True, exclude={"ids"})
+        if "scheduled_time" in changes:
+            await VideoStatsRepository.lock(self.session, user_id)
+        updated = await VideoEntryRepository.update_many(
+            self.session,
+            user_id,
+            ids,
+            **changes,
+        )
+
+        platforms = list({e.platform for e in updated})
+        if "scheduled_time" in changes:
+            for platform in platforms:
+                await VideoStatsRepository.refresh(
+                    self.session,
+                    user_id,
+                    platform,
+                )
+        else:
+            await VideoStatsRepository.bump_version(
+                self.session,
+                user_id,
+                platforms,
+            )
+
+        by_id = {e.id: e for e in updated}
+        return VideoEntryBulkResponse(
+            results=[
+                VideoEntryBulkResult(
+                    id=entry_id,
+                    status=BatchItemStatus.UPDATED,
+                    entry=VideoEntryResponse.model_validate(by_id[entry_id]),
+                ) if entry_id in by_id else VideoEntryBulkResult(
+                    id=entry_id,
+                    status=BatchItemStatus.NOT_FOUND,
+                ) for entry_id in ids
+            ],
+            affected=len(updated),
+        )
+
+    async def delete_entries(
+        self,
+        user_id: UUID,
+        ids: list[UUID],
+    ) -> VideoEntryBulkResponse:
+        """
+        Delete many entries in a single DELETE
+        """
+        ids = list(dict.fromkeys(ids))
+        await VideoStatsRepository.lock(self.session, user_id)
+        deleted = await VideoEntryRepository.delete_many(
+            self.session,
+            user_id,
+            ids,
+        )
+        await VideoTombstoneRepository.record(self.session, user_id, deleted)
+
+        removed: dict[Platform, int] = {}
+        for _, platform in deleted:
+            removed[platform] = removed.get(platform, 0) + 1
+        for platform, count in removed.items():
+            await VideoStatsRepository.refresh(
+                self.session,
+                user_id,
+                platform,
+                count_delta=-count,
+            )
+
+        deleted_ids = {entry_id for entry_id, _ in deleted}
+        return VideoEntryBulkResponse(
+            results=[
+                VideoEntryBulkResult(
+                    id=entry_id,
+                    status=BatchItemStatus.DELETED
+                    if entry_id in deleted_ids else BatchItemStatus.NOT_FOUND,
+                ) for entry_id in ids
+            ],
+            affected=len(deleted),
+        )
+
+    async def search_entries(
+        self,
+        user_id: UUID,
+        query: str,
+        platform: Platform | None = None,
+        size: int = 20,
+        cursor: str | None = None,
+    ) -> VideoSearchResponse:
+        """
+        Ranked full text search over descriptions with keyset paging
+        """
+        after = self._decode_search_cursor(cursor) if cursor else None
+        hits = await VideoEntryRepository.search(
+            self.session,
+            user_id,
+            query,
+            limit=size + 1,
+            platform=platform,
+            after=after,
+        )
+        has_more = len(hits) > size
+        hits = hits[:size]
+
+        next_cursor = None
+        if has_more:
+            last, rank = hits[-1]
+            next_cursor = encode_cursor({"r": rank, "i": str(last.id)})
+
+        return VideoSearchResponse(
+            items=[VideoEntryResponse.model_validate(e) for e, _ in hits],
+            size=size,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        )
+
+    async def export_entries(
+        self,
+        user_id: UUID,
+        export_format: ExportFormat = ExportFormat.NDJSON,
+        platform: Platform | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream every entry as NDJSON lines or CSV rows
+        """
+        fields = list(VideoEntryResponse.model_fields)
+        if export_format == ExportFormat.CSV:
+            yield self._csv_chunk([fields])
+
+        async for rows in VideoEntryRepository.stream_by_user(
+                self.session,
+                user_id,
+                platform=platform,
+                batch_size=VIDEO_EXPORT_BATCH_SIZE,
+        ):
+            entries = [VideoEntryResponse.model_validate(r) for r in rows]
+            if export_format == ExportFormat.CSV:
+                yield self._csv_chunk(
+                    [
+                        [
+                            "" if value is None else value
+                            for value in e.model_dump(mode="json").values()
+                        ] for e in entries
+                    ]
+                )
+            else:
+                yield b"".join(
+                    e.model_dump_json().encode() + b"\n" for e in entries
+                )
+
+    @staticmethod
+    def _csv_chunk(rows: list[list[Any]]) -> bytes:
+        """
+        Encode rows as CSV text
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode()
+
+    async def get_schedule(
+        self,
+        user_id: UUID,
+        start: datetime,
+        end: datetime,
+        tz: str = "UTC",
+        interval: ScheduleInterval = ScheduleInterval.DAY,
+        platform: Platform | None = None,
+    ) -> VideoScheduleResponse:
+        """
+        Get entries scheduled in [start, end) with per bucket counts
+        """
+        try:
+            zone = ZoneInfo(tz)
+        except (ZoneInfoNotFoundError, ValueError) as e:
+            raise ValidationError("Unknown time zone", field="tz") from e
+
+        start = self._in_zone(start, zone).astimezone(UTC)
+        end = self._in_zone(end, zone).astimezone(UTC)
+        if end <= start:
+            raise ValidationError("to must be after from", field="to")
+        if end - start > timedelta(days=VIDEO_SCHEDULE_MAX_DAYS):
+            raise ValidationError(
+                f"Range cannot exceed {VIDEO_SCHEDULE_MAX_DAYS} days",
+                field="to",
+            )
+
+        buckets = await VideoEntryRepository.count_scheduled_by_bucket(
+            self.session,
+            user_id,
+            start,
+            end,
+            interval,
+            tz,
+            platform=platform,
+        )
+        entries = await VideoEntryRepository.get_scheduled(
+            self.session,
+            user_id,
+            start,
+            end,
+            limit=VIDEO_SCHEDULE_MAX_ENTRIES + 1,
+            platform=platform,
+        )
+
+        return VideoScheduleResponse(
+            start=start.astimezone(zone),
+            end=end.astimezone(zone),
+            tz=tz,
+            interval=interval,
+            buckets=[
+                VideoScheduleBucket(
+                    start=self._as_utc(bucket).astimezone(zone),
+                    count=count,
+                ) for bucket, count in buckets
+            ],
+            entries=[
+                VideoEntryResponse.model_validate(e)
+                for e in entries[:VIDEO_SCHEDULE_MAX_ENTRIES]
+            ],
+            truncated=len(entries) > VIDEO_SCHEDULE_MAX_ENTRIES,
+        )
+
+    async def get_changes(
+        self,
+        user_id: UUID,
+        since: str | None = None,
+        size: int = 100,
+    ) -> VideoChangesResponse:
+        """
+        Get entries changed and ids deleted since a sync token
+        """
+        after: SyncPosition | None = None
+        deleted_after: SyncPosition | None = None
+        caught_up: SyncPosition | None = None
+        deleted_caught_up: SyncPosition | None = None
+        reset = False
+        if since:
+            after, deleted_after, paging = self._decode_sync_token(since)
+            retention = timedelta(days=settings.VIDEO_TOMBSTONE_RETENTION_DAYS)
+            if min(after[0], deleted_after[0]) < datetime.now(UTC) - retention:
+                after = deleted_after = None
+                reset = True
+            elif not paging and settings.VIDEO_SYNC_OVERLAP_SECONDS:
+                caught_up, deleted_caught_up = after, deleted_after
+                after = self._rewind(after)
+                deleted_after = self._rewind(deleted_after)
+
+        entries = await VideoEntryRepository.get_changed(
+            self.session,
+            user_id,
+            limit=size + 1,
+            after=after,
+        )
+        entries_more = len(entries) > size
+        entries = entries[:size]
+
+        deleted: list[tuple[UUID, datetime]] = []
+        if deleted_after is not None:
+            deleted = list(
+                await VideoTombstoneRepository.get_deleted(
+                    self.session,
+                    user_id,
+                    limit=size + 1,
+                    after=deleted_after,
+                )
+            )
+        deleted_more = len(deleted) > size
+        deleted = deleted[:size]
+
+        now = (datetime.now(UTC), None)
+        position = self._sync_position(
+            entries_more,
+            [(self._as_utc(e.updated_at), e.id) for e in entries[-1:]],
+            caught_up or after or now,
+        )
+        deleted_position = self._sync_position(
+            deleted_more,
+            [(self._as_utc(at), entry_id) for entry_id, at in deleted[-1:]],
+            deleted_caught_up or deleted_after or now,
+        )
+        has_more = entries_more or deleted_more
+
+        return VideoChangesResponse(
+            upserted=[VideoEntryResponse.model_validate(e) for e in entries],
+            deleted=[entry_id for entry_id, _ in deleted],
+            next_token=encode_cursor({
+                "u": position[0].isoformat(),
+                "i": str(position[1]) if position[1] else None,
+                "d": deleted_position[0].isoformat(),
+                "t": str(deleted_position[1]) if deleted_position[1] else None,
+                "m": has_more,
+            }),
+            has_more=has_more,
+            reset=reset,
+        )
+
+    async def prune_tombstones(self) -> int:
+        """
+        Delete tombstones past the sync retention window
+        """
+        return await VideoTombstoneRepository.prune(
+            self.session,
+            datetime.now(UTC) -
+            timedelta(days=settings.VIDEO_TOMBSTONE_RETENTION_DAYS),
+        )
 
     async def list_entries(
         self,
@@ -118,11 +942,13 @@ class VideoEntryService:
         platform: Platform | None = None,
         page: int = 1,
         size: int = 20,
-    ) -> VideoEntryListResponse:
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> bytes:
         """
-        List video entries with optional platform filter
+        List video entries with optional platform filter as JSON
         """
-        skip = (page - 1) * size
+        skip = 0 if cursor else (page - 1) * size
 
         if platform:
             entries = await VideoEntryRepository.get_by_user_and_platform(
@@ -130,28 +956,39 @@ class VideoEntryService:
                 user_id,
                 platform,
                 skip=skip,
-                limit=size,
+                limit=size + 1,
+                after=self._decode_platform_cursor(cursor, platform)
+                if cursor else None,
             )
         else:
             entries = await VideoEntryRepository.get_by_user(
                 self.session,
                 user_id,
                 skip=skip,
-                limit=size,
+                limit=size + 1,
+                after=self._decode_created_cursor(cursor) if cursor else None,
             )
 
-        total = await VideoEntryRepository.count_by_user(
-            self.session,
-            user_id,
-            platform,
-        )
+        has_more = len(entries) > size
+        entries = entries[:size]
 
-        return VideoEntryListResponse(
-            items=[VideoEntryResponse.model_validate(e) for e in entries],
-            total=total,
-            page=page,
-            size=size,
-        )
+        total = None
+        if include_total:
+            total = await VideoStatsRepository.count_entries(
+                self.session,
+                user_id,
+                platform,
+            )
+
+        return VIDEO_ENTRY_PAGE_JSON.dump_json({
+            "items": self._row_dicts(entries),
+            "total": total,
+            "page": page,
+            "size": size,
+            "has_more": has_more,
+            "next_cursor": self._encode_list_cursor(entries[-1], platform)
+            if has_more else None,
+        })
 
     async def copy_to_platform(
         self,
@@ -171,7 +1008,7 @@ class VideoEntryService:
         if not source:
             raise NotFoundError("Video entry not found")
 
-        next_number = await VideoEntryRepository.get_next_video_number(
+        next_number = await VideoStatsRepository.allocate_numbers(
             self.session,
             user_id,
             target_platform,
@@ -193,12 +1030,360 @@ class VideoEntryService:
             youtube_description=youtube_desc if target_platform == Platform.YOUTUBE else None,
             scheduled_time=source.scheduled_time,
         )
+        await VideoStatsRepository.refresh(
+            self.session,
+            user_id,
+            target_platform,
+            count_delta=1,
+        )
         return VideoEntryResponse.model_validate(new_entry)
 
-    def _shorten_description(self, text: str, max_length: int = 100) -> str:
+    async def copy_many_to_platform(
+        self,
+        user_id: UUID,
+        data: BulkCopyRequest,
+    ) -> BulkCopyResponse:
+        """
+        Copy many video entries to another platform server side
+        """
+        conditions = VideoEntryRepository.copy_source_filter(
+            user_id,
+            entry_ids=data.entry_ids,
+            source_platform=data.source_platform,
+            after_video_number=data.after_video_number,
+        )
+        count = await VideoEntryRepository.count_where(
+            self.session,
+            conditions,
+        )
+        if count == 0:
+            return BulkCopyResponse(copied=0)
+
+        first = await VideoStatsRepository.allocate_numbers(
+            self.session,
+            user_id,
+            data.target_platform,
+            count=count,
+        )
+        numbers = await VideoEntryRepository.copy_many(
+            self.session,
+            conditions,
+            data.target_platform,
+            first_number=first,
+            limit=count,
+            shorten_for_youtube=data.shorten_for_youtube,
+        )
+        if len(numbers) < count:
+            await VideoStatsRepository.release_numbers(
+                self.session,
+                user_id,
+                data.target_platform,
+                first=first,
+                last=first + count - 1,
+            )
+        await VideoStatsRepository.refresh(
+            self.session,
+            user_id,
+            data.target_platform,
+            count_delta=len(numbers),
+        )
+        return BulkCopyResponse(
+            copied=len(numbers),
+            first_video_number=numbers[0] if numbers else None,
+            last_video_number=numbers[-1] if numbers else None,
+        )
+
+    async def get_stats(self, user_id: UUID) -> VideoStatsResponse:
+        """
+        Get per platform statistics from the denormalized stats rows
+        """
+        rows = await VideoStatsRepository.get_by_user(self.session, user_id)
+        stale = [row.platform for row in rows if row.is_schedule_stale]
+        if stale:
+            await VideoStatsRepository.lock(self.session, user_id, stale)
+        for platform in stale:
+            await VideoStatsRepository.refresh(
+                self.session,
+                user_id,
+                platform,
+            )
+        if stale:
+            rows = await VideoStatsRepository.get_by_user(
+                self.session,
+                user_id,
+            )
+
+        by_platform = {row.platform: row for row in rows}
+        platforms = [
+            PlatformStatsResponse.model_validate(by_platform[platform])
+            if platform in by_platform else
+            PlatformStatsResponse(platform=platform)
+            for platform in Platform
+        ]
+        return VideoStatsResponse(
+            platforms=platforms,
+            total_entries=sum(p.entry_count for p in platforms),
+        )
+
+    async def backfill_youtube_descriptions(
+        self,
+        user_id: UUID | None = None,
+        cursor: str | None = None,
+        limit: int = VIDEO_BACKFILL_MAX_ROWS,
+    ) -> VideoBackfillResponse:
+        """
+        Fill youtube_description on YouTube entries that have none
+        """
+        after = self._decode_backfill_cursor(cursor) if cursor else None
+        shortened: dict[bytes, str] = {}
+        updated = 0
+        has_more = True
+
+        while has_more and updated < limit:
+            take = min(VIDEO_BACKFILL_BATCH_SIZE, limit - updated)
+            rows = await VideoEntryRepository.get_missing_youtube_description(
+                self.session,
+                limit=take + 1,
+                user_id=user_id,
+                after=after,
+            )
+            has_more = len(rows) > take
+            rows = rows[:take]
+            if not rows:
+                break
+
+            values = []
+            for row in rows:
+                key = hashlib.blake2b(
+                    row.description.encode(),
+                    digest_size=16,
+                ).digest()
+                if key not in shortened:
+                    shortened[key] = self._shorten_description(
+                        row.description
+                    )
+                values.append((row.id, shortened[key]))
+
+            updated += await VideoEntryRepository.set_youtube_descriptions(
+                self.session,
+                values,
+            )
+            await VideoStatsRepository.bump_versions(
+                self.session,
+                {row.user_id for row in rows},
+                Platform.YOUTUBE,
+            )
+            after = rows[-1].id
+
+        return VideoBackfillResponse(
+            updated=updated,
+            next_cursor=encode_cursor({"i": str(after)})
+            if has_more else None,
+        )
+
+    async def collect_descriptions(
+        self,
+        recount: bool = False,
+    ) -> DescriptionCollectResponse:
+        """
+        Delete stored descriptions no entry references any more
+        """
+        recounted = 0
+        if recount:
+            recounted = await DescriptionRepository.recount(self.session)
+        deleted = await DescriptionRepository.collect_garbage(self.session)
+        return DescriptionCollectResponse(
+            recounted=recounted,
+            deleted=deleted,
+        )
+
+    async def rebuild_stats(self, user_id: UUID | None = None) -> int:
+        """
+        Rebuild stats rows from video_entries, for one user or everyone
+        """
+        return await VideoStatsRepository.rebuild(self.session, user_id)
+
+    @staticmethod
+    def _matches(
+        matches: Sequence[tuple[Row[Any], float]],
+    ) -> list[VideoEntryMatch]:
+        """
+        Build scored match schemas from repository rows
+        """
+        return [
+            VideoEntryMatch(
+                entry=VideoEntryResponse.model_validate(entry),
+                score=round(score, 4),
+            ) for entry, score in matches
+        ]
+
+    @staticmethod
+    def _number_taken(platform: Platform, video_number: int) -> ConflictError:
+        """
+        Error for a video number already used on a platform
+        """
+        return ConflictError(
+            f"Video number {video_number} already exists on {platform.value}"
+        )
+
+    @staticmethod
+    def _row_dicts(rows: Sequence[Row[Any]]) -> list[dict[str, Any]]:
+        """
+        Column rows as plain dicts
+        """
+        if not rows:
+            return []
+        fields = rows[0]._fields
+        return [dict(zip(fields, row)) for row in rows]
+
+    @staticmethod
+    def _encode_list_cursor(
+        last: Row[Any],
+        platform: Platform | None,
+    ) -> str:
+        """
+        Build the cursor pointing just past the last entry of a page
+        """
+        if platform:
+            return encode_cursor({
+                "p": platform.value,
+                "n": last.video_number,
+            })
+        return encode_cursor({
+            "c": last.created_at.isoformat(),
+            "i": str(last.id),
+        })
+
+    @staticmethod
+    def _decode_platform_cursor(
+        cursor: str,
+        platform: Platform,
+    ) -> int:
+        """
+        Decode a per platform cursor into the last video_number seen
+        """
+        values = decode_cursor(cursor)
+        if values.get("p") != platform.value:
+            raise ValidationError(
+                "Cursor does not match the requested platform",
+                field="cursor",
+            )
+        try:
+            return int(values["n"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError("Invalid cursor", field="cursor") from e
+
+    @staticmethod
+    def _decode_created_cursor(cursor: str) -> tuple[datetime, UUID]:
+        """
+        Decode an all platform cursor into (created_at, id)
+        """
+        values = decode_cursor(cursor)
+        if "p" in values:
+            raise ValidationError(
+                "Cursor does not match the requested platform",
+                field="cursor",
+            )
+        try:
+            return datetime.fromisoformat(values["c"]), UUID(values["i"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError("Invalid cursor", field="cursor") from e
+
+    @staticmethod
+    def _decode_backfill_cursor(cursor: str) -> UUID:
+        """
+        Decode a backfill cursor into the last entry id written
+        """
+        values = decode_cursor(cursor)
+        try:
+            return UUID(values["i"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError("Invalid cursor", field="cursor") from e
+
+    @staticmethod
+    def _decode_search_cursor(cursor: str) -> tuple[float, UUID]:
+        """
+        Decode a search cursor into (rank, id)
+        """
+        values = decode_cursor(cursor)
+        try:
+            return float(values["r"]), UUID(values["i"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError("Invalid cursor", field="cursor") from e
+
+    @staticmethod
+    def _decode_sync_token(
+        token: str,
+    ) -> tuple[SyncPosition, SyncPosition, bool]:
+        """
+        Decode a delta sync token into its positions
+        """
+        values = decode_cursor(token)
+        try:
+            changed_at = datetime.fromisoformat(values["u"])
+            entry_id = UUID(values["i"]) if values.get("i") else None
+            deleted_at = datetime.fromisoformat(values.get("d") or values["u"])
+            deleted_id = UUID(values["t"]) if values.get("t") else None
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError("Invalid sync token", field="since") from e
+        return (
+            (VideoEntryService._as_utc(changed_at), entry_id),
+            (VideoEntryService._as_utc(deleted_at), deleted_id),
+            bool(values.get("m")),
+        )
+
+    @staticmethod
+    def _rewind(position: SyncPosition) -> SyncPosition:
+        """
+        Move a caught up sync position back by the rescan overlap
+        """
+        overlap = timedelta(seconds=settings.VIDEO_SYNC_OVERLAP_SECONDS)
+        return position[0] - overlap, None
+
+    @staticmethod
+    def _sync_position(
+        more: bool,
+        last: list[SyncPosition],
+        floor: SyncPosition,
+    ) -> SyncPosition:
+        """
+        Where one feed of the delta sync resumes
+        """
+        if more:
+            return last[0]
+        return max([*last, floor], key=lambda candidate: candidate[0])
+
+    @staticmethod
+    def _in_zone(value: datetime, zone: ZoneInfo) -> datetime:
+        """
+        Attach zone to a naive datetime, aware values are kept
+        """
+        if value.tzinfo is None:
+            return value.replace(tzinfo=zone)
+        return value
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        """
+        Treat naive datetimes as UTC for SQLite compatibility
+        """
+        if value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value
+
+    @staticmethod
+    def _shorten_description(text: str, max_length: int = 100) -> str:
         """
-        Shorten description for YouTube Shorts
+        Shorten description for YouTube Shorts, as SQL shorten_description()
         """
         if len(text) <= max_length:
             return text
-        return text[:max_length - 3].rsplit(" ", 1)[0] + "..."
+        end = max_length - 3
+        while end > 0 and (
+            EMOJI_JOINER.match(text[end]) or text[end - 1] == ZWJ
+        ):
+            end -= 1
+        cut = text[:end]
+        if not text[end].isspace():
+            cut = PARTIAL_WORD.sub("", cut)
+        return TRAILING_JUNK.sub("", cut) + "..."
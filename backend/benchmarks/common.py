@@ -0,0 +1,84 @@
+"""
+ⒸAngelaMos | 2025
+common.py
+
+In memory SQLite seeded with video entries, shared by the benchmarks
+"""
+
+import sys
+import hashlib
+from pathlib import Path
+from datetime import UTC, datetime, timedelta
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import uuid6
+from sqlalchemy import Engine, create_engine, event
+
+from config import Platform
+from user.User import User
+from auth.RefreshToken import RefreshToken  # noqa: F401
+from video.Description import Description
+from video.VideoEntry import VideoEntry
+
+
+CAPTION = " ".join(["caption text"] * 20)
+
+
+def seeded_engine(rows: int) -> Engine:
+    """
+    In memory SQLite holding rows TikTok entries of a single user
+    """
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def register_functions(dbapi_conn, _):
+        dbapi_conn.create_function(
+            "to_tsvector",
+            2,
+            lambda _, text: text,
+            deterministic = True,
+        )
+
+    User.__table__.create(engine)
+    Description.__table__.create(engine)
+    VideoEntry.__table__.create(engine)
+
+    now = datetime.now(UTC)
+    user_id = uuid6.uuid7()
+    bodies = {
+        number: f"Video {number} {CAPTION}" for number in range(1, rows + 1)
+    }
+    digests = {
+        number: hashlib.sha256(body.encode()).digest()
+        for number, body in bodies.items()
+    }
+    with engine.begin() as conn:
+        conn.execute(
+            Description.__table__.insert(),
+            [
+                {
+                    "user_id": user_id,
+                    "hash": digests[number],
+                    "body": body,
+                    "ref_count": 1,
+                } for number, body in bodies.items()
+            ],
+        )
+        conn.execute(
+            VideoEntry.__table__.insert(),
+            [
+                {
+                    "id": uuid6.uuid7(),
+                    "user_id": user_id,
+                    "platform": Platform.TIKTOK,
+                    "video_number": number,
+                    "description_hash": digests[number],
+                    "youtube_description": None,
+                    "scheduled_time": now + timedelta(hours = number),
+                    "created_at": now,
+                    "updated_at": now,
+                } for number in range(1, rows + 1)
+            ],
+        )
+    return engine
@@ -0,0 +1,86 @@
+"""
+ⒸAngelaMos | 2025
+jwt_auth.py
+
+CPU time spent on the access token of one authenticated request, the
+unverified rate limit decode plus a full verify in the auth dependency
+against claims shared through the request and the verified token LRU
+
+Run from backend/ with DATABASE_URL and SECRET_KEY set:
+    python benchmarks/jwt_auth.py
+"""
+
+import timeit
+from typing import Any
+
+import jwt
+import uuid6
+from starlette.requests import Request
+
+import common  # noqa: F401
+from config import settings
+from core.rate_limit import get_identifier
+from core.security import (
+    create_access_token,
+    request_token_claims,
+    verified_tokens,
+)
+
+
+ROUNDS = 20000
+
+
+def make_request(token: str) -> Request:
+    """
+    Fresh request carrying the token, as each HTTP request would
+    """
+    return Request({
+        "type": "http",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    })
+
+
+def before(token: str) -> dict[str, Any]:
+    """
+    Old path, the limiter decodes without verifying and the dependency
+    verifies the same token from scratch
+    """
+    jwt.decode(token, options = {"verify_signature": False})
+    return jwt.decode(
+        token,
+        settings.SECRET_KEY.get_secret_value(),
+        algorithms = [settings.JWT_ALGORITHM],
+        options = {
+            "require": ["exp",
+                        "sub",
+                        "iat",
+                        "type",
+                        "token_version"]
+        },
+    )
+
+
+def after(token: str) -> dict[str, Any]:
+    """
+    New path, both readers share the claims verified once per worker
+    """
+    request = make_request(token)
+    get_identifier(request)
+    return request_token_claims(request, token)
+
+
+def main() -> None:
+    token = create_access_token(uuid6.uuid7(), 0)
+    assert before(token) == after(token)
+
+    for name, run in (
+        ("before", lambda: before(token)),
+        ("after", lambda: after(token)),
+    ):
+        verified_tokens.clear()
+        seconds = min(timeit.repeat(run, number = ROUNDS, repeat = 5))
+        print(f"{name:>6}: {seconds / ROUNDS * 1e6:8.2f} us per request")
+
+
+if __name__ == "__main__":
+    main()
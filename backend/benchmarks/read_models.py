@@ -0,0 +1,79 @@
+"""
+ⒸAngelaMos | 2025
+read_models.py
+
+Memory and latency of reading 1k video entries as ORM instances tracked
+by the session identity map against plain Core column rows
+
+Run from backend/ with DATABASE_URL and SECRET_KEY set:
+    python benchmarks/read_models.py
+"""
+
+import gc
+import timeit
+import tracemalloc
+from typing import Any
+from collections.abc import Callable, Sequence
+
+from sqlalchemy import Engine, select
+from sqlalchemy.orm import Session
+
+from common import seeded_engine
+from video.VideoEntry import VideoEntry
+from video.repository import ENTRY_COLUMNS
+
+
+ROWS = 1000
+ROUNDS = 20
+
+
+def read_orm(engine: Engine) -> Callable[[], Sequence[Any]]:
+    """
+    select(VideoEntry) loaded into a fresh session
+    """
+    def run() -> Sequence[Any]:
+        with Session(engine) as session:
+            return session.scalars(select(VideoEntry)).all()
+    return run
+
+
+def read_rows(engine: Engine) -> Callable[[], Sequence[Any]]:
+    """
+    select() of the response columns, no identity map involved
+    """
+    def run() -> Sequence[Any]:
+        with Session(engine) as session:
+            return session.execute(select(*ENTRY_COLUMNS)).all()
+    return run
+
+
+def retained_bytes(run: Callable[[], Sequence[Any]]) -> int:
+    """
+    Bytes still allocated while the loaded result is held
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = run()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(result) == ROWS
+    return retained
+
+
+def main() -> None:
+    engine = seeded_engine(ROWS)
+    for name, run in (
+        ("orm", read_orm(engine)),
+        ("rows", read_rows(engine)),
+    ):
+        run()
+        memory = retained_bytes(run)
+        seconds = min(timeit.repeat(run, number = ROUNDS, repeat = 5))
+        print(
+            f"{name:>4}: {memory / 1024:8.1f} KiB, "
+            f"{seconds / ROUNDS * 1e3:6.2f} ms per {ROWS} rows"
+        )
+
+
+if __name__ == "__main__":
+    main()
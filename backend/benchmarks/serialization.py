@@ -0,0 +1,90 @@
+"""
+ⒸAngelaMos | 2025
+serialization.py
+
+Serialization time of one page of video entries, ORM objects with
+per row model_validate and a second response_model pass against column
+rows dumped with a prebuilt TypeAdapter
+
+Run from backend/ with DATABASE_URL and SECRET_KEY set:
+    python benchmarks/serialization.py
+"""
+
+import json
+import timeit
+from typing import Any
+
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session
+
+from common import seeded_engine
+from video.VideoEntry import VideoEntry
+from video.repository import ENTRY_COLUMNS
+from video.service import VideoEntryService
+from video.schemas import (
+    VIDEO_ENTRY_PAGE_JSON,
+    VideoEntryListResponse,
+    VideoEntryResponse,
+)
+
+
+ROWS = 100
+ROUNDS = 2000
+
+
+def load_page() -> tuple[list[VideoEntry], list[Row[Any]]]:
+    """
+    Read one page of entries back as ORM objects and as column rows
+    """
+    with Session(seeded_engine(ROWS)) as session:
+        entries = list(session.scalars(select(VideoEntry)).all())
+        rows = list(session.execute(select(*ENTRY_COLUMNS)).all())
+    return entries, rows
+
+
+def before(entries: list[VideoEntry]) -> bytes:
+    """
+    Old path, model_validate per row then the response_model round trip
+    FastAPI runs before rendering JSONResponse
+    """
+    page = VideoEntryListResponse(
+        items = [VideoEntryResponse.model_validate(e) for e in entries],
+        page = 1,
+        size = ROWS,
+        has_more = False,
+    )
+    content = VideoEntryListResponse.model_validate(page.model_dump())
+    return json.dumps(
+        content.model_dump(mode = "json"),
+        separators = (",", ":"),
+    ).encode()
+
+
+def after(rows: list[Row[Any]]) -> bytes:
+    """
+    New path, column rows dumped to JSON bytes in one pass
+    """
+    return VIDEO_ENTRY_PAGE_JSON.dump_json({
+        "items": VideoEntryService._row_dicts(rows),
+        "total": None,
+        "page": 1,
+        "size": ROWS,
+        "has_more": False,
+        "next_cursor": None,
+    })
+
+
+def main() -> None:
+    entries, rows = load_page()
+    assert json.loads(before(entries)) == json.loads(after(rows))
+
+    for name, run in (
+        ("before", lambda: before(entries)),
+        ("after", lambda: after(rows)),
+    ):
+        seconds = min(timeit.repeat(run, number = ROUNDS, repeat = 5))
+        print(f"{name:>6}: {seconds / ROUNDS * 1e6:8.1f} us per {ROWS} rows")
+
+
+if __name__ == "__main__":
+    main()
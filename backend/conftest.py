@@ -10,6 +10,9 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent / "app"))
 
+import os
+import re
+import asyncio
 import hashlib
 import secrets
 from datetime import (
@@ -18,7 +21,8 @@ from datetime import (
     timedelta,
 )
 from uuid import uuid4
-from collections.abc import AsyncIterator
+from zoneinfo import ZoneInfo
+from collections.abc import AsyncIterator, Iterator
 
 import pytest
 from httpx import (
@@ -26,22 +30,145 @@ from httpx import (
     ASGITransport,
 )
 import pytest_asyncio
+from alembic import command
+from alembic.config import Config as AlembicConfig
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
+    async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import event
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.pool import NullPool, StaticPool
 
 from core.security import (
     hash_password,
     create_access_token,
 )
-from config import UserRole
-from core.database import get_db_session
+from config import Platform, UserRole, settings
+from core.auth_cache import auth_user_cache
+from core.hash_pool import hash_pool
+from core.security import verified_tokens
+from core.database import (
+    WriteTrackingSession,
+    get_db_session,
+    sessionmanager,
+)
 
 from core.Base import Base
 from user.User import User
 from auth.RefreshToken import RefreshToken
+from video.VideoEntry import VideoEntry
+from video.repository import (
+    VideoEntryRepository,
+    VideoStatsRepository,
+)
+from video.service import VideoEntryService
+
+
+def trigram_similarity(left: str | None, right: str | None) -> float:
+    """
+    Python port of pg_trgm similarity() for the SQLite test database
+    """
+    def trigrams(text: str | None) -> set[str]:
+        grams: set[str] = set()
+        for word in re.findall(r"\w+", (text or "").lower()):
+            padded = f"  {word} "
+            grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+        return grams
+
+    a, b = trigrams(left), trigrams(right)
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def sqlite_timezone(zone: str, value: str | None) -> str | None:
+    """
+    timezone() stand in for SQLite, where stored instants are naive UTC
+
+    A value without an offset becomes local wall time with its offset, a
+    value with an offset is read as wall time in zone and turned back into
+    a stored UTC instant, mirroring timestamptz and timestamp in PostgreSQL
+    """
+    if value is None:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo = UTC).astimezone(ZoneInfo(zone)).isoformat()
+    local = parsed.replace(tzinfo = ZoneInfo(zone))
+    return local.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def sqlite_date_trunc(unit: str, value: str | None) -> str | None:
+    """
+    date_trunc() stand in for SQLite supporting day and hour
+    """
+    if value is None:
+        return None
+    fields = {"minute": 0, "second": 0, "microsecond": 0}
+    if unit == "day":
+        fields["hour"] = 0
+    return datetime.fromisoformat(value).replace(**fields).isoformat()
+
+
+def sqlite_convert_to(value: str | None, encoding: str) -> bytes | None:
+    """
+    convert_to() stand in for SQLite, text to encoded bytes
+    """
+    if value is None:
+        return None
+    return value.encode(encoding)
+
+
+def sqlite_sha256(value: bytes | None) -> bytes | None:
+    """
+    sha256() stand in for SQLite
+    """
+    if value is None:
+        return None
+    return hashlib.sha256(value).digest()
+
+
+SQLITE_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE video_entries_fts USING fts5(
+        description, youtube_description
+    )
+    """,
+    """
+    CREATE TRIGGER video_entries_fts_ai AFTER INSERT ON video_entries BEGIN
+        INSERT INTO video_entries_fts (rowid, description, youtube_description)
+        VALUES (
+            new.rowid,
+            (
+                SELECT body FROM descriptions
+                WHERE user_id = new.user_id AND hash = new.description_hash
+            ),
+            new.youtube_description
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER video_entries_fts_ad AFTER DELETE ON video_entries BEGIN
+        DELETE FROM video_entries_fts WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER video_entries_fts_au AFTER UPDATE ON video_entries BEGIN
+        DELETE FROM video_entries_fts WHERE rowid = old.rowid;
+        INSERT INTO video_entries_fts (rowid, description, youtube_description)
+        VALUES (
+            new.rowid,
+            (
+                SELECT body FROM descriptions
+                WHERE user_id = new.user_id AND hash = new.description_hash
+            ),
+            new.youtube_description
+        );
+    END
+    """,
+)
 
 
 @pytest_asyncio.fixture(scope = "session", loop_scope = "session")
@@ -56,8 +183,62 @@ async def test_engine():
         connect_args = {"check_same_thread": False},
         echo = False,
     )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def register_sql_functions(dbapi_connection, _):
+        """
+        SQLite stand ins for functions the PostgreSQL migrations install
+
+        to_tsvector only feeds the generated search_vector columns, search
+        itself runs on the video_entries_fts FTS5 table
+        """
+        dbapi_connection.create_function(
+            "shorten_description",
+            2,
+            VideoEntryService._shorten_description,
+            deterministic = True,
+        )
+        dbapi_connection.create_function(
+            "similarity",
+            2,
+            trigram_similarity,
+            deterministic = True,
+        )
+        dbapi_connection.create_function(
+            "timezone",
+            2,
+            sqlite_timezone,
+            deterministic = True,
+        )
+        dbapi_connection.create_function(
+            "date_trunc",
+            2,
+            sqlite_date_trunc,
+            deterministic = True,
+        )
+        dbapi_connection.create_function(
+            "convert_to",
+            2,
+            sqlite_convert_to,
+            deterministic = True,
+        )
+        dbapi_connection.create_function(
+            "sha256",
+            1,
+            sqlite_sha256,
+            deterministic = True,
+        )
+        dbapi_connection.create_function(
+            "to_tsvector",
+            2,
+            lambda _, text: text,
+            deterministic = True,
+        )
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        for ddl in SQLITE_FTS_DDL:
+            await conn.exec_driver_sql(ddl)
     yield engine
     await engine.dispose()
 
@@ -83,6 +264,174 @@ async def db_session(test_engine) -> AsyncIterator[AsyncSession]:
         await conn.rollback()
 
 
+POSTGRES_TEST_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+@pytest_asyncio.fixture(scope = "session", loop_scope = "session")
+async def pg_engine():
+    """
+    Session scoped engine on the empty PostgreSQL database named by
+    TEST_POSTGRES_URL, built by the real migrations and torn down by
+    their downgrades. Tests using it are skipped when the variable is
+    unset
+    """
+    if not POSTGRES_TEST_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+
+    url = make_url(POSTGRES_TEST_URL).set(drivername = "postgresql+asyncpg")
+    alembic_config = AlembicConfig()
+    alembic_config.set_main_option(
+        "script_location",
+        str(Path(__file__).parent / "alembic"),
+    )
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(
+            settings,
+            "DATABASE_URL",
+            url.render_as_string(hide_password = False),
+        )
+        await asyncio.to_thread(command.upgrade, alembic_config, "head")
+        engine = create_async_engine(url, poolclass = NullPool)
+        yield engine
+        await engine.dispose()
+        await asyncio.to_thread(command.downgrade, alembic_config, "base")
+
+
+@pytest.fixture
+async def pg_session(pg_engine) -> AsyncIterator[AsyncSession]:
+    """
+    Per test PostgreSQL session rolled back like db_session
+    """
+    async with pg_engine.connect() as conn:
+        await conn.begin()
+
+        session = AsyncSession(
+            bind = conn,
+            expire_on_commit = False,
+            join_transaction_mode = "create_savepoint",
+        )
+
+        yield session
+
+        await session.close()
+        await conn.rollback()
+
+
+class QueryCounter:
+    """
+    Records SQL statements executed on an engine
+    """
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def __call__(
+        self,
+        conn,
+        cursor,
+        statement,
+        parameters,
+        context,
+        executemany,
+    ) -> None:
+        if not statement.lstrip().upper().startswith(
+            ("SAVEPOINT", "RELEASE", "ROLLBACK")
+        ):
+            self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+
+@pytest.fixture
+def query_counter(test_engine) -> Iterator[QueryCounter]:
+    """
+    Count statements sent to the database during a test
+    """
+    counter = QueryCounter()
+    event.listen(test_engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(test_engine.sync_engine, "before_cursor_execute", counter)
+
+
+class SessionLog:
+    """
+    Records the sessions sessionmanager opens and the ones that commit,
+    as their read_only flag
+    """
+    def __init__(self) -> None:
+        self.opened: list[bool] = []
+        self.committed: list[bool] = []
+
+    def factory(self, bind, read_only: bool):
+        maker = async_sessionmaker(
+            bind = bind,
+            class_ = AsyncSession,
+            sync_session_class = WriteTrackingSession,
+            expire_on_commit = False,
+            join_transaction_mode = "create_savepoint",
+        )
+
+        def open_session() -> AsyncSession:
+            session = maker()
+            session.info["read_only"] = read_only
+            self.opened.append(read_only)
+            return session
+
+        return open_session
+
+    def after_commit(self, session) -> None:
+        self.committed.append(session.info["read_only"])
+
+
+@pytest.fixture
+def session_log(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[SessionLog]:
+    """
+    Point sessionmanager at the test connection and log its sessions
+
+    Request sessions join the test transaction through savepoints like
+    db_session does, so their commits stay visible to the test and roll
+    back with it
+    """
+    log = SessionLog()
+    monkeypatch.setattr(
+        sessionmanager,
+        "_async_sessionmaker",
+        log.factory(db_session.bind, read_only = False),
+    )
+    monkeypatch.setattr(
+        sessionmanager,
+        "_read_only_sessionmaker",
+        log.factory(db_session.bind, read_only = True),
+    )
+    event.listen(WriteTrackingSession, "after_commit", log.after_commit)
+    yield log
+    event.remove(WriteTrackingSession, "after_commit", log.after_commit)
+
+
+@pytest.fixture
+async def session_client(
+    session_log: SessionLog,
+) -> AsyncIterator[AsyncClient]:
+    """
+    Async HTTP client that keeps the real get_db_session dependency
+    """
+    from factory import create_app
+
+    async with AsyncClient(
+            transport = ASGITransport(app = create_app()),
+            base_url = "http://test",
+    ) as ac:
+        yield ac
+
+
 @pytest.fixture
 async def client(db_session: AsyncSession) -> AsyncIterator[AsyncClient]:
     """
@@ -190,6 +539,67 @@ class RefreshTokenFactory:
         return token, raw_token
 
 
+class VideoEntryFactory:
+    """
+    Factory for creating test video entries
+    """
+    @classmethod
+    async def create(
+        cls,
+        session: AsyncSession,
+        user: User,
+        *,
+        platform: Platform = Platform.TIKTOK,
+        video_number: int = 1,
+        description: str = "",
+        youtube_description: str | None = None,
+        scheduled_time: datetime | None = None,
+    ) -> VideoEntry:
+        await VideoStatsRepository.reserve_number(
+            session,
+            user.id,
+            platform,
+            video_number,
+        )
+        entry = await VideoEntryRepository.create(
+            session,
+            user_id = user.id,
+            platform = platform,
+            video_number = video_number,
+            description = description,
+            youtube_description = youtube_description,
+            scheduled_time = scheduled_time,
+        )
+        await session.refresh(entry)
+        await VideoStatsRepository.refresh(
+            session,
+            user.id,
+            platform,
+            count_delta = 1,
+        )
+        return entry
+
+    @classmethod
+    async def create_batch(
+        cls,
+        session: AsyncSession,
+        user: User,
+        count: int,
+        *,
+        platform: Platform = Platform.TIKTOK,
+    ) -> list[VideoEntry]:
+        return [
+            await cls.create(
+                session,
+                user,
+                platform = platform,
+                video_number = number,
+                description = f"Video {number}",
+            ) for number in range(1,
+                                  count + 1)
+        ]
+
+
 @pytest.fixture
 async def test_user(db_session: AsyncSession) -> User:
     """
@@ -289,3 +699,16 @@ def reset_factories():
     """
     yield
     UserFactory.reset()
+
+
+@pytest.fixture(autouse = True)
+def clear_auth_user_cache():
+    """
+    Start every test with empty auth caches and hash pool counters
+    """
+    auth_user_cache.clear()
+    verified_tokens.clear()
+    hash_pool.reset_stats()
+    yield
+    auth_user_cache.clear()
+    verified_tokens.clear()
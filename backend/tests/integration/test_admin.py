@@ -10,6 +10,10 @@ from user.User import User
 
 
 URL_ADMIN_USERS = "/v1/admin/users"
+URL_ADMIN_AUTH_CACHE = "/v1/admin/auth-cache"
+URL_ADMIN_HASH_POOL = "/v1/admin/hash-pool"
+URL_LOGIN = "/v1/auth/login"
+URL_VIDEOS = "/v1/videos"
 
 
 def url_admin_user_by_id(user_id: str) -> str:
@@ -254,3 +258,90 @@ async def test_admin_delete_user_non_admin_forbidden(
     )
 
     assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_admin_deactivate_user_drops_cached_auth(
+    client: AsyncClient,
+    admin_user: User,
+    admin_auth_headers: dict[str, str],
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Deactivating a user takes effect on the next request, not on expiry
+    """
+    response = await client.get(URL_VIDEOS, headers = auth_headers)
+    assert response.status_code == 200
+
+    await client.patch(
+        url_admin_user_by_id(str(test_user.id)),
+        headers = admin_auth_headers,
+        json = {"is_active": False},
+    )
+
+    response = await client.get(URL_VIDEOS, headers = auth_headers)
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_admin_auth_cache_stats(
+    client: AsyncClient,
+    admin_user: User,
+    admin_auth_headers: dict[str, str],
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Repeat requests are served from the cache and counted
+    """
+    for _ in range(3):
+        await client.get(URL_VIDEOS, headers = auth_headers)
+
+    response = await client.get(
+        URL_ADMIN_AUTH_CACHE,
+        headers = admin_auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "size": 2,
+        "hits": 2,
+        "misses": 2,
+        "evictions": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_admin_hash_pool_stats(
+    client: AsyncClient,
+    admin_user: User,
+    admin_auth_headers: dict[str, str],
+    test_user: User,
+):
+    """
+    Password checks run through the hash pool and are counted
+    """
+    before = await client.get(
+        URL_ADMIN_HASH_POOL,
+        headers = admin_auth_headers,
+    )
+    await client.post(
+        URL_LOGIN,
+        data = {
+            "username": test_user.email,
+            "password": "TestPass123",
+        },
+    )
+
+    response = await client.get(
+        URL_ADMIN_HASH_POOL,
+        headers = admin_auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["completed"] == before.json()["completed"] + 1
+    assert data["rejected"] == 0
+    assert data["in_flight"] == 0
+    assert data["avg_hash_ms"] > 0
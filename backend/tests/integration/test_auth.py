@@ -4,10 +4,22 @@ test_auth.py
 """
 
 import pytest
-from httpx import AsyncClient
-
+from httpx import (
+    AsyncClient,
+    ASGITransport,
+)
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import Settings, settings
 from user.User import User
 from auth.RefreshToken import RefreshToken
+from core.auth_cache import auth_user_cache
+from core.exceptions import RateLimitExceeded
+from core.hash_pool import HashPool, hash_pool
+from core.security import verified_tokens
+from core.token_state import token_state_map
+from conftest import QueryCounter
 
 
 URL_LOGIN = "/v1/auth/login"
@@ -16,6 +28,26 @@ URL_LOGOUT = "/v1/auth/logout"
 URL_LOGOUT_ALL = "/v1/auth/logout-all"
 URL_ME = "/v1/auth/me"
 URL_CHANGE_PASSWORD = "/v1/auth/change-password"
+URL_VIDEOS = "/v1/videos"
+
+
+@pytest.fixture
+async def stateless_auth(monkeypatch: pytest.MonkeyPatch):
+    """
+    Resolve access tokens from the local token state map
+    """
+    monkeypatch.setattr(settings, "AUTH_STATELESS", True)
+    monkeypatch.setattr(settings, "AUTH_STATELESS_SINGLE_WORKER", True)
+    await token_state_map.clear()
+    yield
+    await token_state_map.clear()
+
+
+def user_reads(query_counter: QueryCounter) -> int:
+    """
+    Statements that read the users table
+    """
+    return sum("FROM users" in s for s in query_counter.statements)
 
 
 @pytest.mark.asyncio
@@ -40,6 +72,68 @@ async def test_login_success(client: AsyncClient, test_user: User):
     assert "refresh_token" in response.cookies
 
 
+@pytest.mark.asyncio
+async def test_login_hash_pool_full(
+    client: AsyncClient,
+    test_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    A full hash queue turns logins away with 503 instead of queueing them
+    """
+    monkeypatch.setattr(hash_pool, "queue_size", 0)
+    monkeypatch.setattr(hash_pool, "in_flight", hash_pool.workers)
+
+    response = await client.post(
+        URL_LOGIN,
+        data = {
+            "username": test_user.email,
+            "password": "TestPass123",
+        },
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert hash_pool.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_hash_pool_shutdown_stops_workers():
+    """
+    A pool that was shut down takes no more hashes
+    """
+    pool = HashPool(workers = 1, queue_size = 0)
+    assert await pool.run(sum, [1, 2]) == 3
+
+    pool.shutdown()
+
+    with pytest.raises(RuntimeError):
+        await pool.run(sum, [1, 2])
+
+
+@pytest.mark.asyncio
+async def test_retry_after_only_on_service_unavailable():
+    """
+    Other app errors carrying retry_after keep their response unchanged
+    """
+    from factory import create_app
+
+    app = create_app()
+
+    @app.get("/limited")
+    async def limited() -> None:
+        raise RateLimitExceeded(retry_after = 30)
+
+    async with AsyncClient(
+            transport = ASGITransport(app = app),
+            base_url = "http://test",
+    ) as ac:
+        response = await ac.get("/limited")
+
+    assert response.status_code == 420
+    assert "Retry-After" not in response.headers
+
+
 @pytest.mark.asyncio
 async def test_login_invalid_password(
     client: AsyncClient,
@@ -116,6 +210,37 @@ async def test_refresh_token_success(
     assert data["token_type"] == "bearer"
 
 
+@pytest.mark.asyncio
+async def test_refresh_token_replay_revokes_family(
+    client: AsyncClient,
+    refresh_token_pair: tuple[RefreshToken,
+                              str],
+):
+    """
+    Reusing a rotated token revokes its successor too
+    """
+    _, raw_token = refresh_token_pair
+
+    response = await client.post(
+        URL_REFRESH,
+        cookies = {"refresh_token": raw_token},
+    )
+    assert response.status_code == 200
+    successor = response.cookies["refresh_token"]
+
+    response = await client.post(
+        URL_REFRESH,
+        cookies = {"refresh_token": raw_token},
+    )
+    assert response.status_code == 401
+
+    response = await client.post(
+        URL_REFRESH,
+        cookies = {"refresh_token": successor},
+    )
+    assert response.status_code == 401
+
+
 @pytest.mark.asyncio
 async def test_refresh_token_missing_returns_401(client: AsyncClient):
     """
@@ -213,6 +338,25 @@ async def test_logout_all(
     assert "revoked_sessions" in data
 
 
+@pytest.mark.asyncio
+async def test_logout_all_revokes_cached_access_token(
+    client: AsyncClient,
+    test_user: User,
+    auth_headers: dict[str,
+                       str],
+):
+    """
+    Logout all drops the cached user so the old access token stops working
+    """
+    response = await client.get(URL_VIDEOS, headers = auth_headers)
+    assert response.status_code == 200
+
+    await client.post(URL_LOGOUT_ALL, headers = auth_headers)
+
+    response = await client.get(URL_VIDEOS, headers = auth_headers)
+    assert response.status_code == 401
+
+
 @pytest.mark.asyncio
 async def test_get_current_user(
     client: AsyncClient,
@@ -286,3 +430,144 @@ async def test_change_password_wrong_current(
     )
 
     assert response.status_code == 401
+
+
+def test_stateless_auth_requires_shared_map():
+    """
+    Stateless auth without Redis is refused unless declared single worker
+    """
+    with pytest.raises(ValidationError, match = "REDIS_URL"):
+        Settings(AUTH_STATELESS = True, REDIS_URL = None)
+
+    assert Settings(
+        AUTH_STATELESS = True,
+        AUTH_STATELESS_SINGLE_WORKER = True,
+        REDIS_URL = None,
+    ).AUTH_STATELESS
+
+
+@pytest.mark.asyncio
+async def test_stateless_auth_skips_user_lookup(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str,
+                       str],
+    stateless_auth: None,
+    query_counter: QueryCounter,
+):
+    """
+    Once the token state is published requests never read the users row
+    """
+    db_session.expunge(test_user)
+    await client.get(URL_VIDEOS, headers = auth_headers)
+    assert user_reads(query_counter) == 1
+    assert await token_state_map.get(test_user.id) is not None
+    db_session.expunge_all()
+    query_counter.reset()
+
+    response = await client.get(URL_VIDEOS, headers = auth_headers)
+
+    assert response.status_code == 200
+    assert user_reads(query_counter) == 0
+    assert len(auth_user_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_stateless_auth_me_reads_profile_only(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str,
+                       str],
+    stateless_auth: None,
+    query_counter: QueryCounter,
+):
+    """
+    /me authenticates from the map and only reads the profile it returns,
+    logout all never reads the users row
+    """
+    await client.get(URL_VIDEOS, headers = auth_headers)
+    db_session.expunge_all()
+    query_counter.reset()
+
+    response = await client.get(URL_ME, headers = auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["email"] == test_user.email
+    assert user_reads(query_counter) == 1
+
+    query_counter.reset()
+    response = await client.post(URL_LOGOUT_ALL, headers = auth_headers)
+
+    assert response.status_code == 200
+    assert user_reads(query_counter) == 0
+
+
+@pytest.mark.asyncio
+async def test_stateless_auth_revocation(
+    client: AsyncClient,
+    test_user: User,
+    auth_headers: dict[str,
+                       str],
+    stateless_auth: None,
+):
+    """
+    Logout all publishes the new token version to the shared map
+    """
+    response = await client.get(URL_VIDEOS, headers = auth_headers)
+    assert response.status_code == 200
+
+    await client.post(URL_LOGOUT_ALL, headers = auth_headers)
+
+    state = await token_state_map.get(test_user.id)
+    assert state is not None
+    assert state.token_version == test_user.token_version
+    response = await client.get(URL_VIDEOS, headers = auth_headers)
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_access_token_verified_once(
+    client: AsyncClient,
+    test_user: User,
+    auth_headers: dict[str,
+                       str],
+):
+    """
+    Repeat requests reuse the verified claims, altered tokens still fail
+    """
+    await client.get(URL_VIDEOS, headers = auth_headers)
+    await client.get(URL_VIDEOS, headers = auth_headers)
+    assert verified_tokens.misses == 1
+    assert verified_tokens.hits == 1
+
+    header, payload, signature = auth_headers["Authorization"].split(".")
+    forged = ".".join((header, payload, signature[::-1]))
+    response = await client.get(
+        URL_VIDEOS,
+        headers = {"Authorization": forged},
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_expired_verified_token_checked_again(
+    client: AsyncClient,
+    test_user: User,
+    auth_headers: dict[str,
+                       str],
+):
+    """
+    A cached entry past its exp is never served, the token is verified again
+    """
+    token = auth_headers["Authorization"].removeprefix("Bearer ")
+    await client.get(URL_VIDEOS, headers = auth_headers)
+    claims = verified_tokens.get(token)
+    verified_tokens.put(token, {**claims, "exp": 0})
+
+    response = await client.get(URL_VIDEOS, headers = auth_headers)
+
+    assert response.status_code == 200
+    assert verified_tokens.misses == 2
+    assert verified_tokens.get(token) == claims
@@ -0,0 +1,144 @@
+"""
+©AngelaMos | 2025
+test_database.py
+"""
+
+from datetime import (
+    UTC,
+    datetime,
+    timedelta,
+)
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import Platform
+from core.database import WriteTrackingSession, has_writes
+from user.User import User
+from video.VideoStats import VideoStats
+from conftest import (
+    SessionLog,
+    UserFactory,
+    VideoEntryFactory,
+)
+
+
+URL_VIDEOS = "/v1/videos"
+URL_VIDEO_STATS = "/v1/videos/stats"
+
+
+@pytest.mark.asyncio
+async def test_session_tracks_writes(test_engine):
+    """
+    Reads leave a session clean, pending objects, flushes and DML do not
+    """
+    async with test_engine.connect() as conn:
+        await conn.begin()
+        session = AsyncSession(
+            bind = conn,
+            sync_session_class = WriteTrackingSession,
+            join_transaction_mode = "create_savepoint",
+        )
+
+        await session.execute(select(User.id))
+        assert not has_writes(session)
+
+        user = await UserFactory.create(session)
+        assert has_writes(session)
+
+        session.info.clear()
+        assert not has_writes(session)
+        await session.execute(
+            update(User).where(User.id == user.id).values(full_name = "x")
+        )
+        assert has_writes(session)
+
+        await session.close()
+        await conn.rollback()
+
+
+@pytest.mark.asyncio
+async def test_get_request_reads_without_commit(
+    session_client: AsyncClient,
+    session_log: SessionLog,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    A plain GET runs on the read only session and never commits
+    """
+    await VideoEntryFactory.create(db_session, test_user)
+
+    response = await session_client.get(URL_VIDEOS, headers = auth_headers)
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 1
+    assert session_log.opened == [True]
+    assert session_log.committed == []
+
+
+@pytest.mark.asyncio
+async def test_post_request_commits(
+    session_client: AsyncClient,
+    session_log: SessionLog,
+    db_session: AsyncSession,
+    auth_headers: dict[str, str],
+):
+    """
+    A write request runs read write and commits once
+    """
+    response = await session_client.post(
+        URL_VIDEOS,
+        headers = auth_headers,
+        json = {"platform": "tiktok", "description": "Committed"},
+    )
+
+    assert response.status_code == 201
+    assert session_log.opened == [False]
+    assert session_log.committed == [False]
+
+
+@pytest.mark.asyncio
+async def test_stats_get_persists_refresh(
+    session_client: AsyncClient,
+    session_log: SessionLog,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    /videos/stats opts out of read only, a stale schedule it recomputes
+    is committed and stored
+    """
+    upcoming = datetime.now(UTC) + timedelta(days = 1)
+    await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        scheduled_time = upcoming,
+    )
+    await db_session.execute(
+        update(VideoStats)
+        .where(VideoStats.user_id == test_user.id)
+        .values(next_scheduled_time = datetime.now(UTC) - timedelta(days = 1))
+    )
+
+    response = await session_client.get(
+        URL_VIDEO_STATS,
+        headers = auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert session_log.opened == [False]
+    assert session_log.committed == [False]
+    stored = await db_session.scalar(
+        select(VideoStats.next_scheduled_time)
+        .where(
+            VideoStats.user_id == test_user.id,
+            VideoStats.platform == Platform.TIKTOK,
+        )
+        .execution_options(populate_existing = True)
+    )
+    assert stored.replace(tzinfo = UTC) == upcoming
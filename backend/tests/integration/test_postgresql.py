@@ -0,0 +1,302 @@
+"""
+©AngelaMos | 2025
+test_postgresql.py
+
+PostgreSQL only statements that the SQLite suite replaces with
+fallbacks, run against the database named by TEST_POSTGRES_URL
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import Platform
+from auth.repository import RefreshTokenRepository
+from video.Description import Description
+from video.VideoEntry import VideoEntry
+from video.repository import VideoEntryRepository
+from conftest import (
+    RefreshTokenFactory,
+    UserFactory,
+    VideoEntryFactory,
+)
+
+
+pytestmark = pytest.mark.postgresql
+
+
+def import_row(
+    platform: Platform,
+    video_number: int,
+    description: str = "",
+    youtube_description: str | None = None,
+) -> dict:
+    return {
+        "platform": platform,
+        "video_number": video_number,
+        "description": description,
+        "youtube_description": youtube_description,
+        "scheduled_time": None,
+    }
+
+
+async def stored_descriptions(session: AsyncSession) -> dict[str, int]:
+    result = await session.execute(
+        select(Description.body, Description.ref_count)
+    )
+    return {body: ref_count for body, ref_count in result}
+
+
+@pytest.mark.asyncio
+async def test_import_many_copies_and_skips_taken(pg_session: AsyncSession):
+    """
+    COPY into the staging table, then INSERT ... SELECT skips taken
+    numbers and gives their description reference back
+    """
+    user = await UserFactory.create(pg_session)
+    await VideoEntryFactory.create(
+        pg_session,
+        user,
+        video_number = 2,
+        description = "Taken",
+    )
+
+    inserted = await VideoEntryRepository.import_many(
+        pg_session,
+        user.id,
+        [
+            import_row(Platform.TIKTOK, 1, "Imported"),
+            import_row(Platform.TIKTOK, 2, "Imported"),
+            import_row(Platform.YOUTUBE, 1, youtube_description = "Long"),
+        ],
+    )
+
+    assert inserted == {(Platform.TIKTOK, 1), (Platform.YOUTUBE, 1)}
+    assert await stored_descriptions(pg_session) == {
+        "Taken": 1,
+        "Imported": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_many_returns_own_descriptions(
+    pg_session: AsyncSession,
+):
+    """
+    INSERT ... RETURNING reads back each new row's own caption
+    """
+    user = await UserFactory.create(pg_session)
+
+    inserted = await VideoEntryRepository.create_many(
+        pg_session,
+        user.id,
+        [
+            import_row(Platform.TIKTOK, 1, "First"),
+            import_row(Platform.TIKTOK, 2, "Second"),
+            import_row(Platform.TIKTOK, 3),
+        ],
+    )
+
+    assert [row.description for row in inserted] == ["First", "Second", ""]
+
+
+@pytest.mark.asyncio
+async def test_set_youtube_descriptions_skips_filled(
+    pg_session: AsyncSession,
+):
+    """
+    UPDATE ... FROM (VALUES ...) leaves entries filled in the meantime
+    and only counts the rows it wrote
+    """
+    user = await UserFactory.create(pg_session)
+    waiting = await VideoEntryFactory.create(
+        pg_session,
+        user,
+        platform = Platform.YOUTUBE,
+        video_number = 1,
+    )
+    filled = await VideoEntryFactory.create(
+        pg_session,
+        user,
+        platform = Platform.YOUTUBE,
+        video_number = 2,
+    )
+    await pg_session.execute(
+        update(VideoEntry)
+        .where(VideoEntry.id == filled.id)
+        .values(youtube_description = "Manual")
+    )
+
+    written = await VideoEntryRepository.set_youtube_descriptions(
+        pg_session,
+        [(waiting.id, "Backfilled"), (filled.id, "Overwritten")],
+    )
+
+    assert written == 1
+
+    result = await pg_session.execute(
+        select(VideoEntry.id, VideoEntry.youtube_description)
+        .where(VideoEntry.user_id == user.id)
+    )
+    assert dict(result.all()) == {
+        waiting.id: "Backfilled",
+        filled.id: "Manual",
+    }
+
+
+@pytest.mark.asyncio
+async def test_copy_many_shortens_for_youtube(pg_session: AsyncSession):
+    """
+    The shorten_description() SQL function feeds the stored copy text
+    """
+    user = await UserFactory.create(pg_session)
+    await VideoEntryFactory.create(
+        pg_session,
+        user,
+        description = "word " * 40,
+    )
+
+    numbers = await VideoEntryRepository.copy_many(
+        pg_session,
+        VideoEntryRepository.copy_source_filter(user.id),
+        Platform.YOUTUBE,
+        first_number = 1,
+        limit = 1,
+    )
+
+    assert numbers == [1]
+    copied = await pg_session.scalar(
+        select(VideoEntry.youtube_description).where(
+            VideoEntry.user_id == user.id,
+            VideoEntry.platform == Platform.YOUTUBE,
+        )
+    )
+    assert copied.endswith("...")
+    assert len(copied) <= 100
+    assert (await stored_descriptions(pg_session))[copied] == 1
+
+
+@pytest.mark.asyncio
+async def test_rotate_refresh_token_in_one_statement(
+    pg_session: AsyncSession,
+):
+    """
+    The data modifying CTE revokes the token and inserts its successor,
+    a second rotation of the same token matches nothing
+    """
+    user = await UserFactory.create(pg_session)
+    token, _ = await RefreshTokenFactory.create(pg_session, user)
+    expires_at = datetime.now(UTC) + timedelta(days = 7)
+
+    rotated = await RefreshTokenRepository.rotate(
+        pg_session,
+        token.token_hash,
+        "successor",
+        expires_at,
+    )
+
+    assert rotated is not None
+    assert rotated.user_id == user.id
+    assert rotated.family_id == token.family_id
+    assert rotated.token_version == user.token_version
+    successor = await RefreshTokenRepository.get_by_hash(
+        pg_session,
+        "successor",
+    )
+    assert successor.family_id == token.family_id
+    assert await RefreshTokenRepository.rotate(
+        pg_session,
+        token.token_hash,
+        "second",
+        expires_at,
+    ) is None
+
+
+@pytest.mark.asyncio
+async def test_search_matches_either_vector(pg_session: AsyncSession):
+    """
+    websearch_to_tsquery hits the stored description and the entry's own
+    youtube_description, other users' captions never match
+    """
+    user = await UserFactory.create(pg_session)
+    other = await UserFactory.create(pg_session)
+    described = await VideoEntryFactory.create(
+        pg_session,
+        user,
+        description = "Sunset over the harbor",
+    )
+    on_youtube = await VideoEntryFactory.create(
+        pg_session,
+        user,
+        platform = Platform.YOUTUBE,
+        youtube_description = "Walking tour of the harbor",
+    )
+    await VideoEntryFactory.create(
+        pg_session,
+        user,
+        video_number = 2,
+        description = "Unboxing a camera",
+    )
+    await VideoEntryFactory.create(
+        pg_session,
+        other,
+        description = "Sunset over the harbor",
+    )
+
+    hits = await VideoEntryRepository.search(
+        pg_session,
+        user.id,
+        "harbor",
+        limit = 1,
+    )
+    assert len(hits) == 1
+    first, rank = hits[0]
+    rest = await VideoEntryRepository.search(
+        pg_session,
+        user.id,
+        "harbor",
+        limit = 10,
+        after = (rank, first.id),
+    )
+
+    found = {first.id} | {row.id for row, _ in rest}
+    assert found == {described.id, on_youtube.id}
+
+
+@pytest.mark.asyncio
+async def test_find_similar_uses_user_texts(pg_session: AsyncSession):
+    """
+    The pg_trgm % prefilter only returns the user's own near copies
+    """
+    user = await UserFactory.create(pg_session)
+    other = await UserFactory.create(pg_session)
+    source = await VideoEntryFactory.create(
+        pg_session,
+        user,
+        description = "Morning routine for busy creators",
+    )
+    close = await VideoEntryFactory.create(
+        pg_session,
+        user,
+        video_number = 2,
+        description = "Morning routine for busy creator",
+    )
+    await VideoEntryFactory.create(
+        pg_session,
+        other,
+        description = "Morning routine for busy creators",
+    )
+
+    matches = await VideoEntryRepository.find_similar(
+        pg_session,
+        user.id,
+        source.description,
+        limit = 5,
+        min_score = 0.5,
+        exclude_id = source.id,
+    )
+
+    assert [row.id for row, _ in matches] == [close.id]
+    assert 0.8 < matches[0][1] < 1.0
@@ -0,0 +1,147 @@
+"""
+©AngelaMos | 2025
+test_query_counts.py
+
+Statement budgets for hot write endpoints
+
+The test session already holds the authenticated user in its identity
+map, so the per request user lookup is not part of these counts
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from user.User import User
+from auth.RefreshToken import RefreshToken
+from conftest import QueryCounter, VideoEntryFactory
+
+
+URL_LOGIN = "/v1/auth/login"
+URL_REFRESH = "/v1/auth/refresh"
+URL_VIDEOS = "/v1/videos"
+
+
+@pytest.mark.asyncio
+async def test_create_video_query_count(
+    client: AsyncClient,
+    test_user: User,
+    auth_headers: dict[str, str],
+    query_counter: QueryCounter,
+):
+    """
+    Create is number allocation, description upsert, INSERT, stats
+    upsert and duplicate check. The generated search vector is never
+    fetched back
+    """
+    response = await client.post(
+        URL_VIDEOS,
+        headers = auth_headers,
+        json = {"platform": "tiktok", "description": "Counted"},
+    )
+
+    assert response.status_code == 201
+    assert query_counter.count == 5
+    assert not any("search_vector" in s for s in query_counter.statements)
+
+
+@pytest.mark.asyncio
+async def test_update_video_query_count(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+    query_counter: QueryCounter,
+):
+    """
+    Update is entry lookup, description upsert, UPDATE with no refresh
+    SELECT, the list version bump and duplicate check. The factory entry
+    has an empty description so there is no reference to release, and
+    the UPDATE does not return the regenerated search vector
+    """
+    entry = await VideoEntryFactory.create(db_session, test_user)
+    query_counter.reset()
+
+    response = await client.patch(
+        f"{URL_VIDEOS}/{entry.id}",
+        headers = auth_headers,
+        json = {"description": "Counted"},
+    )
+
+    assert response.status_code == 200
+    assert query_counter.count == 5
+    assert not any("search_vector" in s for s in query_counter.statements)
+
+
+@pytest.mark.asyncio
+async def test_login_query_count(
+    client: AsyncClient,
+    test_user: User,
+    query_counter: QueryCounter,
+):
+    """
+    Login is user lookup and refresh token INSERT
+    """
+    response = await client.post(
+        URL_LOGIN,
+        data = {
+            "username": test_user.email,
+            "password": "TestPass123",
+        },
+    )
+
+    assert response.status_code == 200
+    assert query_counter.count == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_query_count(
+    client: AsyncClient,
+    refresh_token_pair: tuple[RefreshToken,
+                              str],
+    query_counter: QueryCounter,
+):
+    """
+    Refresh is the rotating UPDATE and the successor INSERT, which
+    PostgreSQL runs as one statement
+    """
+    _, raw_token = refresh_token_pair
+
+    response = await client.post(
+        URL_REFRESH,
+        cookies = {"refresh_token": raw_token},
+    )
+
+    assert response.status_code == 200
+    assert query_counter.count == 2
+
+
+@pytest.mark.asyncio
+async def test_similar_query_count(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+    query_counter: QueryCounter,
+):
+    """
+    Similar is source lookup and one scored lookup that only reads the
+    user's own descriptions
+    """
+    entry = await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        description = "Counted caption",
+    )
+    query_counter.reset()
+
+    response = await client.get(
+        f"{URL_VIDEOS}/{entry.id}/similar",
+        headers = auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert query_counter.count == 2
+    lookup = query_counter.statements[-1]
+    assert "similarity(descriptions.body" in lookup
+    assert "descriptions.user_id = ?" in lookup
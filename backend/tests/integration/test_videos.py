@@ -0,0 +1,1729 @@
+"""
+©AngelaMos | 2025
+test_videos.py
+"""
+
+import io
+import csv
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import Platform, settings
+from user.User import User
+from video.Description import Description
+from video.VideoEntry import VideoEntry
+from video.VideoStats import VideoStats
+from video.repository import VideoEntryRepository, VideoStatsRepository
+from video.VideoTombstone import VideoTombstone
+from conftest import (
+    QueryCounter,
+    UserFactory,
+    VideoEntryFactory,
+)
+
+
+URL_VIDEOS = "/v1/videos"
+URL_VIDEO_STATS = "/v1/videos/stats"
+URL_VIDEO_CHANGES = "/v1/videos/changes"
+URL_ADMIN_STATS_REBUILD = "/v1/admin/video-stats/rebuild"
+URL_ADMIN_YOUTUBE_BACKFILL = (
+    "/v1/admin/video-entries/youtube-descriptions/backfill"
+)
+URL_ADMIN_DESCRIPTIONS_COLLECT = "/v1/admin/descriptions/collect"
+
+
+def url_video_by_id(entry_id: str) -> str:
+    return f"{URL_VIDEOS}/{entry_id}"
+
+
+async def stored_descriptions(session: AsyncSession) -> dict[str, int]:
+    """
+    Stored description bodies with their reference counts
+    """
+    result = await session.execute(
+        select(Description.body, Description.ref_count)
+    )
+    return {body: ref_count for body, ref_count in result}
+
+
+async def collect_pages(
+    client: AsyncClient,
+    headers: dict[str, str],
+    params: dict[str, str | int],
+) -> list[dict]:
+    """
+    Walk every page of a list view by following next_cursor
+    """
+    items: list[dict] = []
+    cursor = None
+    while True:
+        page_params = dict(params)
+        if cursor:
+            page_params["cursor"] = cursor
+        response = await client.get(
+            URL_VIDEOS,
+            headers = headers,
+            params = page_params,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        items.extend(data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return items
+
+
+@pytest.mark.asyncio
+async def test_create_video_entry(
+    client: AsyncClient,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Creating a video entry returns it with its number
+    """
+    response = await client.post(
+        URL_VIDEOS,
+        headers = auth_headers,
+        json = {
+            "platform": "tiktok",
+            "video_number": 1,
+            "description": "First video",
+        },
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["platform"] == "tiktok"
+    assert data["video_number"] == 1
+    assert data["description"] == "First video"
+
+
+@pytest.mark.asyncio
+async def test_list_videos_cursor_platform(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Following next_cursor walks a platform in video_number order
+    """
+    await VideoEntryFactory.create_batch(db_session, test_user, 5)
+    await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        platform = Platform.YOUTUBE,
+    )
+
+    items = await collect_pages(
+        client,
+        auth_headers,
+        {
+            "platform": "tiktok",
+            "size": 2
+        },
+    )
+
+    assert [item["video_number"] for item in items] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_list_videos_cursor_all_platforms(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Following next_cursor walks every entry newest first without repeats
+    """
+    entries = await VideoEntryFactory.create_batch(db_session, test_user, 4)
+    entries += await VideoEntryFactory.create_batch(
+        db_session,
+        test_user,
+        3,
+        platform = Platform.INSTAGRAM,
+    )
+
+    items = await collect_pages(client, auth_headers, {"size": 3})
+
+    assert [item["id"] for item in items
+            ] == [str(e.id) for e in reversed(entries)]
+
+
+@pytest.mark.asyncio
+async def test_list_videos_cursor_platform_mismatch(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    A cursor from one view cannot be replayed against another
+    """
+    await VideoEntryFactory.create_batch(db_session, test_user, 3)
+
+    response = await client.get(
+        URL_VIDEOS,
+        headers = auth_headers,
+        params = {
+            "platform": "tiktok",
+            "size": 1
+        },
+    )
+    cursor = response.json()["next_cursor"]
+
+    response = await client.get(
+        URL_VIDEOS,
+        headers = auth_headers,
+        params = {"cursor": cursor},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_videos_invalid_cursor(
+    client: AsyncClient,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Garbage cursor returns 422
+    """
+    response = await client.get(
+        URL_VIDEOS,
+        headers = auth_headers,
+        params = {"cursor": "not-a-cursor"},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_videos_has_more_without_total(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    List reports has_more and skips the count unless asked
+    """
+    await VideoEntryFactory.create_batch(db_session, test_user, 3)
+
+    response = await client.get(
+        URL_VIDEOS,
+        headers = auth_headers,
+        params = {"size": 2},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 2
+    assert data["has_more"] is True
+    assert data["total"] is None
+
+    response = await client.get(
+        URL_VIDEOS,
+        headers = auth_headers,
+        params = {
+            "size": 3,
+            "include_total": True
+        },
+    )
+
+    data = response.json()
+    assert data["has_more"] is False
+    assert data["next_cursor"] is None
+    assert data["total"] == 3
+
+
+def stats_for(data: dict, platform: str) -> dict:
+    return next(p for p in data["platforms"] if p["platform"] == platform)
+
+
+@pytest.mark.asyncio
+async def test_video_stats_maintained_on_write(
+    client: AsyncClient,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Stats follow creates, copies, edits and deletes
+    """
+    soon = datetime.now(UTC) + timedelta(days = 1)
+    later = soon + timedelta(days = 1)
+    created = []
+    for number, scheduled in ((1, later), (2, soon)):
+        response = await client.post(
+            URL_VIDEOS,
+            headers = auth_headers,
+            json = {
+                "platform": "tiktok",
+                "video_number": number,
+                "scheduled_time": scheduled.isoformat(),
+            },
+        )
+        created.append(response.json())
+    await client.post(
+        f"{url_video_by_id(created[0]['id'])}/copy",
+        headers = auth_headers,
+        json = {"target_platform": "youtube"},
+    )
+
+    data = (await client.get(URL_VIDEO_STATS, headers = auth_headers)).json()
+    tiktok = stats_for(data, "tiktok")
+    assert data["total_entries"] == 3
+    assert tiktok["entry_count"] == 2
+    assert tiktok["max_video_number"] == 2
+    assert tiktok["next_scheduled_time"].startswith(soon.date().isoformat())
+    assert stats_for(data, "youtube")["entry_count"] == 1
+    assert stats_for(data, "instagram")["entry_count"] == 0
+
+    await client.delete(
+        url_video_by_id(created[1]["id"]),
+        headers = auth_headers,
+    )
+    await client.patch(
+        url_video_by_id(created[0]["id"]),
+        headers = auth_headers,
+        json = {"video_number": 7},
+    )
+
+    data = (await client.get(URL_VIDEO_STATS, headers = auth_headers)).json()
+    tiktok = stats_for(data, "tiktok")
+    assert tiktok["entry_count"] == 1
+    assert tiktok["max_video_number"] == 7
+    assert tiktok["next_scheduled_time"].startswith(later.date().isoformat())
+
+
+@pytest.mark.asyncio
+async def test_admin_rebuild_video_stats(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+    admin_user: User,
+    admin_auth_headers: dict[str, str],
+):
+    """
+    Admin rebuild repairs stats that drifted from the entries
+    """
+    entry = VideoEntry(
+        user_id = test_user.id,
+        platform = Platform.INSTAGRAM,
+        video_number = 4,
+    )
+    db_session.add(entry)
+    await db_session.flush()
+
+    data = (await client.get(URL_VIDEO_STATS, headers = auth_headers)).json()
+    assert stats_for(data, "instagram")["entry_count"] == 0
+
+    response = await client.post(
+        URL_ADMIN_STATS_REBUILD,
+        headers = admin_auth_headers,
+        params = {"user_id": str(test_user.id)},
+    )
+    assert response.status_code == 200
+    assert response.json()["rebuilt"] == 1
+
+    data = (await client.get(URL_VIDEO_STATS, headers = auth_headers)).json()
+    assert stats_for(data, "instagram")["entry_count"] == 1
+    assert stats_for(data, "instagram")["max_video_number"] == 4
+
+
+@pytest.mark.asyncio
+async def test_stats_row_locked_before_entries_change(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+    query_counter: QueryCounter,
+):
+    """
+    Deletes and schedule edits lock the stats row before touching entries,
+    so the recount that follows sees every write committed before it
+    """
+    entries = await VideoEntryFactory.create_batch(db_session, test_user, 2)
+
+    def lock_precedes(write: str) -> bool:
+        statements = query_counter.statements
+        lock = next(
+            i for i, sql in enumerate(statements)
+            if sql.lstrip().startswith("SELECT video_stats.platform")
+        )
+        return lock < next(
+            i for i, sql in enumerate(statements) if sql.startswith(write)
+        )
+
+    query_counter.reset()
+    await client.patch(
+        url_video_by_id(str(entries[0].id)),
+        headers = auth_headers,
+        json = {"scheduled_time": datetime.now(UTC).isoformat()},
+    )
+    assert lock_precedes("UPDATE video_entries")
+
+    query_counter.reset()
+    await client.delete(
+        url_video_by_id(str(entries[1].id)),
+        headers = auth_headers,
+    )
+    assert lock_precedes("DELETE FROM video_entries")
+
+    query_counter.reset()
+    await client.post(
+        f"{URL_VIDEOS}/batch/delete",
+        headers = auth_headers,
+        json = {"ids": [str(entries[0].id)]},
+    )
+    assert lock_precedes("DELETE FROM video_entries")
+
+
+@pytest.mark.asyncio
+async def test_create_refresh_never_lowers_max_number(
+    db_session: AsyncSession,
+    test_user: User,
+):
+    """
+    A create keeps a higher max_video_number written by a concurrent
+    create whose entry this snapshot cannot see yet
+    """
+    await VideoEntryFactory.create(db_session, test_user, video_number = 3)
+    await db_session.execute(
+        update(VideoStats)
+        .where(VideoStats.user_id == test_user.id)
+        .values(max_video_number = 9)
+    )
+
+    await VideoStatsRepository.refresh(
+        db_session,
+        test_user.id,
+        Platform.TIKTOK,
+        count_delta = 1,
+    )
+
+    stored = await db_session.scalar(
+        select(VideoStats.max_video_number)
+        .where(VideoStats.user_id == test_user.id)
+    )
+    assert stored == 9
+
+
+@pytest.mark.asyncio
+async def test_create_video_entry_allocates_number(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Omitting video_number allocates past every number ever used
+    """
+    entries = await VideoEntryFactory.create_batch(db_session, test_user, 3)
+    await client.delete(
+        url_video_by_id(str(entries[-1].id)),
+        headers = auth_headers,
+    )
+
+    response = await client.post(
+        URL_VIDEOS,
+        headers = auth_headers,
+        json = {"platform": "tiktok"},
+    )
+
+    assert response.status_code == 201
+    assert response.json()["video_number"] == 4
+
+    response = await client.post(
+        f"{url_video_by_id(str(entries[0].id))}/copy",
+        headers = auth_headers,
+        json = {"target_platform": "instagram"},
+    )
+    assert response.json()["video_number"] == 1
+
+
+@pytest.mark.asyncio
+async def test_create_video_entry_duplicate_number(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Reusing a video number on the same platform returns 409
+    """
+    await VideoEntryFactory.create(db_session, test_user, video_number = 5)
+
+    response = await client.post(
+        URL_VIDEOS,
+        headers = auth_headers,
+        json = {
+            "platform": "tiktok",
+            "video_number": 5,
+        },
+    )
+
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_batch_create_video_entries(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Batch create numbers each platform contiguously and reports conflicts
+    """
+    await VideoEntryFactory.create(db_session, test_user, video_number = 2)
+
+    response = await client.post(
+        f"{URL_VIDEOS}/batch",
+        headers = auth_headers,
+        json = {
+            "items": [
+                {"platform": "tiktok", "description": "a"},
+                {"platform": "youtube", "description": "b"},
+                {"platform": "tiktok", "video_number": 2},
+                {"platform": "tiktok", "description": "c"},
+                {"platform": "instagram", "video_number": 5},
+                {"platform": "instagram", "video_number": 5},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    results = data["results"]
+    assert data["created"] == 4
+    assert [r["status"] for r in results] == [
+        "created", "created", "conflict", "created", "created", "conflict"
+    ]
+    assert results[0]["entry"]["video_number"] == 3
+    assert results[1]["entry"]["video_number"] == 1
+    assert results[3]["entry"]["video_number"] == 4
+    assert [results[i]["entry"]["description"] for i in (0, 1, 3, 4)] == [
+        "a", "b", "c", ""
+    ]
+
+    stats = (await client.get(URL_VIDEO_STATS, headers = auth_headers)).json()
+    assert stats_for(stats, "tiktok")["entry_count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_by_platform_filter(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Bulk copy mirrors entries after a number and shortens for YouTube
+    """
+    await VideoEntryFactory.create_batch(db_session, test_user, 4)
+    await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        video_number = 5,
+        description = "word " * 40,
+    )
+    await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        platform = Platform.YOUTUBE,
+        video_number = 10,
+    )
+
+    response = await client.post(
+        f"{URL_VIDEOS}/copy",
+        headers = auth_headers,
+        json = {
+            "target_platform": "youtube",
+            "source_platform": "tiktok",
+            "after_video_number": 2,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "copied": 3,
+        "first_video_number": 11,
+        "last_video_number": 13,
+    }
+
+    items = await collect_pages(
+        client,
+        auth_headers,
+        {"platform": "youtube"},
+    )
+    copies = items[1:]
+    assert [c["description"] for c in copies[:2]] == ["Video 3", "Video 4"]
+    assert len(copies[2]["description"]) <= 100
+    assert copies[2]["description"].endswith("word...")
+    assert copies[2]["youtube_description"] == copies[2]["description"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_reports_created_numbers(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Numbers already taken are skipped and not reported as created
+    """
+    await VideoEntryFactory.create_batch(db_session, test_user, 3)
+    await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        platform = Platform.YOUTUBE,
+        video_number = 3,
+    )
+    await db_session.execute(
+        update(VideoStats).where(
+            VideoStats.user_id == test_user.id,
+            VideoStats.platform == Platform.YOUTUBE,
+        ).values(last_video_number = 0)
+    )
+
+    response = await client.post(
+        f"{URL_VIDEOS}/copy",
+        headers = auth_headers,
+        json = {
+            "target_platform": "youtube",
+            "source_platform": "tiktok",
+        },
+    )
+
+    assert response.json() == {
+        "copied": 2,
+        "first_video_number": 1,
+        "last_video_number": 2,
+    }
+    created = await client.post(
+        URL_VIDEOS,
+        headers = auth_headers,
+        json = {"platform": "youtube", "description": "Next"},
+    )
+    assert created.json()["video_number"] == 4
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_limit_stores_only_copied_descriptions(
+    db_session: AsyncSession,
+    test_user: User,
+):
+    """
+    A capped copy stores shortened captions only for the rows it copies
+    """
+    for number in range(1, 4):
+        await VideoEntryFactory.create(
+            db_session,
+            test_user,
+            video_number = number,
+            description = f"caption {number} " + "word " * 40,
+        )
+    before = await stored_descriptions(db_session)
+
+    numbers = await VideoEntryRepository.copy_many(
+        db_session,
+        VideoEntryRepository.copy_source_filter(
+            test_user.id,
+            source_platform = Platform.TIKTOK,
+        ),
+        Platform.YOUTUBE,
+        first_number = 1,
+        limit = 1,
+    )
+
+    assert numbers == [1]
+    added = set(await stored_descriptions(db_session)) - set(before)
+    assert len(added) == 1
+    assert next(iter(added)).startswith("caption 1 ")
+
+
+@pytest.mark.asyncio
+async def test_release_numbers_gives_back_unused_tail(
+    db_session: AsyncSession,
+    test_user: User,
+):
+    """
+    Releasing a reserved block drops the counter to the last used number
+    """
+    await VideoEntryFactory.create(db_session, test_user)
+    first = await VideoStatsRepository.allocate_numbers(
+        db_session,
+        test_user.id,
+        Platform.TIKTOK,
+        count = 5,
+    )
+    await VideoEntryFactory.create(db_session, test_user, video_number = first)
+
+    await VideoStatsRepository.release_numbers(
+        db_session,
+        test_user.id,
+        Platform.TIKTOK,
+        first = first,
+        last = first + 4,
+    )
+
+    counter = await db_session.scalar(
+        select(VideoStats.last_video_number).where(
+            VideoStats.user_id == test_user.id,
+            VideoStats.platform == Platform.TIKTOK,
+        )
+    )
+    assert counter == first
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_by_ids(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Bulk copy by id list only copies the caller's own entries
+    """
+    entries = await VideoEntryFactory.create_batch(db_session, test_user, 3)
+    other = await UserFactory.create(db_session)
+    foreign = await VideoEntryFactory.create(db_session, other)
+
+    response = await client.post(
+        f"{URL_VIDEOS}/copy",
+        headers = auth_headers,
+        json = {
+            "target_platform": "instagram",
+            "entry_ids": [str(entries[0].id), str(foreign.id)],
+        },
+    )
+
+    assert response.json()["copied"] == 1
+    stats = (await client.get(URL_VIDEO_STATS, headers = auth_headers)).json()
+    assert stats_for(stats, "instagram")["entry_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_video_entries(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Bulk update reschedules owned entries and reports unknown ids
+    """
+    entries = await VideoEntryFactory.create_batch(db_session, test_user, 3)
+    other = await UserFactory.create(db_session)
+    foreign = await VideoEntryFactory.create(db_session, other)
+    scheduled = datetime.now(UTC) + timedelta(days = 3)
+
+    response = await client.patch(
+        f"{URL_VIDEOS}/batch",
+        headers = auth_headers,
+        json = {
+            "ids": [str(entries[0].id), str(entries[2].id), str(foreign.id)],
+            "scheduled_time": scheduled.isoformat(),
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["affected"] == 2
+    assert [r["status"] for r in data["results"]] == [
+        "updated", "updated", "not_found"
+    ]
+    assert data["results"][0]["entry"]["scheduled_time"] is not None
+
+    stats = (await client.get(URL_VIDEO_STATS, headers = auth_headers)).json()
+    assert stats_for(stats, "tiktok")["next_scheduled_time"] is not None
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_requires_changes(
+    client: AsyncClient,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Bulk update without any field to change returns 422
+    """
+    response = await client.patch(
+        f"{URL_VIDEOS}/batch",
+        headers = auth_headers,
+        json = {"ids": [str(test_user.id)]},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_video_entries(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Bulk delete removes owned entries and keeps stats in step
+    """
+    entries = await VideoEntryFactory.create_batch(db_session, test_user, 3)
+
+    response = await client.post(
+        f"{URL_VIDEOS}/batch/delete",
+        headers = auth_headers,
+        json = {"ids": [str(entries[1].id), str(entries[2].id), str(test_user.id)]},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["affected"] == 2
+    assert [r["status"] for r in data["results"]] == [
+        "deleted", "deleted", "not_found"
+    ]
+
+    stats = (await client.get(URL_VIDEO_STATS, headers = auth_headers)).json()
+    assert stats_for(stats, "tiktok")["entry_count"] == 1
+    assert stats_for(stats, "tiktok")["max_video_number"] == 1
+
+
+@pytest.mark.asyncio
+async def test_video_changes_delta_sync(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    After a snapshot the feed returns only edits, creates and deletes
+    """
+    monkeypatch.setattr(settings, "VIDEO_SYNC_OVERLAP_SECONDS", 0)
+    entries = await VideoEntryFactory.create_batch(db_session, test_user, 3)
+
+    snapshot = await client.get(URL_VIDEO_CHANGES, headers = auth_headers)
+    assert snapshot.status_code == 200
+    data = snapshot.json()
+    assert len(data["upserted"]) == 3
+    assert data["deleted"] == []
+    assert data["has_more"] is False
+    token = data["next_token"]
+
+    await client.delete(
+        url_video_by_id(str(entries[1].id)),
+        headers = auth_headers,
+    )
+    await client.patch(
+        url_video_by_id(str(entries[0].id)),
+        headers = auth_headers,
+        json = {"description": "Edited"},
+    )
+    created = await client.post(
+        URL_VIDEOS,
+        headers = auth_headers,
+        json = {"platform": "tiktok", "description": "New"},
+    )
+
+    response = await client.get(
+        URL_VIDEO_CHANGES,
+        headers = auth_headers,
+        params = {"since": token},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [e["id"] for e in data["upserted"]] == [
+        str(entries[0].id), created.json()["id"]
+    ]
+    assert data["upserted"][0]["description"] == "Edited"
+    assert data["deleted"] == [str(entries[1].id)]
+    assert data["reset"] is False
+
+    response = await client.get(
+        URL_VIDEO_CHANGES,
+        headers = auth_headers,
+        params = {"since": data["next_token"]},
+    )
+    assert response.json()["upserted"] == []
+    assert response.json()["deleted"] == []
+
+
+@pytest.mark.asyncio
+async def test_video_changes_late_commit(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Writes stamped before a sync but committed after it still arrive
+    """
+    entries = await VideoEntryFactory.create_batch(db_session, test_user, 2)
+
+    snapshot = await client.get(URL_VIDEO_CHANGES, headers = auth_headers)
+    token = snapshot.json()["next_token"]
+    stamped = max(e.updated_at for e in entries) - timedelta(seconds = 10)
+
+    late = await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        video_number = 3,
+    )
+    await client.delete(
+        url_video_by_id(str(entries[0].id)),
+        headers = auth_headers,
+    )
+    await db_session.execute(
+        update(VideoEntry).where(VideoEntry.id == late.id)
+        .values(updated_at = stamped)
+    )
+    await db_session.execute(
+        update(VideoTombstone).where(VideoTombstone.entry_id == entries[0].id)
+        .values(deleted_at = stamped)
+    )
+
+    response = await client.get(
+        URL_VIDEO_CHANGES,
+        headers = auth_headers,
+        params = {"since": token},
+    )
+
+    data = response.json()
+    assert str(late.id) in {e["id"] for e in data["upserted"]}
+    assert data["deleted"] == [str(entries[0].id)]
+    assert data["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_video_changes_paging(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    The feed pages through every entry with next_token
+    """
+    await VideoEntryFactory.create_batch(db_session, test_user, 5)
+
+    seen: list[str] = []
+    params: dict[str, str | int] = {"size": 2}
+    while True:
+        response = await client.get(
+            URL_VIDEO_CHANGES,
+            headers = auth_headers,
+            params = params,
+        )
+        data = response.json()
+        seen.extend(e["id"] for e in data["upserted"])
+        params["since"] = data["next_token"]
+        if not data["has_more"]:
+            break
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+
+@pytest.mark.asyncio
+async def test_video_changes_pages_tombstones(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Deletes sharing one deleted_at are capped per page and resume after
+    the last id sent
+    """
+    entries = await VideoEntryFactory.create_batch(db_session, test_user, 5)
+    snapshot = await client.get(URL_VIDEO_CHANGES, headers = auth_headers)
+    await client.post(
+        f"{URL_VIDEOS}/batch/delete",
+        headers = auth_headers,
+        json = {"ids": [str(e.id) for e in entries]},
+    )
+
+    pages: list[list[str]] = []
+    params: dict[str, str | int] = {
+        "size": 2,
+        "since": snapshot.json()["next_token"],
+    }
+    while True:
+        data = (
+            await client.get(
+                URL_VIDEO_CHANGES,
+                headers = auth_headers,
+                params = params,
+            )
+        ).json()
+        pages.append(data["deleted"])
+        params["since"] = data["next_token"]
+        if not data["has_more"]:
+            break
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert sorted(sum(pages, [])) == sorted(str(e.id) for e in entries)
+
+
+@pytest.mark.asyncio
+async def test_video_changes_invalid_token(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+):
+    """
+    A malformed sync token returns 422
+    """
+    response = await client.get(
+        URL_VIDEO_CHANGES,
+        headers = auth_headers,
+        params = {"since": "not-a-token"},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_video_entry_etag(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Entry reads return an ETag, 304 until the entry changes
+    """
+    entry = await VideoEntryFactory.create(db_session, test_user)
+    url = url_video_by_id(str(entry.id))
+
+    first = await client.get(url, headers = auth_headers)
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    cached = await client.get(
+        url,
+        headers = {**auth_headers, "If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    await client.patch(
+        url,
+        headers = auth_headers,
+        json = {"description": "Changed"},
+    )
+    changed = await client.get(
+        url,
+        headers = {**auth_headers, "If-None-Match": etag},
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_videos_etag(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    List ETags follow the user's write version and the query
+    """
+    entries = await VideoEntryFactory.create_batch(db_session, test_user, 2)
+    params = {"platform": "tiktok"}
+
+    first = await client.get(URL_VIDEOS, headers = auth_headers, params = params)
+    etag = first.headers["etag"]
+
+    cached = await client.get(
+        URL_VIDEOS,
+        headers = {**auth_headers, "If-None-Match": etag},
+        params = params,
+    )
+    assert cached.status_code == 304
+
+    other_size = await client.get(
+        URL_VIDEOS,
+        headers = {**auth_headers, "If-None-Match": etag},
+        params = {**params, "size": 5},
+    )
+    assert other_size.status_code == 200
+
+    await client.patch(
+        url_video_by_id(str(entries[0].id)),
+        headers = auth_headers,
+        json = {"description": "Changed"},
+    )
+    changed = await client.get(
+        URL_VIDEOS,
+        headers = {**auth_headers, "If-None-Match": etag},
+        params = params,
+    )
+    assert changed.status_code == 200
+    assert changed.json()["items"][0]["description"] == "Changed"
+
+
+@pytest.mark.asyncio
+async def test_search_video_entries(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Search matches either description and only the user's entries
+    """
+    cooking = await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        video_number = 1,
+        description = "Cooking pasta at home",
+    )
+    await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        video_number = 2,
+        description = "Gym routine",
+    )
+    short = await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        platform = Platform.YOUTUBE,
+        description = "Quick dinner",
+        youtube_description = "Pasta in five minutes",
+    )
+    other = await UserFactory.create(db_session)
+    await VideoEntryFactory.create(db_session, other, description = "Pasta")
+
+    response = await client.get(
+        f"{URL_VIDEOS}/search",
+        headers = auth_headers,
+        params = {"q": "pasta"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert {e["id"] for e in data["items"]} == {str(cooking.id), str(short.id)}
+    assert data["has_more"] is False
+
+    response = await client.get(
+        f"{URL_VIDEOS}/search",
+        headers = auth_headers,
+        params = {"q": "pasta", "platform": "youtube"},
+    )
+    assert [e["id"] for e in response.json()["items"]] == [str(short.id)]
+
+
+@pytest.mark.asyncio
+async def test_search_video_entries_paging(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Search pages follow next_cursor without repeats
+    """
+    for number in range(1, 6):
+        await VideoEntryFactory.create(
+            db_session,
+            test_user,
+            video_number = number,
+            description = "travel " * number + "vlog",
+        )
+
+    seen: list[str] = []
+    params: dict[str, str | int] = {"q": "travel", "size": 2}
+    while True:
+        response = await client.get(
+            f"{URL_VIDEOS}/search",
+            headers = auth_headers,
+            params = params,
+        )
+        data = response.json()
+        seen.extend(e["id"] for e in data["items"])
+        if not data["has_more"]:
+            break
+        params["cursor"] = data["next_cursor"]
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+
+@pytest.mark.asyncio
+async def test_similar_video_entries(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Similar returns the user's closest captions with scores
+    """
+    source = await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        video_number = 1,
+        description = "Morning routine for busy creators",
+    )
+    close = await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        video_number = 2,
+        description = "Morning routine for busy creator",
+    )
+    await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        video_number = 3,
+        description = "Unboxing a new camera",
+    )
+    other = await UserFactory.create(db_session)
+    await VideoEntryFactory.create(
+        db_session,
+        other,
+        description = "Morning routine for busy creators",
+    )
+
+    response = await client.get(
+        f"{url_video_by_id(str(source.id))}/similar",
+        headers = auth_headers,
+    )
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [m["entry"]["id"] for m in items] == [str(close.id)]
+    assert 0.8 < items[0]["score"] < 1.0
+
+
+@pytest.mark.asyncio
+async def test_create_video_reports_duplicates(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Creating a near copy of a caption on the same platform reports it
+    """
+    existing = await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        description = "Three tips for better lighting at home",
+    )
+
+    response = await client.post(
+        URL_VIDEOS,
+        headers = auth_headers,
+        json = {
+            "platform": "tiktok",
+            "description": "Three tips for better lighting at home!",
+        },
+    )
+    assert response.status_code == 201
+    duplicates = response.json()["duplicates"]
+    assert [d["entry"]["id"] for d in duplicates] == [str(existing.id)]
+
+    response = await client.post(
+        URL_VIDEOS,
+        headers = auth_headers,
+        json = {
+            "platform": "instagram",
+            "description": "Three tips for better lighting at home",
+        },
+    )
+    assert response.json()["duplicates"] == []
+
+
+@pytest.mark.asyncio
+async def test_video_schedule_day_buckets_in_time_zone(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Day buckets follow the requested zone across a DST change
+    """
+    for number, scheduled in enumerate(
+        [
+            datetime(2026, 3, 8, 4, 30, tzinfo = UTC),
+            datetime(2026, 3, 8, 14, 0, tzinfo = UTC),
+            datetime(2026, 3, 9, 0, 0, tzinfo = UTC),
+            datetime(2026, 4, 1, 12, 0, tzinfo = UTC),
+        ],
+        start = 1,
+    ):
+        await VideoEntryFactory.create(
+            db_session,
+            test_user,
+            video_number = number,
+            scheduled_time = scheduled,
+        )
+    other = await UserFactory.create(db_session)
+    await VideoEntryFactory.create(
+        db_session,
+        other,
+        scheduled_time = datetime(2026, 3, 8, 14, 0, tzinfo = UTC),
+    )
+
+    response = await client.get(
+        f"{URL_VIDEOS}/schedule",
+        headers = auth_headers,
+        params = {
+            "from": "2026-03-07T00:00:00",
+            "to": "2026-03-10T00:00:00",
+            "tz": "America/New_York",
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["buckets"] == [
+        {"start": "2026-03-07T00:00:00-05:00", "count": 1},
+        {"start": "2026-03-08T00:00:00-05:00", "count": 2},
+    ]
+    assert [e["video_number"] for e in data["entries"]] == [1, 2, 3]
+    assert data["truncated"] is False
+
+
+@pytest.mark.asyncio
+async def test_video_schedule_hour_buckets(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    Hour buckets group entries within the same hour
+    """
+    for number, minute in enumerate([5, 50], start = 1):
+        await VideoEntryFactory.create(
+            db_session,
+            test_user,
+            video_number = number,
+            scheduled_time = datetime(2026, 5, 1, 10, minute, tzinfo = UTC),
+        )
+
+    response = await client.get(
+        f"{URL_VIDEOS}/schedule",
+        headers = auth_headers,
+        params = {
+            "from": "2026-05-01T00:00:00Z",
+            "to": "2026-05-02T00:00:00Z",
+            "interval": "hour",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["buckets"] == [
+        {"start": "2026-05-01T10:00:00Z", "count": 2},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_video_schedule_reversed_range(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+):
+    """
+    A range ending before it starts returns 422
+    """
+    response = await client.get(
+        f"{URL_VIDEOS}/schedule",
+        headers = auth_headers,
+        params = {"from": "2026-05-02T00:00:00", "to": "2026-05-01T00:00:00"},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_video_schedule_unknown_time_zone(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+):
+    """
+    An unknown IANA zone returns 422
+    """
+    response = await client.get(
+        f"{URL_VIDEOS}/schedule",
+        headers = auth_headers,
+        params = {
+            "from": "2026-05-01T00:00:00",
+            "to": "2026-05-02T00:00:00",
+            "tz": "Mars/Base",
+        },
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_export_video_entries_ndjson(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    NDJSON export streams one entry per line in video number order
+    """
+    for number in range(1, 4):
+        await VideoEntryFactory.create(
+            db_session,
+            test_user,
+            video_number = number,
+            description = f"Export {number}",
+        )
+    await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        platform = Platform.YOUTUBE,
+        video_number = 1,
+    )
+
+    response = await client.get(
+        f"{URL_VIDEOS}/export",
+        headers = auth_headers,
+        params = {"platform": Platform.TIKTOK.value},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert "video-entries.ndjson" in response.headers["content-disposition"]
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["video_number"] for line in lines] == [1, 2, 3]
+    assert lines[0]["description"] == "Export 1"
+
+
+@pytest.mark.asyncio
+async def test_export_video_entries_csv(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    CSV export starts with a header row and leaves missing values empty
+    """
+    entry = await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        description = "Hello, world",
+    )
+
+    response = await client.get(
+        f"{URL_VIDEOS}/export",
+        headers = auth_headers,
+        params = {"format": "csv"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["id"] == str(entry.id)
+    assert rows[0]["description"] == "Hello, world"
+    assert rows[0]["youtube_description"] == ""
+
+
+@pytest.mark.asyncio
+async def test_import_video_entries_ndjson(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+):
+    """
+    NDJSON import numbers new entries and reports bad lines by number
+    """
+    await VideoEntryFactory.create(db_session, test_user, video_number = 5)
+    body = "\n".join([
+        json.dumps({"platform": "tiktok", "description": "First"}),
+        "",
+        "{not json",
+        json.dumps({"platform": "tiktok", "video_number": 5}),
+        json.dumps({"platform": "myspace"}),
+        json.dumps({"platform": "youtube", "video_number": 9}),
+    ])
+
+    response = await client.post(
+        f"{URL_VIDEOS}/import",
+        headers = {**auth_headers, "Content-Type": "application/x-ndjson"},
+        content = body.encode(),
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["imported"] == 2
+    assert data["failed"] == 3
+    assert [e["line"] for e in data["errors"]] == [3, 4, 5]
+
+    entries = (await client.get(URL_VIDEOS, headers = auth_headers)).json()
+    numbers = {(e["platform"], e["video_number"]) for e in entries["items"]}
+    assert numbers == {("tiktok", 5), ("tiktok", 6), ("youtube", 9)}
+
+
+@pytest.mark.asyncio
+async def test_import_video_entries_csv(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+):
+    """
+    CSV import accepts quoted cells spanning lines and empty numbers
+    """
+    body = (
+        "platform,video_number,description\r\n"
+        "instagram,,\"Line one\nLine two\"\r\n"
+        "instagram,,Second\r\n"
+    )
+
+    response = await client.post(
+        f"{URL_VIDEOS}/import",
+        headers = {**auth_headers, "Content-Type": "text/csv"},
+        params = {"format": "csv"},
+        content = body.encode(),
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"imported": 2, "failed": 0, "errors": []}
+
+    entries = (
+        await client.get(
+            URL_VIDEOS,
+            headers = auth_headers,
+            params = {"platform": "instagram"},
+        )
+    ).json()["items"]
+    by_number = {e["video_number"]: e["description"] for e in entries}
+    assert by_number == {1: "Line one\nLine two", 2: "Second"}
+
+
+@pytest.mark.asyncio
+async def test_import_video_entries_csv_requires_platform(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+):
+    """
+    A CSV header without a platform column returns 422
+    """
+    response = await client.post(
+        f"{URL_VIDEOS}/import",
+        headers = auth_headers,
+        params = {"format": "csv"},
+        content = b"description\nHello\n",
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_admin_backfill_youtube_descriptions(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+    admin_user: User,
+    admin_auth_headers: dict[str, str],
+):
+    """
+    Backfill shortens YouTube descriptions in resumable runs and leaves
+    entries that already have one alone
+    """
+    family = "\U0001f468\u200d\U0001f469\u200d\U0001f467"
+    captions = [
+        "Short one",
+        "word " * 40,
+        "a" * 95 + family + " tail",
+        "Road trip day, " + "#roadtrip " * 10,
+    ]
+    for number, caption in enumerate(captions, start = 1):
+        await VideoEntryFactory.create(
+            db_session,
+            test_user,
+            platform = Platform.YOUTUBE,
+            video_number = number,
+            description = caption,
+        )
+    await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        platform = Platform.YOUTUBE,
+        video_number = 5,
+        description = "Has one",
+        youtube_description = "Kept",
+    )
+
+    first = await client.post(
+        URL_ADMIN_YOUTUBE_BACKFILL,
+        headers = admin_auth_headers,
+        params = {"limit": 3},
+    )
+    assert first.status_code == 200
+    assert first.json()["updated"] == 3
+    assert first.json()["next_cursor"]
+
+    second = await client.post(
+        URL_ADMIN_YOUTUBE_BACKFILL,
+        headers = admin_auth_headers,
+        params = {"limit": 1, "cursor": first.json()["next_cursor"]},
+    )
+    assert second.json() == {"updated": 1, "next_cursor": None}
+
+    items = await collect_pages(client, auth_headers, {"platform": "youtube"})
+    shortened = {e["video_number"]: e["youtube_description"] for e in items}
+    assert shortened[1] == "Short one"
+    assert shortened[2] == "word " * 18 + "word..."
+    assert shortened[3] == "a" * 95 + "..."
+    assert shortened[4] == "Road trip day, " + " ".join(["#roadtrip"] * 8) + "..."
+    assert shortened[5] == "Kept"
+
+
+@pytest.mark.asyncio
+async def test_copies_share_one_stored_description(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    auth_headers: dict[str, str],
+):
+    """
+    Platform copies point at the caption stored once and writes keep
+    its reference count in step
+    """
+    created = await client.post(
+        URL_VIDEOS,
+        headers = auth_headers,
+        json = {"platform": "tiktok", "description": "Shared caption"},
+    )
+    entry_id = created.json()["id"]
+
+    single = await client.post(
+        f"{url_video_by_id(entry_id)}/copy",
+        headers = auth_headers,
+        json = {"target_platform": "instagram"},
+    )
+    assert single.json()["description"] == "Shared caption"
+    bulk = await client.post(
+        f"{URL_VIDEOS}/copy",
+        headers = auth_headers,
+        json = {
+            "target_platform": "youtube",
+            "source_platform": "tiktok",
+            "shorten_for_youtube": False,
+        },
+    )
+    assert bulk.json()["copied"] == 1
+    assert await stored_descriptions(db_session) == {"Shared caption": 3}
+
+    await client.patch(
+        url_video_by_id(single.json()["id"]),
+        headers = auth_headers,
+        json = {"description": "Edited caption"},
+    )
+    await client.delete(url_video_by_id(entry_id), headers = auth_headers)
+    assert await stored_descriptions(db_session) == {
+        "Shared caption": 1,
+        "Edited caption": 1,
+    }
+
+    items = await collect_pages(client, auth_headers, {"platform": "youtube"})
+    assert [e["description"] for e in items] == ["Shared caption"]
+    await client.post(
+        f"{URL_VIDEOS}/batch/delete",
+        headers = auth_headers,
+        json = {"ids": [items[0]["id"]]},
+    )
+    assert await stored_descriptions(db_session) == {
+        "Shared caption": 0,
+        "Edited caption": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_same_caption_stored_per_user(
+    db_session: AsyncSession,
+    test_user: User,
+):
+    """
+    Two users with the same caption each hold their own stored text
+    """
+    other = await UserFactory.create(db_session)
+    for owner in (test_user, other):
+        await VideoEntryFactory.create(
+            db_session,
+            owner,
+            description = "Common caption",
+        )
+
+    result = await db_session.execute(
+        select(Description.user_id, Description.ref_count)
+    )
+    assert sorted(result.all()) == sorted([(test_user.id, 1), (other.id, 1)])
+
+
+@pytest.mark.asyncio
+async def test_admin_collect_descriptions(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    auth_headers: dict[str, str],
+    admin_user: User,
+    admin_auth_headers: dict[str, str],
+):
+    """
+    Collection deletes unreferenced texts, recount first catches texts
+    orphaned behind the counters
+    """
+    kept = await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        description = "Kept caption",
+    )
+    released = await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        video_number = 2,
+        description = "Released caption",
+    )
+    orphaned = await VideoEntryFactory.create(
+        db_session,
+        test_user,
+        video_number = 3,
+        description = "Orphaned caption",
+    )
+    await client.delete(url_video_by_id(str(released.id)), headers = auth_headers)
+    await db_session.execute(delete(VideoEntry).where(VideoEntry.id == orphaned.id))
+
+    response = await client.post(
+        URL_ADMIN_DESCRIPTIONS_COLLECT,
+        headers = admin_auth_headers,
+    )
+    assert response.status_code == 200
+    assert response.json() == {"recounted": 0, "deleted": 1}
+
+    response = await client.post(
+        URL_ADMIN_DESCRIPTIONS_COLLECT,
+        headers = admin_auth_headers,
+        params = {"recount": True},
+    )
+    assert response.json() == {"recounted": 1, "deleted": 1}
+    assert await stored_descriptions(db_session) == {"Kept caption": 1}
+
+    response = await client.get(
+        url_video_by_id(str(kept.id)),
+        headers = auth_headers,
+    )
+    assert response.json()["description"] == "Kept caption"
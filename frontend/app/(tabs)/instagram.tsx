@@ -7,14 +7,9 @@ export default function InstagramScreen() {
   const createVideo = useCreateVideo()
 
   const handleAddVideo = () => {
-    const nextNumber = videos.length > 0
-      ? Math.max(...videos.map(v => v.video_number)) + 1
-      : 1
-
     createVideo.mutate(
       {
         platform: 'instagram',
-        video_number: nextNumber,
         description: '',
       },
       {
@@ -15,16 +15,18 @@ import {
   VIDEO_ERROR_MESSAGES,
   VIDEO_SUCCESS_MESSAGES,
   VideoResponseError,
+  isValidVideoChangesResponse,
   isValidVideoEntry,
-  isValidVideoListResponse,
+  isValidVideoWriteResponse,
   type VideoEntry,
+  type VideoWriteResponse,
   type VideoCreateRequest,
   type VideoUpdateRequest,
   type VideoCopyRequest,
-  type VideoListResponse,
 } from '@/api/types'
 import { API_ENDPOINTS, QUERY_KEYS, type Platform } from '@/config'
 import { apiClient, QUERY_STRATEGIES } from '@/core/api'
+import { useAuthStore, useVideoStore } from '@/core/lib'
 
 export const videoQueries = {
   all: () => QUERY_KEYS.VIDEOS.ALL,
@@ -32,19 +34,48 @@ export const videoQueries = {
   byId: (id: string) => QUERY_KEYS.VIDEOS.BY_ID(id),
 } as const
 
-const fetchVideos = async (platform?: Platform): Promise<VideoEntry[]> => {
-  const params = platform ? { platform } : {}
-  const response = await apiClient.get<unknown>(API_ENDPOINTS.VIDEOS.BASE, { params })
-  const data: unknown = response.data
+const syncVideos = async (): Promise<Record<string, VideoEntry>> => {
+  const ownerId = useAuthStore.getState().user?.id ?? null
+  if (useVideoStore.getState().ownerId !== ownerId) {
+    useVideoStore.getState().resetFor(ownerId)
+  }
 
-  if (!isValidVideoListResponse(data)) {
-    throw new VideoResponseError(
-      VIDEO_ERROR_MESSAGES.INVALID_VIDEO_LIST_RESPONSE,
-      API_ENDPOINTS.VIDEOS.BASE
-    )
+  let hasMore = true
+  while (hasMore) {
+    const since = useVideoStore.getState().syncToken
+    const params = since ? { since } : {}
+    const response = await apiClient.get<unknown>(API_ENDPOINTS.VIDEOS.CHANGES, {
+      params,
+    })
+    const data: unknown = response.data
+
+    if (!isValidVideoChangesResponse(data)) {
+      throw new VideoResponseError(
+        VIDEO_ERROR_MESSAGES.INVALID_VIDEO_CHANGES_RESPONSE,
+        API_ENDPOINTS.VIDEOS.CHANGES
+      )
+    }
+
+    useVideoStore.getState().applyChanges(data)
+    hasMore = data.has_more
   }
 
-  return data.items
+  return useVideoStore.getState().entries
+}
+
+const fetchVideos = async (platform?: Platform): Promise<VideoEntry[]> => {
+  const entries = Object.values(await syncVideos())
+
+  if (platform) {
+    return entries
+      .filter((entry) => entry.platform === platform)
+      .sort((a, b) => a.video_number - b.video_number)
+  }
+  return entries.sort((a, b) =>
+    a.created_at === b.created_at
+      ? b.id.localeCompare(a.id)
+      : b.created_at.localeCompare(a.created_at)
+  )
 }
 
 export const useVideos = (
@@ -80,11 +111,24 @@ export const useVideo = (id: string): UseQueryResult<VideoEntry, Error> => {
   })
 }
 
-const performCreateVideo = async (data: VideoCreateRequest): Promise<VideoEntry> => {
+const warnDuplicates = (data: VideoWriteResponse): void => {
+  if (data.duplicates.length > 0) {
+    Alert.alert(
+      'Similar caption',
+      VIDEO_SUCCESS_MESSAGES.DUPLICATE_CAPTION(
+        data.duplicates.map((match) => match.entry.video_number)
+      )
+    )
+  }
+}
+
+const performCreateVideo = async (
+  data: VideoCreateRequest
+): Promise<VideoWriteResponse> => {
   const response = await apiClient.post<unknown>(API_ENDPOINTS.VIDEOS.BASE, data)
   const responseData: unknown = response.data
 
-  if (!isValidVideoEntry(responseData)) {
+  if (!isValidVideoWriteResponse(responseData)) {
     throw new VideoResponseError(
       VIDEO_ERROR_MESSAGES.INVALID_VIDEO_RESPONSE,
       API_ENDPOINTS.VIDEOS.BASE
@@ -95,7 +139,7 @@ const performCreateVideo = async (data: VideoCreateRequest): Promise<VideoEntry>
 }
 
 export const useCreateVideo = (): UseMutationResult<
-  VideoEntry,
+  VideoWriteResponse,
   Error,
   VideoCreateRequest
 > => {
@@ -105,6 +149,7 @@ export const useCreateVideo = (): UseMutationResult<
     mutationFn: performCreateVideo,
     onSuccess: (data): void => {
       queryClient.invalidateQueries({ queryKey: videoQueries.list(data.platform) })
+      warnDuplicates(data)
     },
     onError: (error: Error): void => {
       const message =
@@ -124,11 +169,11 @@ interface UpdateVideoParams {
 const performUpdateVideo = async ({
   id,
   data,
-}: UpdateVideoParams): Promise<VideoEntry> => {
+}: UpdateVideoParams): Promise<VideoWriteResponse> => {
   const response = await apiClient.patch<unknown>(API_ENDPOINTS.VIDEOS.BY_ID(id), data)
   const responseData: unknown = response.data
 
-  if (!isValidVideoEntry(responseData)) {
+  if (!isValidVideoWriteResponse(responseData)) {
     throw new VideoResponseError(
       VIDEO_ERROR_MESSAGES.INVALID_VIDEO_RESPONSE,
       API_ENDPOINTS.VIDEOS.BY_ID(id)
@@ -139,7 +184,7 @@ const performUpdateVideo = async ({
 }
 
 export const useUpdateVideo = (): UseMutationResult<
-  VideoEntry,
+  VideoWriteResponse,
   Error,
   UpdateVideoParams
 > => {
@@ -150,6 +195,7 @@ export const useUpdateVideo = (): UseMutationResult<
     onSuccess: (data): void => {
       queryClient.invalidateQueries({ queryKey: videoQueries.list(data.platform) })
       queryClient.invalidateQueries({ queryKey: videoQueries.byId(data.id) })
+      warnDuplicates(data)
     },
     onError: (error: Error): void => {
       const message =
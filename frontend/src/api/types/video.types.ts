@@ -17,9 +17,18 @@ export const videoEntrySchema = z.object({
   scheduled_time: z.string().nullable(),
 })
 
+export const videoEntryMatchSchema = z.object({
+  entry: videoEntrySchema,
+  score: z.number(),
+})
+
+export const videoWriteResponseSchema = videoEntrySchema.extend({
+  duplicates: z.array(videoEntryMatchSchema),
+})
+
 export const videoCreateRequestSchema = z.object({
   platform: z.nativeEnum(Platform),
-  video_number: z.number().min(1),
+  video_number: z.number().min(1).optional(),
   description: z.string().optional(),
   youtube_description: z.string().optional(),
   scheduled_time: z.string().datetime().optional(),
@@ -38,16 +47,29 @@ export const videoCopyRequestSchema = z.object({
 
 export const videoListResponseSchema = z.object({
   items: z.array(videoEntrySchema),
-  total: z.number(),
+  total: z.number().nullable(),
   page: z.number(),
   size: z.number(),
+  has_more: z.boolean(),
+  next_cursor: z.string().nullable(),
+})
+
+export const videoChangesResponseSchema = z.object({
+  upserted: z.array(videoEntrySchema),
+  deleted: z.array(z.string().uuid()),
+  next_token: z.string(),
+  has_more: z.boolean(),
+  reset: z.boolean(),
 })
 
 export type VideoEntry = z.infer<typeof videoEntrySchema>
+export type VideoEntryMatch = z.infer<typeof videoEntryMatchSchema>
+export type VideoWriteResponse = z.infer<typeof videoWriteResponseSchema>
 export type VideoCreateRequest = z.infer<typeof videoCreateRequestSchema>
 export type VideoUpdateRequest = z.infer<typeof videoUpdateRequestSchema>
 export type VideoCopyRequest = z.infer<typeof videoCopyRequestSchema>
 export type VideoListResponse = z.infer<typeof videoListResponseSchema>
+export type VideoChangesResponse = z.infer<typeof videoChangesResponseSchema>
 
 export const isValidVideoEntry = (data: unknown): data is VideoEntry => {
   if (data === null || data === undefined) return false
@@ -57,6 +79,16 @@ export const isValidVideoEntry = (data: unknown): data is VideoEntry => {
   return result.success
 }
 
+export const isValidVideoWriteResponse = (
+  data: unknown
+): data is VideoWriteResponse => {
+  if (data === null || data === undefined) return false
+  if (typeof data !== 'object') return false
+
+  const result = videoWriteResponseSchema.safeParse(data)
+  return result.success
+}
+
 export const isValidVideoListResponse = (
   data: unknown
 ): data is VideoListResponse => {
@@ -67,6 +99,16 @@ export const isValidVideoListResponse = (
   return result.success
 }
 
+export const isValidVideoChangesResponse = (
+  data: unknown
+): data is VideoChangesResponse => {
+  if (data === null || data === undefined) return false
+  if (typeof data !== 'object') return false
+
+  const result = videoChangesResponseSchema.safeParse(data)
+  return result.success
+}
+
 export class VideoResponseError extends Error {
   readonly endpoint?: string
 
@@ -81,6 +123,7 @@ export class VideoResponseError extends Error {
 export const VIDEO_ERROR_MESSAGES = {
   INVALID_VIDEO_RESPONSE: 'Invalid video data from server',
   INVALID_VIDEO_LIST_RESPONSE: 'Invalid video list from server',
+  INVALID_VIDEO_CHANGES_RESPONSE: 'Invalid video changes from server',
   VIDEO_NOT_FOUND: 'Video not found',
   FAILED_TO_CREATE: 'Failed to create video',
   FAILED_TO_UPDATE: 'Failed to update video',
@@ -93,4 +136,6 @@ export const VIDEO_SUCCESS_MESSAGES = {
   UPDATED: 'Video saved successfully',
   DELETED: 'Video deleted successfully',
   COPIED: (platform: string) => `Video copied to ${platform}`,
+  DUPLICATE_CAPTION: (numbers: number[]) =>
+    `This caption is almost the same as video ${numbers.map((n) => `#${n}`).join(', ')}`,
 } as const
@@ -27,6 +27,7 @@ export const API_ENDPOINTS = {
     BASE: `/${API_VERSION}/videos`,
     BY_ID: (id: string) => `/${API_VERSION}/videos/${id}`,
     COPY: (id: string) => `/${API_VERSION}/videos/${id}/copy`,
+    CHANGES: `/${API_VERSION}/videos/changes`,
   },
 } as const
 
@@ -50,6 +51,7 @@ export const QUERY_KEYS = {
 export const STORAGE_KEYS = {
   AUTH: 'auth-storage',
   DRAFT: 'draft-storage',
+  VIDEOS: 'video-storage',
 } as const
 
 export const QUERY_CONFIG = {
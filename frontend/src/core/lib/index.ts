@@ -5,3 +5,4 @@
 
 export { useAuthStore } from './auth.store'
 export { useDraftStore } from './draft.store'
+export { useVideoStore } from './video.store'
@@ -0,0 +1,47 @@
+/**
+ * AngelaMos | 2025
+ * video.store.ts
+ */
+
+import { create } from 'zustand'
+import { persist, createJSONStorage } from 'zustand/middleware'
+import AsyncStorage from '@react-native-async-storage/async-storage'
+import { STORAGE_KEYS } from '@/config'
+import type { VideoChangesResponse, VideoEntry } from '@/api/types'
+
+interface VideoSyncState {
+  ownerId: string | null
+  entries: Record<string, VideoEntry>
+  syncToken: string | null
+
+  applyChanges: (changes: VideoChangesResponse) => void
+  resetFor: (ownerId: string | null) => void
+}
+
+export const useVideoStore = create<VideoSyncState>()(
+  persist(
+    (set) => ({
+      ownerId: null,
+      entries: {},
+      syncToken: null,
+
+      applyChanges: (changes) =>
+        set((state) => {
+          const entries = changes.reset ? {} : { ...state.entries }
+          for (const entry of changes.upserted) {
+            entries[entry.id] = entry
+          }
+          for (const id of changes.deleted) {
+            delete entries[id]
+          }
+          return { entries, syncToken: changes.next_token }
+        }),
+
+      resetFor: (ownerId) => set({ ownerId, entries: {}, syncToken: null }),
+    }),
+    {
+      name: STORAGE_KEYS.VIDEOS,
+      storage: createJSONStorage(() => AsyncStorage),
+    }
+  )
+)